@@ -3,8 +3,9 @@ from __future__ import annotations
 
 import asyncio
 from collections import OrderedDict
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from datetime import timedelta
+import time
 from typing import Any, cast
 
 import jwt
@@ -15,7 +16,12 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.util import dt as dt_util
 
 from . import auth_store, jwt_wrapper, models
-from .const import ACCESS_TOKEN_EXPIRATION, GROUP_ID_ADMIN
+from .const import (
+    ACCESS_TOKEN_CACHE_SIZE,
+    ACCESS_TOKEN_CACHE_TTL,
+    ACCESS_TOKEN_EXPIRATION,
+    GROUP_ID_ADMIN,
+)
 from .mfa_modules import MultiFactorAuthModule, auth_mfa_module_from_config
 from .providers import AuthProvider, LoginFlow, auth_provider_from_config
 
@@ -158,6 +164,8 @@ class AuthManager:
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
         self._revoke_callbacks: dict[str, list[CALLBACK_TYPE]] = {}
+        # Access token -> (refresh token, timestamp until which it is trusted)
+        self._verified_access_tokens: dict[str, tuple[models.RefreshToken, float]] = {}
 
     @property
     def auth_providers(self) -> list[AuthProvider]:
@@ -310,6 +318,7 @@ class AuthManager:
             await asyncio.gather(*tasks)
 
         await self._store.async_remove_user(user)
+        self._async_forget_access_tokens(lambda token: token.user is user)
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
 
@@ -350,6 +359,7 @@ class AuthManager:
         if user.is_owner:
             raise ValueError("Unable to deactivate the owner")
         await self._store.async_deactivate_user(user)
+        self._async_forget_access_tokens(lambda token: token.user is user)
 
     async def async_remove_credentials(self, credentials: models.Credentials) -> None:
         """Remove credentials."""
@@ -473,6 +483,7 @@ class AuthManager:
     ) -> None:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
+        self._async_forget_access_tokens(lambda token: token.id == refresh_token.id)
 
         callbacks = self._revoke_callbacks.pop(refresh_token.id, [])
         for revoke_callback in callbacks:
@@ -554,6 +565,13 @@ class AuthManager:
         self, token: str
     ) -> models.RefreshToken | None:
         """Return refresh token if an access token is valid."""
+        now = time.time()
+        if (cached := self._verified_access_tokens.get(token)) is not None:
+            refresh_token, valid_until = cached
+            if now < valid_until:
+                return refresh_token if refresh_token.user.is_active else None
+            del self._verified_access_tokens[token]
+
         try:
             unverif_claims = jwt_wrapper.unverified_hs256_token_decode(token)
         except jwt.InvalidTokenError:
@@ -571,7 +589,7 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt_wrapper.verify_and_decode(
+            claims = jwt_wrapper.verify_and_decode(
                 token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
             )
         except jwt.InvalidTokenError:
@@ -580,8 +598,26 @@ class AuthManager:
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        if len(self._verified_access_tokens) >= ACCESS_TOKEN_CACHE_SIZE:
+            del self._verified_access_tokens[next(iter(self._verified_access_tokens))]
+        self._verified_access_tokens[token] = (
+            refresh_token,
+            min(now + ACCESS_TOKEN_CACHE_TTL.total_seconds(), claims["exp"]),
+        )
+
         return refresh_token
 
+    @callback
+    def _async_forget_access_tokens(
+        self, matcher: Callable[[models.RefreshToken], bool]
+    ) -> None:
+        """Remove verified access tokens from the cache."""
+        self._verified_access_tokens = {
+            token: cached
+            for token, cached in self._verified_access_tokens.items()
+            if not matcher(cached[0])
+        }
+
     @callback
     def _async_get_auth_provider(
         self, credentials: models.Credentials
@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections import OrderedDict
 from datetime import timedelta
+import hashlib
 import hmac
 from logging import getLogger
 from typing import Any
@@ -46,6 +47,10 @@ class AuthStore:
         self._users: dict[str, models.User] | None = None
         self._groups: dict[str, models.Group] | None = None
         self._perm_lookup: PermissionLookup | None = None
+        # Indexes over the refresh tokens of all users, kept in sync whenever a
+        # refresh token is added or removed.
+        self._refresh_tokens_by_id: dict[str, models.RefreshToken] = {}
+        self._refresh_tokens_by_hash: dict[bytes, models.RefreshToken] = {}
         self._store = Store[dict[str, list[dict[str, Any]]]](
             hass, STORAGE_VERSION, STORAGE_KEY, private=True, atomic_writes=True
         )
@@ -150,6 +155,8 @@ class AuthStore:
             assert self._users is not None
 
         self._users.pop(user.id)
+        for refresh_token in user.refresh_tokens.values():
+            self._async_unindex_refresh_token(refresh_token)
         self._async_schedule_save()
 
     async def async_update_user(
@@ -238,6 +245,7 @@ class AuthStore:
 
         refresh_token = models.RefreshToken(**kwargs)
         user.refresh_tokens[refresh_token.id] = refresh_token
+        self._async_index_refresh_token(refresh_token)
 
         self._async_schedule_save()
         return refresh_token
@@ -251,7 +259,8 @@ class AuthStore:
             assert self._users is not None
 
         for user in self._users.values():
-            if user.refresh_tokens.pop(refresh_token.id, None):
+            if removed := user.refresh_tokens.pop(refresh_token.id, None):
+                self._async_unindex_refresh_token(removed)
                 self._async_schedule_save()
                 break
 
@@ -263,12 +272,7 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            refresh_token = user.refresh_tokens.get(token_id)
-            if refresh_token is not None:
-                return refresh_token
-
-        return None
+        return self._refresh_tokens_by_id.get(token_id)
 
     async def async_get_refresh_token_by_token(
         self, token: str
@@ -278,14 +282,28 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        found = None
+        refresh_token = self._refresh_tokens_by_hash.get(_hash_token(token))
+        # The index is keyed by a digest, compare the actual tokens
+        # in constant time before handing it out.
+        if refresh_token is None or not hmac.compare_digest(refresh_token.token, token):
+            return None
 
-        for user in self._users.values():
-            for refresh_token in user.refresh_tokens.values():
-                if hmac.compare_digest(refresh_token.token, token):
-                    found = refresh_token
+        return refresh_token
 
-        return found
+    @callback
+    def _async_index_refresh_token(self, refresh_token: models.RefreshToken) -> None:
+        """Add a refresh token to the indexes."""
+        self._refresh_tokens_by_id[refresh_token.id] = refresh_token
+        self._refresh_tokens_by_hash[_hash_token(refresh_token.token)] = refresh_token
+
+    @callback
+    def _async_unindex_refresh_token(self, refresh_token: models.RefreshToken) -> None:
+        """Remove a refresh token from the indexes."""
+        if self._refresh_tokens_by_id.get(refresh_token.id) is refresh_token:
+            del self._refresh_tokens_by_id[refresh_token.id]
+        token_hash = _hash_token(refresh_token.token)
+        if self._refresh_tokens_by_hash.get(token_hash) is refresh_token:
+            del self._refresh_tokens_by_hash[token_hash]
 
     @callback
     def async_log_refresh_token_usage(
@@ -490,6 +508,7 @@ class AuthStore:
             if "credential_id" in rt_dict:
                 token.credential = credentials.get(rt_dict["credential_id"])
             users[rt_dict["user_id"]].refresh_tokens[token.id] = token
+            self._async_index_refresh_token(token)
 
         self._groups = groups
         self._users = users
@@ -594,6 +613,11 @@ class AuthStore:
         self._groups = groups
 
 
+def _hash_token(token: str) -> bytes:
+    """Return the digest a refresh token is indexed by."""
+    return hashlib.sha256(token.encode()).digest()
+
+
 def _system_admin_group() -> models.Group:
     """Create system admin group."""
     return models.Group(
@@ -4,6 +4,11 @@ from datetime import timedelta
 ACCESS_TOKEN_EXPIRATION = timedelta(minutes=30)
 MFA_SESSION_EXPIRATION = timedelta(minutes=5)
 
+# Verified access tokens are remembered for a short while to avoid
+# verifying the signature of the same token on every request.
+ACCESS_TOKEN_CACHE_SIZE = 256
+ACCESS_TOKEN_CACHE_TTL = timedelta(minutes=1)
+
 GROUP_ID_ADMIN = "system-admin"
 GROUP_ID_USER = "system-users"
 GROUP_ID_READ_ONLY = "system-read-only"
@@ -389,6 +389,9 @@ class PipelineRun:
     debug_recording_queue: Queue[str | bytes | None] | None = None
     """Queue to communicate with debug recording thread"""
 
+    _vad_processing_time: float = field(init=False, default=0.0)
+    """Seconds spent in voice activity detection during the current stage"""
+
     def __post_init__(self) -> None:
         """Set language for pipeline."""
         self.language = self.pipeline.language or self.hass.config.language
@@ -495,6 +498,8 @@ class PipelineRun:
         if self.debug_recording_queue is not None:
             self.debug_recording_queue.put_nowait(f"00_wake-{self.wake_word_engine}")
 
+        start = time.monotonic()
+        self._vad_processing_time = 0.0
         wake_word_settings = self.wake_word_settings or WakeWordSettings()
 
         wake_word_vad: VoiceActivityTimeout | None = None
@@ -560,7 +565,11 @@ class PipelineRun:
         self.process_event(
             PipelineEvent(
                 PipelineEventType.WAKE_WORD_END,
-                {"wake_word_output": wake_word_output},
+                {
+                    "wake_word_output": wake_word_output,
+                    "processing_time": time.monotonic() - start,
+                    "vad_processing_time": self._vad_processing_time,
+                },
             )
         )
 
@@ -594,7 +603,13 @@ class PipelineRun:
             if stt_audio_buffer is not None:
                 stt_audio_buffer.put(chunk)
 
-            if (wake_word_vad is not None) and (not wake_word_vad.process(chunk)):
+            if wake_word_vad is None:
+                continue
+
+            vad_start = time.monotonic()
+            is_active = wake_word_vad.process(chunk)
+            self._vad_processing_time += time.monotonic() - vad_start
+            if not is_active:
                 raise WakeWordTimeoutError(
                     code="wake-word-timeout", message="Wake word was not detected"
                 )
@@ -652,6 +667,8 @@ class PipelineRun:
             # New recording
             self.debug_recording_queue.put_nowait(f"01_stt-{engine}")
 
+        start = time.monotonic()
+        self._vad_processing_time = 0.0
         try:
             # Transcribe audio stream
             result = await self.stt_provider.async_process_audio_stream(
@@ -686,7 +703,9 @@ class PipelineRun:
                 {
                     "stt_output": {
                         "text": result.text,
-                    }
+                    },
+                    "processing_time": time.monotonic() - start,
+                    "vad_processing_time": self._vad_processing_time,
                 },
             )
         )
@@ -709,7 +728,10 @@ class PipelineRun:
                 self.debug_recording_queue.put_nowait(chunk)
 
             if stt_vad is not None:
-                if not stt_vad.process(chunk):
+                vad_start = time.monotonic()
+                is_active = stt_vad.process(chunk)
+                self._vad_processing_time += time.monotonic() - vad_start
+                if not is_active:
                     # Silence detected at the end of voice command
                     self.process_event(
                         PipelineEvent(
@@ -770,6 +792,7 @@ class PipelineRun:
             )
         )
 
+        start = time.monotonic()
         try:
             conversation_result = await conversation.async_converse(
                 hass=self.hass,
@@ -792,7 +815,10 @@ class PipelineRun:
         self.process_event(
             PipelineEvent(
                 PipelineEventType.INTENT_END,
-                {"intent_output": conversation_result.as_dict()},
+                {
+                    "intent_output": conversation_result.as_dict(),
+                    "processing_time": time.monotonic() - start,
+                },
             )
         )
 
@@ -852,6 +878,7 @@ class PipelineRun:
             )
         )
 
+        start = time.monotonic()
         try:
             # Synthesize audio and get URL
             tts_media_id = tts_generate_media_source_id(
@@ -882,7 +909,8 @@ class PipelineRun:
                     "tts_output": {
                         "media_id": tts_media_id,
                         **asdict(tts_media),
-                    }
+                    },
+                    "processing_time": time.monotonic() - start,
                 },
             )
         )
@@ -28,8 +28,10 @@ class RingBuffer:
         """Return the length of data stored in the buffer."""
         return self._length
 
-    def put(self, data: bytes) -> None:
+    def put(self, data: bytes | memoryview) -> None:
         """Put a chunk of data into the buffer, possibly wrapping around."""
+        # Slicing a memoryview does not copy the data
+        data = memoryview(data)
         data_len = len(data)
         new_pos = self._pos + data_len
         if new_pos >= self._maxlen:
@@ -53,5 +55,6 @@ class RingBuffer:
             # Single chunk
             return bytes(self._buffer[: self._length])
 
-        # Two chunks
-        return bytes(self._buffer[self._pos :] + self._buffer[: self._pos])
+        # Two chunks, joined without intermediate copies
+        view = memoryview(self._buffer)
+        return b"".join((view[self._pos :], view[: self._pos]))
@@ -49,7 +49,7 @@ class AudioBuffer:
         """Clear the buffer."""
         self._length = 0
 
-    def append(self, data: bytes) -> None:
+    def append(self, data: bytes | memoryview) -> None:
         """Append bytes to the buffer, increasing the internal length."""
         data_len = len(data)
         if (self._length + data_len) > len(self._buffer):
@@ -135,12 +135,14 @@ class VoiceCommandSegmenter:
     def process(self, samples: bytes) -> bool:
         """Process 16-bit 16Khz mono audio samples.
 
+        All complete chunks in the samples are processed in one pass.
         Returns False when command is done.
         """
+        process_chunk = self._process_chunk
         for chunk in chunk_samples(
             samples, self._bytes_per_chunk, self._leftover_chunk_buffer
         ):
-            if not self._process_chunk(chunk):
+            if not process_chunk(chunk):
                 self.reset()
                 return False
 
@@ -151,7 +153,7 @@ class VoiceCommandSegmenter:
         """Get partial chunk in the audio buffer."""
         return self._leftover_chunk_buffer.bytes()
 
-    def _process_chunk(self, chunk: bytes) -> bool:
+    def _process_chunk(self, chunk: bytes | memoryview) -> bool:
         """Process a single chunk of 16-bit 16Khz mono audio.
 
         Returns False when command is done.
@@ -234,17 +236,19 @@ class VoiceActivityTimeout:
     def process(self, samples: bytes) -> bool:
         """Process 16-bit 16Khz mono audio samples.
 
+        All complete chunks in the samples are processed in one pass.
         Returns False when timeout is reached.
         """
+        process_chunk = self._process_chunk
         for chunk in chunk_samples(
             samples, self._bytes_per_chunk, self._leftover_chunk_buffer
         ):
-            if not self._process_chunk(chunk):
+            if not process_chunk(chunk):
                 return False
 
         return True
 
-    def _process_chunk(self, chunk: bytes) -> bool:
+    def _process_chunk(self, chunk: bytes | memoryview) -> bool:
         """Process a single chunk of 16-bit 16Khz mono audio.
 
         Returns False when timeout is reached.
@@ -274,12 +278,16 @@ def chunk_samples(
     samples: bytes,
     bytes_per_chunk: int,
     leftover_chunk_buffer: AudioBuffer,
-) -> Iterable[bytes]:
-    """Yield fixed-sized chunks from samples, keeping leftover bytes from previous call(s)."""
+) -> Iterable[bytes | memoryview]:
+    """Yield fixed-sized chunks from samples, keeping leftover bytes from previous call(s).
 
+    Chunks which are entirely within samples are yielded as views of samples
+    without copying them.
+    """
+    view = memoryview(samples)
     if (len(leftover_chunk_buffer) + len(samples)) < bytes_per_chunk:
         # Extend leftover chunk, but not enough samples to complete it
-        leftover_chunk_buffer.append(samples)
+        leftover_chunk_buffer.append(view)
         return
 
     next_chunk_idx = 0
@@ -287,7 +295,7 @@ def chunk_samples(
     if leftover_chunk_buffer:
         # Add to leftover chunk from previous call(s).
         bytes_to_copy = bytes_per_chunk - len(leftover_chunk_buffer)
-        leftover_chunk_buffer.append(samples[:bytes_to_copy])
+        leftover_chunk_buffer.append(view[:bytes_to_copy])
         next_chunk_idx = bytes_to_copy
 
         # Process full chunk in buffer
@@ -296,9 +304,9 @@ def chunk_samples(
 
     while next_chunk_idx < len(samples) - bytes_per_chunk + 1:
         # Process full chunk
-        yield samples[next_chunk_idx : next_chunk_idx + bytes_per_chunk]
+        yield view[next_chunk_idx : next_chunk_idx + bytes_per_chunk]
         next_chunk_idx += bytes_per_chunk
 
     # Capture leftover chunks
-    if rest_samples := samples[next_chunk_idx:]:
+    if rest_samples := view[next_chunk_idx:]:
         leftover_chunk_buffer.append(rest_samples)
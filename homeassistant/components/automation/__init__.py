@@ -12,6 +12,10 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.blueprint import CONF_USE_BLUEPRINT
+from homeassistant.components.homeassistant.triggers.state import (
+    async_get_state_trigger_index,
+)
+from homeassistant.components.trace import async_remove_trace_runs
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -53,7 +57,7 @@ from homeassistant.exceptions import (
     ServiceNotFound,
     TemplateError,
 )
-from homeassistant.helpers import condition
+from homeassistant.helpers import condition, reference_index
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
@@ -79,6 +83,7 @@ from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_set,
     trace_append_element,
+    trace_cv,
     trace_get,
     trace_path,
 )
@@ -154,13 +159,9 @@ def _automations_with_x(
     if DOMAIN not in hass.data:
         return []
 
-    component: EntityComponent[BaseAutomationEntity] = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if referenced_id in getattr(automation_entity, property_name)
-    ]
+    return reference_index.async_get(hass).async_referencing(
+        DOMAIN, property_name, referenced_id
+    )
 
 
 def _x_in_automation(
@@ -220,13 +221,9 @@ def automations_with_blueprint(hass: HomeAssistant, blueprint_path: str) -> list
     if DOMAIN not in hass.data:
         return []
 
-    component: EntityComponent[BaseAutomationEntity] = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if automation_entity.referenced_blueprint == blueprint_path
-    ]
+    return reference_index.async_get(hass).async_referencing(
+        DOMAIN, "referenced_blueprint", blueprint_path
+    )
 
 
 @callback
@@ -307,6 +304,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     )
 
     websocket_api.async_register_command(hass, websocket_config)
+    websocket_api.async_register_command(hass, websocket_diagnostics)
 
     return True
 
@@ -343,6 +341,25 @@ class BaseAutomationEntity(ToggleEntity, ABC):
     def referenced_entities(self) -> set[str]:
         """Return a set of referenced entities."""
 
+    async def async_added_to_hass(self) -> None:
+        """Add the references of the automation to the reference index."""
+        await super().async_added_to_hass()
+        blueprint = self.referenced_blueprint
+        reference_index.async_get(self.hass).async_add(
+            self.entity_id,
+            {
+                "referenced_areas": self.referenced_areas,
+                "referenced_blueprint": [blueprint] if blueprint else [],
+                "referenced_devices": self.referenced_devices,
+                "referenced_entities": self.referenced_entities,
+            },
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Remove the references of the automation from the reference index."""
+        await super().async_will_remove_from_hass()
+        reference_index.async_get(self.hass).async_remove(self.entity_id)
+
     @abstractmethod
     async def async_trigger(
         self,
@@ -609,9 +626,6 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
                     automation_trace.set_error(err)
                     return
 
-            # Prepare tracing the automation
-            automation_trace.set_trace(trace_get())
-
             # Set trigger reason
             trigger_description = variables.get("trigger", {}).get("description")
             automation_trace.set_trigger_description(trigger_description)
@@ -621,8 +635,9 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
                 trigger_path = f"trigger/{variables['trigger']['idx']}"
             else:
                 trigger_path = "trigger"
-            trace_element = TraceElement(variables, trigger_path)
-            trace_append_element(trace_element)
+            if trace_cv.get() is not None:
+                trace_element = TraceElement(variables, trigger_path)
+                trace_append_element(trace_element)
 
             if (
                 not skip_condition
@@ -691,6 +706,7 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
         """Remove listeners when removing automation from Home Assistant."""
         await super().async_will_remove_from_hass()
         await self.async_disable()
+        async_remove_trace_runs(self.hass, DOMAIN, self.unique_id)
 
     async def _async_enable_automation(self, event: Event) -> None:
         """Start automation on startup."""
@@ -1095,3 +1111,22 @@ def websocket_config(
             "config": automation.raw_config,
         },
     )
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command({"type": "automation/diagnostics"})
+@callback
+def websocket_diagnostics(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Get automation diagnostics."""
+    connection.send_result(
+        msg["id"],
+        {
+            "state_trigger_index": async_get_state_trigger_index(
+                hass
+            ).async_diagnostics(),
+        },
+    )
@@ -6,9 +6,9 @@ from contextlib import contextmanager
 from typing import Any
 
 from homeassistant.components.trace import (
-    CONF_STORED_TRACES,
     ActionTrace,
-    async_store_trace,
+    async_finish_trace,
+    async_start_trace,
 )
 from homeassistant.core import Context, HomeAssistant
 from homeassistant.helpers.typing import ConfigType
@@ -57,7 +57,7 @@ def trace_automation(
 ) -> Generator[AutomationTrace, None, None]:
     """Trace action execution of automation with automation_id."""
     trace = AutomationTrace(automation_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    mode = async_start_trace(hass, trace, trace_config)
 
     try:
         yield trace
@@ -68,3 +68,4 @@ def trace_automation(
     finally:
         if automation_id:
             trace.finished()
+        async_finish_trace(hass, trace, trace_config, mode)
@@ -11,5 +11,6 @@ EXCLUDE_FROM_BACKUP = [
     "*.log.*",
     "*.log",
     "backups/*.tar",
+    "backups/chunks/*",
     "OZW_Log.txt",
 ]
@@ -2,14 +2,19 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterator
 from dataclasses import asdict, dataclass
 import hashlib
+import io
 import json
+import os
 from pathlib import Path
+import shutil
 import tarfile
 from tarfile import TarError
-from tempfile import TemporaryDirectory
+from tempfile import TemporaryDirectory, mkdtemp
 from typing import Any, Protocol, cast
+import zlib
 
 from securetar import SecureTarFile, atomic_contents_add
 
@@ -17,13 +22,18 @@ from homeassistant.const import __version__ as HAVERSION
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import integration_platform
-from homeassistant.helpers.json import save_json
+from homeassistant.helpers.json import json_bytes, save_json
 from homeassistant.util import dt as dt_util
-from homeassistant.util.json import json_loads_object
+from homeassistant.util.json import json_loads, json_loads_object
 
 from .const import DOMAIN, EXCLUDE_FROM_BACKUP, LOGGER
 
 BUF_SIZE = 2**20 * 4  # 4MB
+CHUNK_SIZE = 2**20  # 1MB
+CHUNKS_DIR = "chunks"
+# Manifest of the last incremental backup, used to skip hashing unchanged files
+CHUNK_INDEX_FILE = "index.json"
+MANIFEST_FILE = "./manifest.json"
 
 
 @dataclass(slots=True)
@@ -51,6 +61,23 @@ class BackupPlatformProtocol(Protocol):
         """Perform operations after a backup finishes."""
 
 
+class BackupSnapshotPlatformProtocol(BackupPlatformProtocol, Protocol):
+    """Define the format of backup platforms which can snapshot their files.
+
+    Snapshots are used by incremental backups instead of the pre and post
+    backup operations.
+    """
+
+    async def async_backup_snapshot(
+        self, hass: HomeAssistant, snapshot_dir: Path
+    ) -> dict[str, Path | None]:
+        """Write snapshots of files to snapshot_dir.
+
+        Return the replaced files, relative to the config directory, mapped to
+        their snapshot or None to leave them out of the backup.
+        """
+
+
 class BackupManager:
     """Backup manager for the Backup integration."""
 
@@ -59,6 +86,8 @@ class BackupManager:
         self.hass = hass
         self.backup_dir = Path(hass.config.path("backups"))
         self.backing_up = False
+        # Held while chunks are written or removed
+        self._chunks_lock = asyncio.Lock()
         self.backups: dict[str, Backup] = {}
         self.platforms: dict[str, BackupPlatformProtocol] = {}
         self.loaded_backups = False
@@ -153,21 +182,40 @@ class BackupManager:
         await self.hass.async_add_executor_job(backup.path.unlink, True)
         LOGGER.debug("Removed backup located at %s", backup.path)
         self.backups.pop(slug)
+        # A running incremental backup stores chunks before its manifest
+        async with self._chunks_lock:
+            await self.hass.async_add_executor_job(self._remove_unreferenced_chunks)
+
+    async def generate_backup(self, incremental: bool = False) -> Backup:
+        """Generate a backup.
 
-    async def generate_backup(self) -> Backup:
-        """Generate a backup."""
+        Incremental backups store the files of the config directory as
+        content addressed chunks shared by all incremental backups, and only
+        write the chunks which changed since earlier backups.
+        """
         if self.backing_up:
             raise HomeAssistantError("Backup already in progress")
 
         if not self.loaded_platforms:
             await self.load_platforms()
 
+        snapshot_platforms: list[BackupSnapshotPlatformProtocol] = []
+        locking_platforms: list[BackupPlatformProtocol] = []
+        for platform in self.platforms.values():
+            if incremental and hasattr(platform, "async_backup_snapshot"):
+                snapshot_platforms.append(
+                    cast(BackupSnapshotPlatformProtocol, platform)
+                )
+            else:
+                locking_platforms.append(platform)
+        snapshot_dir: Path | None = None
+
         try:
             self.backing_up = True
             pre_backup_results = await asyncio.gather(
                 *(
                     platform.async_pre_backup(self.hass)
-                    for platform in self.platforms.values()
+                    for platform in locking_platforms
                 ),
                 return_exceptions=True,
             )
@@ -189,11 +237,26 @@ class BackupManager:
                 "compressed": True,
             }
             tar_file_path = Path(self.backup_dir, f"{backup_data['slug']}.tar")
-            size_in_bytes = await self.hass.async_add_executor_job(
-                self._mkdir_and_generate_backup_contents,
-                tar_file_path,
-                backup_data,
-            )
+            if incremental:
+                backup_data["incremental"] = True
+                snapshot_dir = await self.hass.async_add_executor_job(
+                    self._mkdir_snapshot_dir
+                )
+                snapshots = await self._async_snapshot(snapshot_platforms, snapshot_dir)
+                async with self._chunks_lock:
+                    size_in_bytes = await self.hass.async_add_executor_job(
+                        self._generate_incremental_backup_contents,
+                        tar_file_path,
+                        backup_data,
+                        snapshot_dir,
+                        snapshots,
+                    )
+            else:
+                size_in_bytes = await self.hass.async_add_executor_job(
+                    self._mkdir_and_generate_backup_contents,
+                    tar_file_path,
+                    backup_data,
+                )
             backup = Backup(
                 slug=slug,
                 name=backup_name,
@@ -207,10 +270,14 @@ class BackupManager:
             return backup
         finally:
             self.backing_up = False
+            if snapshot_dir is not None:
+                await self.hass.async_add_executor_job(
+                    shutil.rmtree, snapshot_dir, True
+                )
             post_backup_results = await asyncio.gather(
                 *(
                     platform.async_post_backup(self.hass)
-                    for platform in self.platforms.values()
+                    for platform in locking_platforms
                 ),
                 return_exceptions=True,
             )
@@ -250,6 +317,178 @@ class BackupManager:
             tar_file.add(tmp_dir_path, arcname=".")
         return tar_file_path.stat().st_size
 
+    async def _async_snapshot(
+        self,
+        platforms: list[BackupSnapshotPlatformProtocol],
+        snapshot_dir: Path,
+    ) -> dict[str, Path | None]:
+        """Snapshot the files of platforms for an incremental backup."""
+        snapshot_results = await asyncio.gather(
+            *(
+                platform.async_backup_snapshot(self.hass, snapshot_dir)
+                for platform in platforms
+            ),
+            return_exceptions=True,
+        )
+        snapshots: dict[str, Path | None] = {}
+        for result in snapshot_results:
+            if isinstance(result, BaseException):
+                raise result
+            snapshots.update(result)
+        return snapshots
+
+    def _mkdir_snapshot_dir(self) -> Path:
+        """Create a directory for snapshots next to the backups."""
+        self.backup_dir.mkdir(exist_ok=True)
+        return Path(mkdtemp(prefix=".snapshot-", dir=self.backup_dir))
+
+    def _generate_incremental_backup_contents(
+        self,
+        tar_file_path: Path,
+        backup_data: dict[str, Any],
+        snapshot_dir: Path,
+        snapshots: dict[str, Path | None],
+    ) -> int:
+        """Store the changed chunks and the manifest and return the size.
+
+        Files are cut into fixed size chunks named by their hash, which works
+        well for the database where changes happen in place. Files which did
+        not change size and modification time since the last incremental
+        backup are not read again.
+        """
+        chunk_dir = self.backup_dir.joinpath(CHUNKS_DIR)
+        chunk_dir.mkdir(exist_ok=True)
+        index_path = chunk_dir.joinpath(CHUNK_INDEX_FILE)
+        try:
+            index = cast(dict[str, Any], json_loads(index_path.read_bytes()))
+        except (OSError, ValueError):
+            index = {}
+
+        files: dict[str, dict[str, Any]] = {}
+        stored_size = 0
+        config_dir = Path(self.hass.config.path())
+        for relative_path, path in _iter_backup_files(
+            config_dir, (snapshot_dir, chunk_dir)
+        ):
+            if relative_path in snapshots:
+                if (snapshot_path := snapshots[relative_path]) is None:
+                    continue
+                path = snapshot_path
+            try:
+                stat = path.stat()
+                if (
+                    (entry := index.get(relative_path))
+                    and entry["size"] == stat.st_size
+                    and entry["mtime_ns"] == stat.st_mtime_ns
+                    and all(
+                        _chunk_path(chunk_dir, chunk).exists()
+                        for chunk in entry["chunks"]
+                    )
+                ):
+                    files[relative_path] = entry
+                    continue
+                chunks, size = _store_chunks(chunk_dir, path)
+            except OSError as err:
+                if relative_path in snapshots:
+                    # The live file is left out in favor of the snapshot
+                    raise HomeAssistantError(
+                        f"Unable to back up snapshot of {relative_path}: {err}"
+                    ) from err
+                LOGGER.warning("Unable to back up %s: %s", path, err)
+                continue
+            stored_size += size
+            files[relative_path] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "mode": stat.st_mode & 0o7777,
+                "chunks": chunks,
+            }
+
+        manifest = {"chunk_size": CHUNK_SIZE, "files": files}
+        with tarfile.open(tar_file_path, "w:", bufsize=BUF_SIZE) as tar_file:
+            for name, data in (
+                ("./backup.json", backup_data),
+                (MANIFEST_FILE, manifest),
+            ):
+                content = json_bytes(data)
+                info = tarfile.TarInfo(name)
+                info.size = len(content)
+                tar_file.addfile(info, io.BytesIO(content))
+        save_json(index_path.as_posix(), files)
+        return tar_file_path.stat().st_size + stored_size
+
+    def _remove_unreferenced_chunks(self) -> None:
+        """Remove chunks no incremental backup refers to anymore."""
+        chunk_dir = self.backup_dir.joinpath(CHUNKS_DIR)
+        if not chunk_dir.is_dir():
+            return
+
+        referenced: set[str] = set()
+        for backup_path in self.backup_dir.glob("*.tar"):
+            try:
+                with tarfile.open(backup_path, "r:", bufsize=BUF_SIZE) as backup_file:
+                    if MANIFEST_FILE not in backup_file.getnames() or not (
+                        manifest_file := backup_file.extractfile(MANIFEST_FILE)
+                    ):
+                        continue
+                    manifest = json_loads_object(manifest_file.read())
+            except (OSError, TarError, json.JSONDecodeError) as err:
+                # Keep all chunks when we cannot tell which ones are in use
+                LOGGER.warning("Unable to read backup %s: %s", backup_path, err)
+                return
+            for entry in cast(dict[str, Any], manifest["files"]).values():
+                referenced.update(entry["chunks"])
+
+        removed = 0
+        for chunk_path in chunk_dir.glob("*/*"):
+            if chunk_path.name not in referenced:
+                chunk_path.unlink(missing_ok=True)
+                removed += 1
+        LOGGER.debug("Removed %s unreferenced backup chunks", removed)
+
+
+def _iter_backup_files(
+    origin_path: Path, skip_dirs: tuple[Path, ...], relative_path: str = ""
+) -> Iterator[tuple[str, Path]]:
+    """Yield the files to back up like they are added to a full backup."""
+    for item in origin_path.iterdir():
+        if any(item.match(exclude) for exclude in EXCLUDE_FROM_BACKUP):
+            continue
+        item_relative_path = f"{relative_path}{item.name}"
+        if item.is_dir():
+            if not item.is_symlink() and item not in skip_dirs:
+                yield from _iter_backup_files(item, skip_dirs, f"{item_relative_path}/")
+        elif item.is_file():
+            yield item_relative_path, item
+
+
+def _chunk_path(chunk_dir: Path, chunk: str) -> Path:
+    """Return the path of a chunk."""
+    return chunk_dir.joinpath(chunk[:2], chunk)
+
+
+def _store_chunks(chunk_dir: Path, path: Path) -> tuple[list[str], int]:
+    """Store the chunks of a file which are not stored yet.
+
+    Return the hashes of all chunks and the number of bytes written.
+    """
+    chunks: list[str] = []
+    stored_size = 0
+    with path.open("rb") as file:
+        while data := file.read(CHUNK_SIZE):
+            chunk = hashlib.sha256(data).hexdigest()
+            chunks.append(chunk)
+            chunk_path = _chunk_path(chunk_dir, chunk)
+            if chunk_path.exists():
+                continue
+            chunk_path.parent.mkdir(exist_ok=True)
+            compressed = zlib.compress(data, 1)
+            tmp_path = chunk_path.with_suffix(".tmp")
+            tmp_path.write_bytes(compressed)
+            os.replace(tmp_path, chunk_path)
+            stored_size += len(compressed)
+    return chunks, stored_size
+
 
 def _generate_slug(date: str, name: str) -> str:
     """Generate a backup slug."""
@@ -6,6 +6,7 @@ from collections import defaultdict
 from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass
 import functools
+import itertools
 import logging
 from pathlib import Path
 import re
@@ -17,11 +18,13 @@ from hassil.intents import (
     ResponseType,
     SlotList,
     TextSlotList,
+    TextSlotValue,
     WildcardSlotList,
 )
 from hassil.recognize import RecognizeResult, recognize_all
 from hassil.util import merge_dict
 from home_assistant_intents import get_domains_and_languages, get_intents
+from lru import LRU  # pylint: disable=no-name-in-module
 import yaml
 
 from homeassistant import core, setup
@@ -51,7 +54,14 @@ from .const import DEFAULT_EXPOSED_ATTRIBUTES, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 _DEFAULT_ERROR_TEXT = "Sorry, I couldn't understand that"
-_ENTITY_REGISTRY_UPDATE_FIELDS = ["aliases", "name", "original_name"]
+_ENTITY_REGISTRY_UPDATE_FIELDS = [
+    "aliases",
+    "area_id",
+    "device_id",
+    "name",
+    "original_name",
+]
+_RECOGNIZE_CACHE_SIZE = 128
 
 REGEX_TYPE = type(re.compile(""))
 TRIGGER_CALLBACK_TYPE = Callable[[str, RecognizeResult], Awaitable[str | None]]
@@ -131,6 +141,17 @@ class DefaultAgent(AbstractConversationAgent):
         self._config_intents: dict[str, Any] = {}
         self._slot_lists: dict[str, SlotList] | None = None
 
+        # Slot list values and area of each exposed entity. Entities are
+        # updated one at a time when they change and the slot lists are
+        # assembled from these on the next recognition.
+        self._entity_slot_values: dict[str, list[TextSlotValue]] = {}
+        self._entity_area_ids: dict[str, str | None] = {}
+        self._changed_entity_ids: set[str] = set()
+        self._rebuild_entity_slot_values = True
+
+        # (language, text) -> (intents, slot lists, result)
+        self._recognize_cache: LRU = LRU(_RECOGNIZE_CACHE_SIZE)
+
         # Sentences that will trigger a callback (skipping intent recognition)
         self._trigger_sentences: list[TriggerData] = []
         self._trigger_intents: Intents | None = None
@@ -159,6 +180,11 @@ class DefaultAgent(AbstractConversationAgent):
             self._async_handle_entity_registry_changed,
             run_immediately=True,
         )
+        self.hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED,
+            self._async_handle_device_registry_changed,
+            run_immediately=True,
+        )
         self.hass.bus.async_listen(
             core.EVENT_STATE_CHANGED,
             self._async_handle_state_changed,
@@ -188,12 +214,20 @@ class DefaultAgent(AbstractConversationAgent):
             return None
 
         slot_lists = self._make_slot_lists()
+        cache_key = (language, user_input.text)
+        if (cached := self._recognize_cache.get(cache_key)) is not None:
+            intents, cached_slot_lists, result = cached
+            # Recognition only depends on the text, intents and slot lists
+            if intents is lang_intents.intents and cached_slot_lists is slot_lists:
+                return result
+
         result = await self.hass.async_add_executor_job(
             self._recognize,
             user_input,
             lang_intents,
             slot_lists,
         )
+        self._recognize_cache[cache_key] = (lang_intents.intents, slot_lists, result)
 
         return result
 
@@ -531,78 +565,117 @@ class DefaultAgent(AbstractConversationAgent):
 
     @core.callback
     def _async_handle_entity_registry_changed(self, event: core.Event) -> None:
-        """Clear names list cache when an entity registry entry has changed."""
+        """Update the names of an entity when its registry entry has changed."""
         if event.data["action"] != "update" or not any(
             field in event.data["changes"] for field in _ENTITY_REGISTRY_UPDATE_FIELDS
         ):
             return
-        self._slot_lists = None
+        self._async_entity_changed(event.data["entity_id"])
+
+    @core.callback
+    def _async_handle_device_registry_changed(self, event: core.Event) -> None:
+        """Update the areas of the entities of a device moved to another area."""
+        if event.data["action"] != "update" or "area_id" not in event.data["changes"]:
+            return
+        for entity in er.async_entries_for_device(
+            er.async_get(self.hass), event.data["device_id"]
+        ):
+            self._async_entity_changed(entity.entity_id)
 
     @core.callback
     def _async_handle_state_changed(self, event: core.Event) -> None:
-        """Clear names list cache when a state is added or removed from the state machine."""
+        """Update the names of an entity added to or removed from the state machine."""
         if event.data.get("old_state") and event.data.get("new_state"):
             return
-        self._slot_lists = None
+        self._async_entity_changed(event.data["entity_id"])
 
     @core.callback
     def _async_exposed_entities_updated(self) -> None:
         """Handle updated preferences."""
+        self._rebuild_entity_slot_values = True
         self._slot_lists = None
 
-    def _make_slot_lists(self) -> dict[str, SlotList]:
-        """Create slot lists with areas and entity names/aliases."""
-        if self._slot_lists is not None:
-            return self._slot_lists
+    @core.callback
+    def _async_entity_changed(self, entity_id: str) -> None:
+        """Update the slot list values of an entity on the next recognition."""
+        self._changed_entity_ids.add(entity_id)
+        self._slot_lists = None
 
-        area_ids_with_entities: set[str] = set()
-        entity_registry = er.async_get(self.hass)
-        states = [
-            state
-            for state in self.hass.states.async_all()
-            if async_should_expose(self.hass, DOMAIN, state.entity_id)
-        ]
-        devices = dr.async_get(self.hass)
+    def _update_entity_slot_values(
+        self,
+        entity_id: str,
+        entity_registry: er.EntityRegistry,
+        devices: dr.DeviceRegistry,
+    ) -> None:
+        """Update the slot list values and area of an entity."""
+        if (state := self.hass.states.get(entity_id)) is None or (
+            not async_should_expose(self.hass, DOMAIN, entity_id)
+        ):
+            self._entity_slot_values.pop(entity_id, None)
+            self._entity_area_ids.pop(entity_id, None)
+            return
 
-        # Gather exposed entity names
-        entity_names = []
-        for state in states:
-            # Checked against "requires_context" and "excludes_context" in hassil
-            context = {"domain": state.domain}
-            if state.attributes:
-                # Include some attributes
-                for attr in DEFAULT_EXPOSED_ATTRIBUTES:
-                    if attr not in state.attributes:
-                        continue
-                    context[attr] = state.attributes[attr]
-
-            entity = entity_registry.async_get(state.entity_id)
-
-            if not entity:
-                # Default name
-                entity_names.append((state.name, state.name, context))
-                continue
+        # Checked against "requires_context" and "excludes_context" in hassil
+        context = {"domain": state.domain}
+        if state.attributes:
+            # Include some attributes
+            for attr in DEFAULT_EXPOSED_ATTRIBUTES:
+                if attr not in state.attributes:
+                    continue
+                context[attr] = state.attributes[attr]
 
+        entity_names = []
+        area_id: str | None = None
+        if entity := entity_registry.async_get(entity_id):
             if entity.aliases:
                 for alias in entity.aliases:
                     entity_names.append((alias, alias, context))
 
-            # Default name
-            entity_names.append((state.name, state.name, context))
-
             if entity.area_id:
                 # Expose area too
-                area_ids_with_entities.add(entity.area_id)
+                area_id = entity.area_id
             elif entity.device_id:
                 # Check device for area as well
                 device = devices.async_get(entity.device_id)
                 if (device is not None) and device.area_id:
-                    area_ids_with_entities.add(device.area_id)
+                    area_id = device.area_id
+
+        # Default name
+        entity_names.append((state.name, state.name, context))
+
+        self._entity_slot_values[entity_id] = [
+            TextSlotValue.from_tuple(entity_name, allow_template=False)
+            for entity_name in entity_names
+        ]
+        self._entity_area_ids[entity_id] = area_id
+
+    def _make_slot_lists(self) -> dict[str, SlotList]:
+        """Create slot lists with areas and entity names/aliases."""
+        if self._slot_lists is not None:
+            return self._slot_lists
+
+        entity_registry = er.async_get(self.hass)
+        devices = dr.async_get(self.hass)
+        changed_entity_ids: Iterable[str]
+        if self._rebuild_entity_slot_values:
+            self._entity_slot_values.clear()
+            self._entity_area_ids.clear()
+            changed_entity_ids = self.hass.states.async_entity_ids()
+            self._rebuild_entity_slot_values = False
+        else:
+            changed_entity_ids = self._changed_entity_ids
+        self._changed_entity_ids = set()
+
+        # Gather exposed entity names
+        for entity_id in changed_entity_ids:
+            self._update_entity_slot_values(entity_id, entity_registry, devices)
 
         # Gather areas from exposed entities
         areas = ar.async_get(self.hass)
         area_names = []
-        for area_id in area_ids_with_entities:
+        for area_id in set(self._entity_area_ids.values()):
+            if area_id is None:
+                continue
             area = areas.async_get_area(area_id)
             if area is None:
                 continue
@@ -613,11 +686,15 @@ class DefaultAgent(AbstractConversationAgent):
                     area_names.append((alias, area.id))
 
         _LOGGER.debug("Exposed areas: %s", area_names)
-        _LOGGER.debug("Exposed entities: %s", entity_names)
+        _LOGGER.debug("Exposed entities: %s", list(self._entity_slot_values))
 
         self._slot_lists = {
             "area": TextSlotList.from_tuples(area_names, allow_template=False),
-            "name": TextSlotList.from_tuples(entity_names, allow_template=False),
+            "name": TextSlotList(
+                values=list(
+                    itertools.chain.from_iterable(self._entity_slot_values.values())
+                )
+            ),
         }
 
         return self._slot_lists
@@ -7,12 +7,9 @@ from collections.abc import Callable, Iterable
 import contextlib
 from dataclasses import dataclass
 from datetime import timedelta
-from fnmatch import translate
-from functools import lru_cache
 from ipaddress import ip_address as make_ip_address
 import logging
 import os
-import re
 import threading
 from typing import TYPE_CHECKING, Any, Final, cast
 
@@ -58,6 +55,7 @@ from homeassistant.helpers.event import (
 from homeassistant.helpers.typing import ConfigType, EventType
 from homeassistant.loader import DHCPMatcher, async_get_dhcp
 from homeassistant.util.async_ import run_callback_threadsafe
+from homeassistant.util.globs import GlobSet
 from homeassistant.util.network import is_invalid, is_link_local, is_loopback
 
 from .const import DOMAIN
@@ -75,6 +73,12 @@ HOSTNAME: Final = "hostname"
 MAC_ADDRESS: Final = "macaddress"
 IP_ADDRESS: Final = "ip"
 REGISTERED_DEVICES: Final = "registered_devices"
+
+# Length of the OUI part of a MAC address without separators
+MAC_OUI_LENGTH = 6
+# Number of leading characters of a hostname pattern used to index matchers
+HOSTNAME_INDEX_KEY_LENGTH = 3
+_PATTERN_CHARS = frozenset("*?[")
 DHCP_REQUEST = 3
 SCAN_INTERVAL = timedelta(minutes=60)
 
@@ -120,6 +124,99 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return True
 
 
+def _pattern_index_key(pattern: str, length: int) -> str | None:
+    """Return the key a pattern is indexed by.
+
+    Patterns which are too short or have wildcards in their first characters
+    cannot be indexed.
+    """
+    key = pattern[:length]
+    if len(key) < length or not _PATTERN_CHARS.isdisjoint(key):
+        return None
+    return key
+
+
+class DHCPMatcherIndex:
+    """Index of the dhcp matchers of integrations.
+
+    Each matcher is put in the bucket it is most likely to match: the OUI of
+    its MAC address pattern, the first characters of its hostname pattern or,
+    for matchers which only match registered devices, its domain. Only the
+    matchers in the buckets of a client are checked, against the MAC address
+    and hostname patterns which matched the client in one go.
+    """
+
+    def __init__(self, integration_matchers: list[DHCPMatcher]) -> None:
+        """Initialize the index."""
+        self._oui: dict[str, list[DHCPMatcher]] = {}
+        self._hostname: dict[str, list[DHCPMatcher]] = {}
+        self._registered_devices: dict[str, list[DHCPMatcher]] = {}
+        self._other: list[DHCPMatcher] = []
+        for matcher in integration_matchers:
+            self._add(matcher)
+        self._mac_globs = GlobSet(
+            mac for matcher in integration_matchers if (mac := matcher.get(MAC_ADDRESS))
+        )
+        self._hostname_globs = GlobSet(
+            hostname
+            for matcher in integration_matchers
+            if (hostname := matcher.get(HOSTNAME))
+        )
+
+    def _add(self, matcher: DHCPMatcher) -> None:
+        """Put a matcher in its bucket."""
+        if (mac := matcher.get(MAC_ADDRESS)) is not None and (
+            key := _pattern_index_key(mac, MAC_OUI_LENGTH)
+        ):
+            self._oui.setdefault(key, []).append(matcher)
+        elif (hostname := matcher.get(HOSTNAME)) is not None and (
+            key := _pattern_index_key(hostname, HOSTNAME_INDEX_KEY_LENGTH)
+        ):
+            self._hostname.setdefault(key, []).append(matcher)
+        elif matcher.get(REGISTERED_DEVICES):
+            self._registered_devices.setdefault(matcher["domain"], []).append(matcher)
+        else:
+            self._other.append(matcher)
+
+    def match(
+        self, uppercase_mac: str, lowercase_hostname: str, device_domains: set[str]
+    ) -> list[DHCPMatcher]:
+        """Return the matchers matching a client."""
+        candidates = [
+            *self._oui.get(uppercase_mac[:MAC_OUI_LENGTH], ()),
+            *self._hostname.get(lowercase_hostname[:HOSTNAME_INDEX_KEY_LENGTH], ()),
+            *self._other,
+        ]
+        for domain in device_domains:
+            candidates.extend(self._registered_devices.get(domain, ()))
+
+        matches: list[DHCPMatcher] = []
+        if not candidates:
+            return matches
+
+        matched_macs = self._mac_globs.matching(uppercase_mac)
+        matched_hostnames = self._hostname_globs.matching(lowercase_hostname)
+        for matcher in candidates:
+            if (
+                matcher.get(REGISTERED_DEVICES)
+                and matcher["domain"] not in device_domains
+            ):
+                continue
+
+            if (
+                matcher_mac := matcher.get(MAC_ADDRESS)
+            ) is not None and matcher_mac not in matched_macs:
+                continue
+
+            if (
+                matcher_hostname := matcher.get(HOSTNAME)
+            ) is not None and matcher_hostname not in matched_hostnames:
+                continue
+
+            matches.append(matcher)
+        return matches
+
+
 class WatcherBase(ABC):
     """Base class for dhcp and device tracker watching."""
 
@@ -133,7 +230,7 @@ class WatcherBase(ABC):
         super().__init__()
 
         self.hass = hass
-        self._integration_matchers = integration_matchers
+        self._matcher_index = DHCPMatcherIndex(integration_matchers)
         self._address_data = address_data
 
     @abstractmethod
@@ -203,26 +300,11 @@ class WatcherBase(ABC):
                 if entry := self.hass.config_entries.async_get_entry(entry_id):
                     device_domains.add(entry.domain)
 
-        for matcher in self._integration_matchers:
-            domain = matcher["domain"]
-
-            if matcher.get(REGISTERED_DEVICES) and domain not in device_domains:
-                continue
-
-            if (
-                matcher_mac := matcher.get(MAC_ADDRESS)
-            ) is not None and not _memorized_fnmatch(uppercase_mac, matcher_mac):
-                continue
-
-            if (
-                matcher_hostname := matcher.get(HOSTNAME)
-            ) is not None and not _memorized_fnmatch(
-                lowercase_hostname, matcher_hostname
-            ):
-                continue
-
+        for matcher in self._matcher_index.match(
+            uppercase_mac, lowercase_hostname, device_domains
+        ):
             _LOGGER.debug("Matched %s against %s", data, matcher)
-            matched_domains.add(domain)
+            matched_domains.add(matcher["domain"])
 
         for domain in matched_domains:
             discovery_flow.async_create_flow(
@@ -526,24 +608,3 @@ def _verify_working_pcap(cap_filter: str) -> None:
     )
 
     compile_filter(cap_filter)
-
-
-@lru_cache(maxsize=4096, typed=True)
-def _compile_fnmatch(pattern: str) -> re.Pattern:
-    """Compile a fnmatch pattern."""
-    return re.compile(translate(pattern))
-
-
-@lru_cache(maxsize=1024, typed=True)
-def _memorized_fnmatch(name: str, pattern: str) -> bool:
-    """Memorized version of fnmatch that has a larger lru_cache.
-
-    The default version of fnmatch only has a lru_cache of 256 entries.
-    With many devices we quickly reach that limit and end up compiling
-    the same pattern over and over again.
-
-    DHCP has its own memorized fnmatch with its own lru_cache
-    since the data is going to be relatively the same
-    since the devices will not change frequently
-    """
-    return bool(_compile_fnmatch(pattern).match(name))
@@ -0,0 +1,268 @@
+"""Batched energy queries with cached aggregates of past periods."""
+from __future__ import annotations
+
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any, Literal, cast
+
+from homeassistant.components import recorder
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util import dt as dt_util
+
+from .data import (
+    BatterySourceType,
+    EnergyPreferences,
+    GasSourceType,
+    GridSourceType,
+    SolarSourceType,
+    WaterSourceType,
+)
+
+SummaryPeriod = Literal["hour", "day", "week", "month"]
+
+# Number of aggregated periods kept in memory
+MAX_CACHED_PERIODS = 5000
+
+_HOUR = 3600.0
+
+
+def _statistic_ids_by_category(
+    prefs: EnergyPreferences, cost_sensors: dict[str, str]
+) -> dict[str, set[str]]:
+    """Return the configured statistic ids grouped by what they measure."""
+    categories: defaultdict[str, set[str]] = defaultdict(set)
+
+    def _add_cost(category: str, stat_cost: str | None, stat_energy: str) -> None:
+        if cost := stat_cost or cost_sensors.get(stat_energy):
+            categories[category].add(cost)
+
+    for source in prefs["energy_sources"]:
+        if source["type"] == "grid":
+            grid = cast(GridSourceType, source)
+            for flow_from in grid["flow_from"]:
+                stat_energy_from = flow_from["stat_energy_from"]
+                categories["grid_consumption"].add(stat_energy_from)
+                _add_cost("cost", flow_from["stat_cost"], stat_energy_from)
+            for flow_to in grid["flow_to"]:
+                stat_energy_to = flow_to["stat_energy_to"]
+                categories["grid_return"].add(stat_energy_to)
+                _add_cost("compensation", flow_to["stat_compensation"], stat_energy_to)
+        elif source["type"] == "solar":
+            categories["solar"].add(cast(SolarSourceType, source)["stat_energy_from"])
+        elif source["type"] == "battery":
+            battery = cast(BatterySourceType, source)
+            categories["battery_out"].add(battery["stat_energy_from"])
+            categories["battery_in"].add(battery["stat_energy_to"])
+        elif source["type"] in ("gas", "water"):
+            meter = cast(GasSourceType | WaterSourceType, source)
+            categories[source["type"]].add(meter["stat_energy_from"])
+            _add_cost("cost", meter["stat_cost"], meter["stat_energy_from"])
+
+    for device in prefs["device_consumption"]:
+        categories["devices"].add(device["stat_consumption"])
+
+    return categories
+
+
+def _period_start_end(period: SummaryPeriod) -> Callable[[float], tuple[float, float]]:
+    """Return a function which returns the start and end of a period."""
+    if period == "hour":
+        return lambda time: (time - time % _HOUR, time - time % _HOUR + _HOUR)
+    if period == "day":
+        return recorder.statistics.reduce_day_ts_factory()[1]
+    if period == "week":
+        return recorder.statistics.reduce_week_ts_factory()[1]
+    return recorder.statistics.reduce_month_ts_factory()[1]
+
+
+def _summarize(
+    hass: HomeAssistant,
+    start_ts: float,
+    end_ts: float,
+    categories: dict[str, set[str]],
+    co2_statistic_id: str | None,
+    start_end: Callable[[float], tuple[float, float]],
+) -> dict[float, dict[str, Any]]:
+    """Fetch the hourly changes of all statistics and sum them per period.
+
+    The fossil energy is calculated per hour from the grid consumption and the
+    CO2 signal, assuming 100% fossil if the signal is missing.
+    """
+    statistic_ids: set[str] = set().union(*categories.values())
+    if not statistic_ids:
+        return {}
+    statistics = recorder.statistics.statistics_during_period(
+        hass,
+        dt_util.utc_from_timestamp(start_ts),
+        dt_util.utc_from_timestamp(end_ts),
+        statistic_ids | {co2_statistic_id} if co2_statistic_id else statistic_ids,
+        "hour",
+        {"energy": UnitOfEnergy.KILO_WATT_HOUR},
+        {"change", "mean"},
+    )
+
+    # Period start -> statistic id -> summed change
+    changes: defaultdict[float, defaultdict[str, float]] = defaultdict(
+        lambda: defaultdict(float)
+    )
+    grid_changes: defaultdict[float, float] = defaultdict(float)
+    grid_consumption = categories.get("grid_consumption", set())
+    period_start = period_end = 0.0
+    for statistic_id, rows in statistics.items():
+        if statistic_id not in statistic_ids:
+            continue
+        is_grid = statistic_id in grid_consumption
+        for row in rows:
+            if (change := row.get("change")) is None:
+                continue
+            hour = row["start"]
+            if not period_start <= hour < period_end:
+                period_start, period_end = start_end(hour)
+            changes[period_start][statistic_id] += change
+            if is_grid:
+                grid_changes[hour] += change
+
+    fossil: defaultdict[float, float] = defaultdict(float)
+    if co2_statistic_id:
+        co2: dict[float, float | None] = {
+            row["start"]: row.get("mean")
+            for row in statistics.get(co2_statistic_id, [])
+        }
+        for hour, change in grid_changes.items():
+            if not period_start <= hour < period_end:
+                period_start, period_end = start_end(hour)
+            share = co2.get(hour)
+            fossil[period_start] += change * (100 if share is None else share) / 100
+
+    summary: dict[float, dict[str, Any]] = {}
+    for start, stats in changes.items():
+        summary[start] = {
+            "stats": dict(stats),
+            "totals": {
+                category: sum(stats.get(statistic_id, 0.0) for statistic_id in ids)
+                for category, ids in categories.items()
+            },
+            "fossil_energy": fossil.get(start, 0.0) if co2_statistic_id else None,
+        }
+    return summary
+
+
+class EnergySummaryCache:
+    """Answer energy summary queries, caching the periods which are complete.
+
+    Periods are complete when the hourly statistics of their last hour have
+    been compiled. Only periods not in the cache, in practice the current one
+    and periods without data, are fetched from the database. The cache is
+    dropped when the configured statistics change or when the recorder
+    imports, adjusts or clears any of them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._categories: dict[str, set[str]] = {}
+        self._periods: OrderedDict[
+            tuple[str, str, str | None, float], dict[str, Any]
+        ] = OrderedDict()
+        # Bumped when statistics change so fetches which raced are not cached
+        self._generation = 0
+
+    @callback
+    def async_statistics_changed(self, statistic_ids: list[str]) -> None:
+        """Drop the cached periods which depend on changed statistics."""
+        self._generation += 1
+        changed = set(statistic_ids)
+        if not changed.isdisjoint(set().union(*self._categories.values())):
+            self._periods.clear()
+            return
+        for key in [key for key in self._periods if key[2] in changed]:
+            del self._periods[key]
+
+    async def async_get_summary(
+        self,
+        hass: HomeAssistant,
+        prefs: EnergyPreferences,
+        cost_sensors: dict[str, str],
+        start_time: datetime,
+        end_time: datetime,
+        period: SummaryPeriod,
+        co2_statistic_id: str | None,
+    ) -> dict[str, dict[str, Any]]:
+        """Return the energy summary of each period between start and end."""
+        categories = _statistic_ids_by_category(prefs, cost_sensors)
+        if categories != self._categories:
+            self._periods.clear()
+            self._categories = categories
+
+        start_end = _period_start_end(period)
+        start_ts = start_time.timestamp()
+        end_ts = end_time.timestamp()
+        now = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+        complete_before = (now - timedelta(hours=1)).timestamp()
+        key_base = (period, str(dt_util.DEFAULT_TIME_ZONE), co2_statistic_id)
+
+        # Period start -> summary, periods without data are left out
+        summaries: dict[float, dict[str, Any]] = {}
+        cacheable: list[float] = []
+        fetch_start: float | None = None
+        fetch_end = start_ts
+        time = start_ts
+        while time < end_ts:
+            period_start, period_end = start_end(time)
+            time = period_end
+            key = (*key_base, period_start)
+            complete = (
+                period_start >= start_ts
+                and period_end <= end_ts
+                and period_end <= complete_before
+            )
+            if complete and key in self._periods:
+                self._periods.move_to_end(key)
+                summaries[period_start] = self._periods[key]
+                continue
+            if complete:
+                cacheable.append(period_start)
+            if fetch_start is None:
+                fetch_start = max(period_start, start_ts)
+            fetch_end = min(period_end, end_ts)
+
+        if fetch_start is not None:
+            generation = self._generation
+            fetched = await recorder.get_instance(hass).async_add_executor_job(
+                _summarize,
+                hass,
+                fetch_start,
+                fetch_end,
+                categories,
+                co2_statistic_id,
+                start_end,
+            )
+            summaries.update(fetched)
+            if generation != self._generation:
+                cacheable = []
+            # Periods without data are not cached as statistics may still be
+            # imported for them
+            for period_start in cacheable:
+                if (summary := fetched.get(period_start)) is not None:
+                    self._periods[(*key_base, period_start)] = summary
+            while len(self._periods) > MAX_CACHED_PERIODS:
+                self._periods.popitem(last=False)
+
+        return {
+            dt_util.utc_from_timestamp(period_start).isoformat(): summary
+            for period_start, summary in sorted(summaries.items())
+        }
+
+
+@singleton("energy_summary_cache")
+@callback
+def async_get_summary_cache(hass: HomeAssistant) -> EnergySummaryCache:
+    """Return the energy summary cache."""
+    cache = EnergySummaryCache()
+    async_dispatcher_connect(
+        hass, recorder.SIGNAL_STATISTICS_CHANGED, cache.async_statistics_changed
+    )
+    return cache
@@ -30,6 +30,7 @@ from .data import (
     EnergyPreferencesUpdate,
     async_get_manager,
 )
+from .summary import async_get_summary_cache
 from .types import EnergyPlatform, GetSolarForecastType
 from .validate import async_validate
 
@@ -52,6 +53,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_validate)
     websocket_api.async_register_command(hass, ws_solar_forecast)
     websocket_api.async_register_command(hass, ws_get_fossil_energy_consumption)
+    websocket_api.async_register_command(hass, ws_get_summary)
 
 
 @singleton("energy_platforms")
@@ -383,3 +385,49 @@ async def ws_get_fossil_energy_consumption(
 
     result = {period["start"]: period["delta"] for period in reduced_fossil_energy}
     connection.send_result(msg["id"], result)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "energy/summary",
+        vol.Required("start_time"): str,
+        vol.Required("end_time"): str,
+        vol.Required("period"): vol.Any("hour", "day", "week", "month"),
+        vol.Optional("co2_statistic_id"): str,
+    }
+)
+@_ws_with_manager
+async def ws_get_summary(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+    manager: EnergyManager,
+) -> None:
+    """Summarize the configured energy sources and devices per period.
+
+    All statistics are fetched at once, returning for each period the change
+    of every statistic, their totals per kind of source and the fossil energy
+    used when a CO2 signal statistic is given.
+    """
+    if start_time := dt_util.parse_datetime(msg["start_time"]):
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    if end_time := dt_util.parse_datetime(msg["end_time"]):
+        end_time = dt_util.as_utc(end_time)
+    else:
+        connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+        return
+
+    summary = await async_get_summary_cache(hass).async_get_summary(
+        hass,
+        manager.data or EnergyManager.default_preferences(),
+        hass.data[DOMAIN]["cost_sensors"],
+        start_time,
+        end_time,
+        msg["period"],
+        msg.get("co2_statistic_id"),
+    )
+    connection.send_result(msg["id"], summary)
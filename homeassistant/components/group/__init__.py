@@ -82,6 +82,7 @@ PLATFORMS = [
 ]
 
 REG_KEY = f"{DOMAIN}_registry"
+EXPANSION_CACHE_KEY = f"{DOMAIN}_expansion_cache"
 
 ENTITY_PREFIX = f"{DOMAIN}."
 
@@ -174,7 +175,42 @@ def expand_entity_ids(hass: HomeAssistant, entity_ids: Iterable[Any]) -> list[st
 
     Async friendly.
     """
-    found_ids: list[str] = []
+    cache: dict[str, _CachedExpansion] = hass.data.setdefault(EXPANSION_CACHE_KEY, {})
+    return list(_expand_entity_ids(hass, entity_ids, cache, set(), {})[0])
+
+
+# The expanded members of a group and the member attributes of all groups
+# the expansion went through
+_CachedExpansion = tuple[tuple[str, ...], dict[str, Any]]
+
+
+def _group_members(hass: HomeAssistant, entity_id: str) -> Any:
+    """Return the member attribute of a group, None if there is none."""
+    if (state := hass.states.get(entity_id)) is None:
+        return None
+    return state.attributes.get(ATTR_ENTITY_ID)
+
+
+def _expand_entity_ids(
+    hass: HomeAssistant,
+    entity_ids: Iterable[Any],
+    cache: dict[str, _CachedExpansion],
+    expanding: set[str],
+    seen_members: dict[str, Any],
+) -> tuple[dict[str, None], bool]:
+    """Expand entity ids, skipping groups which are already being expanded.
+
+    Returns the expanded entity ids and if the expansion is complete, that is
+    if it was not cut short by a group which contains itself through one of
+    its members. The member attributes of the expanded groups are added to
+    seen_members.
+
+    Expansions of groups are cached. Group entities keep the same member
+    object as long as their members do not change, so a cached expansion is
+    valid as long as the member attributes it went through are identical.
+    """
+    found_ids: dict[str, None] = {}
+    complete = True
     for entity_id in entity_ids:
         if not isinstance(entity_id, str) or entity_id in (
             ENTITY_MATCH_NONE,
@@ -184,20 +220,49 @@ def expand_entity_ids(hass: HomeAssistant, entity_ids: Iterable[Any]) -> list[st
 
         entity_id = entity_id.lower()
         # If entity_id points at a group, expand it
-        if entity_id.startswith(ENTITY_PREFIX):
-            child_entities = get_entity_ids(hass, entity_id)
-            if entity_id in child_entities:
-                child_entities = list(child_entities)
-                child_entities.remove(entity_id)
-            found_ids.extend(
-                ent_id
-                for ent_id in expand_entity_ids(hass, child_entities)
-                if ent_id not in found_ids
-            )
-        elif entity_id not in found_ids:
-            found_ids.append(entity_id)
+        if not entity_id.startswith(ENTITY_PREFIX):
+            found_ids[entity_id] = None
+            continue
 
-    return found_ids
+        if (cached := cache.get(entity_id)) is not None:
+            members, cached_members = cached
+            if all(
+                _group_members(hass, group_id) is group_members
+                for group_id, group_members in cached_members.items()
+            ):
+                found_ids.update(dict.fromkeys(members))
+                seen_members.update(cached_members)
+                continue
+            del cache[entity_id]
+
+        if entity_id in expanding:
+            _LOGGER.debug("Group %s contains itself", entity_id)
+            complete = False
+            continue
+
+        group_members = _group_members(hass, entity_id)
+        child_members = {entity_id: group_members}
+        expanding.add(entity_id)
+        child_ids, child_complete = _expand_entity_ids(
+            hass,
+            (
+                child_id
+                for child_id in group_members or ()
+                # A group directly containing itself does not cut its expansion
+                if child_id != entity_id
+            ),
+            cache,
+            expanding,
+            child_members,
+        )
+        expanding.discard(entity_id)
+        if child_complete:
+            cache[entity_id] = (tuple(child_ids), child_members)
+        complete = complete and child_complete
+        found_ids.update(child_ids)
+        seen_members.update(child_members)
+
+    return found_ids, complete
 
 
 @bind_hass
@@ -585,6 +650,9 @@ class Group(Entity):
         self._set_tracked(entity_ids)
         self._on_off: dict[str, bool] = {}
         self._assumed: dict[str, bool] = {}
+        # Number of True values in _on_off and _assumed
+        self._on_count = 0
+        self._assumed_count = 0
         self._on_states: set[str] = set()
         self.user_defined = user_defined
         self.mode = any
@@ -823,6 +891,8 @@ class Group(Entity):
         """Reset tracked state."""
         self._on_off = {}
         self._assumed = {}
+        self._on_count = 0
+        self._assumed_count = 0
         self._on_states = set()
 
         for entity_id in self.trackable:
@@ -835,7 +905,9 @@ class Group(Entity):
         domain = new_state.domain
         state = new_state.state
         registry: GroupIntegrationRegistry = self.hass.data[REG_KEY]
-        self._assumed[entity_id] = bool(new_state.attributes.get(ATTR_ASSUMED_STATE))
+        assumed = bool(new_state.attributes.get(ATTR_ASSUMED_STATE))
+        self._assumed_count += assumed - self._assumed.get(entity_id, False)
+        self._assumed[entity_id] = assumed
 
         if domain not in registry.on_states_by_domain:
             # Handle the group of a group case
@@ -843,12 +915,20 @@ class Group(Entity):
                 self._on_states.add(state)
             elif state in registry.off_on_mapping:
                 self._on_states.add(registry.off_on_mapping[state])
-            self._on_off[entity_id] = state in registry.on_off_mapping
+            is_on = state in registry.on_off_mapping
         else:
             entity_on_state = registry.on_states_by_domain[domain]
             if domain in registry.on_states_by_domain:
                 self._on_states.update(entity_on_state)
-            self._on_off[entity_id] = state in entity_on_state
+            is_on = state in entity_on_state
+        self._on_count += is_on - self._on_off.get(entity_id, False)
+        self._on_off[entity_id] = is_on
+
+    def _mode_matches(self, count: int, total: int) -> bool:
+        """Return if the mode matches count True values out of total."""
+        if self.mode is all:
+            return count == total
+        return count > 0
 
     @callback
     def _async_update_group_state(self, tr_state: State | None = None) -> None:
@@ -871,7 +951,9 @@ class Group(Entity):
             or self._assumed_state
             and not tr_state.attributes.get(ATTR_ASSUMED_STATE)
         ):
-            self._assumed_state = self.mode(self._assumed.values())
+            self._assumed_state = self._mode_matches(
+                self._assumed_count, len(self._assumed)
+            )
 
         elif tr_state.attributes.get(ATTR_ASSUMED_STATE):
             self._assumed_state = True
@@ -891,7 +973,7 @@ class Group(Entity):
         # on state, we use STATE_ON/STATE_OFF
         else:
             on_state = STATE_ON
-        group_is_on = self.mode(self._on_off.values())
+        group_is_on = self._mode_matches(self._on_count, len(self._on_off))
         if group_is_on:
             self._state = on_state
         else:
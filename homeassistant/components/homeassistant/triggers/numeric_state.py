@@ -1,5 +1,6 @@
 """Offer numeric state listening automation rules."""
 import logging
+from typing import Any
 
 import voluptuous as vol
 
@@ -20,12 +21,11 @@ from homeassistant.helpers import (
     entity_registry as er,
     template,
 )
-from homeassistant.helpers.event import (
-    async_track_same_state,
-    async_track_state_change_event,
-)
+from homeassistant.helpers.event import EventStateChangedData, async_track_same_state
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
-from homeassistant.helpers.typing import ConfigType
+from homeassistant.helpers.typing import ConfigType, EventType
+
+from .state import async_get_state_trigger_index
 
 
 def validate_above_below(value):
@@ -141,7 +141,9 @@ async def async_attach_trigger(
             )
 
     @callback
-    def state_automation_listener(event):
+    def state_automation_listener(
+        event: EventType[EventStateChangedData], _old_value: Any, _new_value: Any
+    ) -> None:
         """Listen for state changes and calls action."""
         entity_id = event.data.get("entity_id")
         from_s = event.data.get("old_state")
@@ -213,7 +215,11 @@ async def async_attach_trigger(
             else:
                 call_action()
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    # The numeric value is extracted by check_numeric_state, which also
+    # handles value templates, so the index can't narrow these down.
+    unsub = async_get_state_trigger_index(hass).async_add(
+        entity_ids, state_automation_listener
+    )
 
     @callback
     def async_remove():
@@ -1,8 +1,12 @@
 """Offer state listening automation rules."""
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
 from datetime import timedelta
 import logging
+import time
+from typing import Any
 
 import voluptuous as vol
 
@@ -31,6 +35,8 @@ CONF_TO = "to"
 CONF_NOT_FROM = "not_from"
 CONF_NOT_TO = "not_to"
 
+DATA_STATE_TRIGGER_INDEX = "state_trigger_index"
+
 BASE_SCHEMA = cv.TRIGGER_BASE_SCHEMA.extend(
     {
         vol.Required(CONF_PLATFORM): "state",
@@ -60,6 +66,212 @@ TRIGGER_ATTRIBUTE_SCHEMA = BASE_SCHEMA.extend(
 )
 
 
+StateTriggerListener = Callable[[EventType[EventStateChangedData], Any, Any], None]
+
+
+@dataclass(slots=True)
+class _IndexedListener:
+    """A trigger listener registered in the state trigger index."""
+
+    order: int
+    listener: StateTriggerListener
+
+
+@dataclass(slots=True)
+class _AttributeTriggers:
+    """Triggers of an entity watching the same attribute (or the state)."""
+
+    # Listeners that only fire for specific new values, keyed by that value
+    by_to_value: dict[Any, list[_IndexedListener]] = field(default_factory=dict)
+    # Listeners that have to look at every change
+    other: list[_IndexedListener] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        """Return the number of listeners."""
+        return len(self.other) + sum(len(lst) for lst in self.by_to_value.values())
+
+
+class StateTriggerIndex:
+    """Shared index of the state based triggers of all automations.
+
+    A single state change listener is registered per entity. Listeners are
+    grouped per entity by the attribute they watch, so the old and new values
+    are only looked up once per state change, and listeners that only fire for
+    specific new values are kept in a table keyed by that value. Only the
+    listeners that can possibly match a state change are called.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self._entities: dict[str, dict[str | None, _AttributeTriggers]] = {}
+        self._unsubs: dict[str, CALLBACK_TYPE] = {}
+        self._order = 0
+        self._state_changes = 0
+        self._dispatched = 0
+        self._match_time = 0.0
+        self._max_match_time = 0.0
+
+    @callback
+    def async_add(
+        self,
+        entity_ids: str | Iterable[str],
+        listener: StateTriggerListener,
+        attribute: str | None = None,
+        to_values: Iterable[Any] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Add a listener for state changes of entities.
+
+        The listener is called with the event and the old and new value of the
+        attribute, or the state if no attribute is given. If to_values is set,
+        the listener is only called when the new value is one of them.
+        """
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        self._order += 1
+        indexed = _IndexedListener(self._order, listener)
+        to_keys = set(to_values) if to_values is not None else None
+        registered: list[tuple[str, _AttributeTriggers]] = []
+
+        for entity_id in entity_ids:
+            if (attributes := self._entities.get(entity_id)) is None:
+                attributes = self._entities[entity_id] = {}
+                self._unsubs[entity_id] = async_track_state_change_event(
+                    self.hass, entity_id, self._async_state_changed
+                )
+            if (triggers := attributes.get(attribute)) is None:
+                triggers = attributes[attribute] = _AttributeTriggers()
+            if to_keys is None:
+                triggers.other.append(indexed)
+            else:
+                for key in to_keys:
+                    triggers.by_to_value.setdefault(key, []).append(indexed)
+            registered.append((entity_id, triggers))
+
+        @callback
+        def async_remove() -> None:
+            """Remove the listener from the index."""
+            for entity_id, triggers in registered:
+                if to_keys is None:
+                    triggers.other.remove(indexed)
+                else:
+                    for key in to_keys:
+                        listeners = triggers.by_to_value[key]
+                        listeners.remove(indexed)
+                        if not listeners:
+                            del triggers.by_to_value[key]
+                attributes = self._entities[entity_id]
+                if not triggers:
+                    del attributes[attribute]
+                if not attributes:
+                    del self._entities[entity_id]
+                    self._unsubs.pop(entity_id)()
+            registered.clear()
+
+        return async_remove
+
+    @callback
+    def _async_state_changed(self, event: EventType[EventStateChangedData]) -> None:
+        """Dispatch a state change to the matching listeners."""
+        if (attributes := self._entities.get(event.data["entity_id"])) is None:
+            return
+
+        start = time.perf_counter()
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+        matches: list[tuple[_IndexedListener, Any, Any]] = []
+
+        for attribute, triggers in attributes.items():
+            if attribute is None:
+                old_value = None if old_state is None else old_state.state
+                new_value = None if new_state is None else new_state.state
+            else:
+                old_value = (
+                    None if old_state is None else old_state.attributes.get(attribute)
+                )
+                new_value = (
+                    None if new_state is None else new_state.attributes.get(attribute)
+                )
+
+            try:
+                by_value = triggers.by_to_value.get(new_value)
+            except TypeError:
+                # Unhashable values can't match any of the indexed values
+                by_value = None
+            for indexed in triggers.other:
+                matches.append((indexed, old_value, new_value))
+            if by_value:
+                for indexed in by_value:
+                    matches.append((indexed, old_value, new_value))
+
+        if len(matches) > 1:
+            # Keep calling listeners in the order they were added
+            matches.sort(key=lambda match: match[0].order)
+
+        for indexed, old_value, new_value in matches:
+            try:
+                indexed.listener(event, old_value, new_value)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error while dispatching state change of %s to %s",
+                    event.data["entity_id"],
+                    indexed.listener,
+                )
+
+        match_time = time.perf_counter() - start
+        self._state_changes += 1
+        self._dispatched += len(matches)
+        self._match_time += match_time
+        self._max_match_time = max(self._max_match_time, match_time)
+
+    @callback
+    def async_diagnostics(self) -> dict[str, Any]:
+        """Return diagnostics of the index."""
+        listeners = indexed = 0
+        for attributes in self._entities.values():
+            for triggers in attributes.values():
+                listeners += len(triggers)
+                indexed += len(triggers) - len(triggers.other)
+        return {
+            "entities": len(self._entities),
+            "listeners": listeners,
+            "indexed_listeners": indexed,
+            "state_changes": self._state_changes,
+            "dispatched": self._dispatched,
+            "average_match_time": (
+                self._match_time / self._state_changes if self._state_changes else 0
+            ),
+            "max_match_time": self._max_match_time,
+        }
+
+
+@callback
+def async_get_state_trigger_index(hass: HomeAssistant) -> StateTriggerIndex:
+    """Return the shared state trigger index."""
+    if (index := hass.data.get(DATA_STATE_TRIGGER_INDEX)) is None:
+        index = hass.data[DATA_STATE_TRIGGER_INDEX] = StateTriggerIndex(hass)
+    return index
+
+
+def _indexable_to_values(config: ConfigType) -> list[Any] | None:
+    """Return the values a trigger fires for, if it can be indexed on them."""
+    if (to_state := config.get(CONF_TO)) is None or to_state == MATCH_ALL:
+        return None
+    # Mirror process_state_match, which compares strings and other
+    # scalars by equality and tests membership for lists.
+    if isinstance(to_state, str) or not hasattr(to_state, "__iter__"):
+        values = [to_state]
+    elif isinstance(to_state, list):
+        values = to_state
+    else:
+        return None
+    try:
+        set(values)
+    except TypeError:
+        return None
+    return values
+
+
 async def async_validate_trigger_config(
     hass: HomeAssistant, config: ConfigType
 ) -> ConfigType:
@@ -123,26 +335,14 @@ async def async_attach_trigger(
     _variables = trigger_info["variables"] or {}
 
     @callback
-    def state_automation_listener(event: EventType[EventStateChangedData]) -> None:
+    def state_automation_listener(
+        event: EventType[EventStateChangedData], old_value: Any, new_value: Any
+    ) -> None:
         """Listen for state changes and calls action."""
         entity = event.data["entity_id"]
         from_s = event.data["old_state"]
         to_s = event.data["new_state"]
 
-        if from_s is None:
-            old_value = None
-        elif attribute is None:
-            old_value = from_s.state
-        else:
-            old_value = from_s.attributes.get(attribute)
-
-        if to_s is None:
-            new_value = None
-        elif attribute is None:
-            new_value = to_s.state
-        else:
-            new_value = to_s.attributes.get(attribute)
-
         # When we listen for state changes with `match_all`, we
         # will trigger even if just an attribute changes. When
         # we listen to just an attribute, we should ignore all
@@ -224,7 +424,12 @@ async def async_attach_trigger(
             entity_ids=entity,
         )
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    unsub = async_get_state_trigger_index(hass).async_add(
+        entity_ids,
+        state_automation_listener,
+        attribute=attribute,
+        to_values=_indexable_to_values(config),
+    )
 
     @callback
     def async_remove():
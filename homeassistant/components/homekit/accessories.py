@@ -1,14 +1,17 @@
 """Extend the basic Accessory and Bridge functions."""
 from __future__ import annotations
 
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass
 import logging
 from typing import Any, cast
 from uuid import UUID
 
-from pyhap.accessory import Accessory, Bridge
+from pyhap.accessory import Accessory, Bridge, get_topic
 from pyhap.accessory_driver import AccessoryDriver
 from pyhap.characteristic import Characteristic
-from pyhap.const import CATEGORY_OTHER
+from pyhap.const import CATEGORY_OTHER, HAP_REPR_AID, HAP_REPR_IID, HAP_REPR_VALUE
 from pyhap.iid_manager import IIDManager
 from pyhap.service import Service
 from pyhap.util import callback as pyhap_callback
@@ -100,6 +103,10 @@ from .util import (
 )
 
 _LOGGER = logging.getLogger(__name__)
+
+# Seconds in which characteristic changes of an accessory are coalesced
+EVENT_COALESCE_WINDOW = 0.1
+
 SWITCH_TYPES = {
     TYPE_FAUCET: "Valve",
     TYPE_OUTLET: "Outlet",
@@ -613,8 +620,32 @@ class HomeBridge(Bridge):  # type: ignore[misc]
         return cast(bytes, await acc.async_get_snapshot(info))
 
 
+@dataclass(slots=True)
+class EventCounters:
+    """Number of characteristic change events of an accessory."""
+
+    pushed: int = 0
+    coalesced: int = 0
+
+
+def _running_in(loop: asyncio.AbstractEventLoop) -> bool:
+    """Return if the current thread runs the loop."""
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
 class HomeDriver(AccessoryDriver):  # type: ignore[misc]
-    """Adapter class for AccessoryDriver."""
+    """Adapter class for AccessoryDriver.
+
+    Characteristic changes are batched per bridge. Changes within a short
+    window are published together per accessory, which HAP-python sends to
+    each client as a single event message. Changes superseded within the
+    window are dropped, as are changes which end the window with the value
+    published last. A single notification of an unchanged value, which is
+    how accessories force clients to refresh it, is always published.
+    """
 
     def __init__(
         self,
@@ -632,6 +663,87 @@ class HomeDriver(AccessoryDriver):  # type: ignore[misc]
         self._bridge_name = bridge_name
         self._entry_title = entry_title
         self.iid_storage = iid_storage
+        self.event_counters: defaultdict[int, EventCounters] = defaultdict(
+            EventCounters
+        )
+        # aid -> iid -> event data and whether it superseded another change
+        self._pending_events: dict[int, dict[int, tuple[dict[str, Any], bool]]] = {}
+        self._published_values: dict[tuple[int, int], Any] = {}
+        self._event_timer: asyncio.TimerHandle | None = None
+
+    def publish(
+        self,
+        data: dict[str, Any],
+        sender_client_addr: tuple[str, int] | None = None,
+        immediate: bool = False,
+    ) -> None:
+        """Queue a characteristic change to publish it with the next batch.
+
+        Immediate events and changes made by a client are published right away.
+        """
+        if not _running_in(self.loop):
+            self.loop.call_soon_threadsafe(
+                self.publish, data, sender_client_addr, immediate
+            )
+            return
+
+        aid: int = data[HAP_REPR_AID]
+        iid: int = data[HAP_REPR_IID]
+        topic = get_topic(aid, iid)
+        if topic not in self.topics:
+            # Clients read the value when they subscribe
+            self._published_values.pop((aid, iid), None)
+            if (pending := self._pending_events.get(aid)) is not None:
+                pending.pop(iid, None)
+            return
+
+        counters = self.event_counters[aid]
+        if immediate or sender_client_addr:
+            pending = self._pending_events.get(aid, {})
+            if pending.pop(iid, None) is not None:
+                counters.coalesced += 1
+            self._published_values[(aid, iid)] = data[HAP_REPR_VALUE]
+            counters.pushed += 1
+            self.async_send_event(topic, data, sender_client_addr, immediate)
+            return
+
+        pending = self._pending_events.setdefault(aid, {})
+        if superseded := iid in pending:
+            counters.coalesced += 1
+        pending[iid] = (data, superseded)
+        if self._event_timer is None:
+            self._event_timer = self.loop.call_later(
+                EVENT_COALESCE_WINDOW, self._async_publish_pending_events
+            )
+
+    @ha_callback
+    def _async_publish_pending_events(self) -> None:
+        """Publish the queued characteristic changes, grouped by accessory."""
+        self._event_timer = None
+        pending_events, self._pending_events = self._pending_events, {}
+        for aid, pending in pending_events.items():
+            counters = self.event_counters[aid]
+            for iid, (data, superseded) in pending.items():
+                value = data[HAP_REPR_VALUE]
+                key = (aid, iid)
+                if (
+                    superseded
+                    and key in self._published_values
+                    and self._published_values[key] == value
+                ):
+                    counters.coalesced += 1
+                    continue
+                self._published_values[key] = value
+                counters.pushed += 1
+                self.async_send_event(get_topic(aid, iid), data, None, False)
+
+    async def async_stop(self) -> None:
+        """Drop the queued characteristic changes and stop the driver."""
+        if self._event_timer is not None:
+            self._event_timer.cancel()
+            self._event_timer = None
+        self._pending_events.clear()
+        await super().async_stop()
 
     @pyhap_callback  # type: ignore[misc]
     def pair(
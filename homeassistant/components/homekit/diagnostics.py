@@ -1,9 +1,9 @@
 """Diagnostics support for HomeKit."""
 from __future__ import annotations
 
+from dataclasses import asdict
 from typing import Any
 
-from pyhap.accessory_driver import AccessoryDriver
 from pyhap.state import State
 
 from homeassistant.components.diagnostics import async_redact_data
@@ -11,7 +11,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from . import HomeKit
-from .accessories import HomeAccessory, HomeBridge
+from .accessories import EventCounters, HomeAccessory, HomeBridge, HomeDriver
 from .const import DOMAIN, HOMEKIT
 
 TO_REDACT = {"access_token", "entity_picture"}
@@ -35,13 +35,19 @@ async def async_get_config_entry_diagnostics(
         data["iid_storage"] = homekit.iid_storage.allocations
     if not homekit.driver:  # not started yet or startup failed
         return data
-    driver: AccessoryDriver = homekit.driver
+    driver: HomeDriver = homekit.driver
     if driver.accessory:
         if isinstance(driver.accessory, HomeBridge):
             data["bridge"] = _get_bridge_diagnostics(hass, driver.accessory)
         else:
             data["accessory"] = _get_accessory_diagnostics(hass, driver.accessory)
     data.update(driver.get_accessories())
+    data["events"] = {
+        "pushed": sum(counters.pushed for counters in driver.event_counters.values()),
+        "coalesced": sum(
+            counters.coalesced for counters in driver.event_counters.values()
+        ),
+    }
     state: State = driver.state
     data.update(
         {
@@ -76,6 +82,9 @@ def _get_accessory_diagnostics(
         "category": accessory.category,
         "name": accessory.display_name,
         "entity_id": accessory.entity_id,
+        "events": asdict(
+            accessory.driver.event_counters.get(accessory.aid, EventCounters())
+        ),
     }
     if entity_state:
         data["entity_state"] = async_redact_data(entity_state, TO_REDACT)
@@ -1,17 +1,24 @@
 """Static file handling for HTTP component."""
 from __future__ import annotations
 
-from collections.abc import Mapping
+import asyncio
+from collections import OrderedDict
+from collections.abc import Mapping, MutableMapping
+from dataclasses import dataclass
+import mimetypes
+import os
 from pathlib import Path
 from typing import Final
+import zlib
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse, Request, StreamResponse
+from aiohttp.helpers import ETAG_ANY
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
 from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
 from aiohttp.web_urldispatcher import StaticResource
 from lru import LRU  # pylint: disable=no-name-in-module
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 
 from .const import KEY_HASS
 
@@ -21,6 +28,32 @@ CACHE_HEADERS: Final[Mapping[str, str]] = {
 }
 PATH_CACHE = LRU(512)
 
+# Total size of all variants of all assets kept in memory
+ASSET_CACHE_MAX_SIZE: Final = 32 * 1024 * 1024
+# Files larger than this are always streamed from disk
+ASSET_CACHE_MAX_FILE_SIZE: Final = 2 * 1024 * 1024
+# Seconds a cached asset is served before checking the files on disk again
+ASSET_REVALIDATE_INTERVAL: Final = 5.0
+# Number of paths remembered as not cacheable
+ASSET_CACHE_MAX_UNCACHED: Final = 512
+
+# Content types worth compressing when no pre-compressed file exists
+_COMPRESSIBLE_TYPES: Final = {
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "image/svg+xml",
+    "text/javascript",
+}
+_PRECOMPRESSED_SUFFIXES: Final = (("br", ".br"), ("gzip", ".gz"))
+# Headers we leave to FileResponse as the cache does not implement them
+_UNCACHED_REQUEST_HEADERS: Final = (
+    hdrs.RANGE,
+    hdrs.IF_MATCH,
+    hdrs.IF_UNMODIFIED_SINCE,
+    hdrs.IF_RANGE,
+)
+
 
 def _get_file_path(
     filename: str | Path, directory: Path, follow_symlinks: bool
@@ -36,6 +69,264 @@ def _get_file_path(
     raise FileNotFoundError
 
 
+# The mtime and size of an asset and of each pre-compressed file, None when
+# a file does not exist
+_Fingerprint = tuple[tuple[int, int] | None, ...]
+
+
+@dataclass(slots=True)
+class CachedAsset:
+    """An asset held in memory with all its encoded variants."""
+
+    mtime_ns: int
+    size: int
+    content_type: str
+    # Content encoding (None for the raw file) -> (body, etag)
+    variants: dict[str | None, tuple[bytes, str]]
+    fingerprint: _Fingerprint
+    # Loop time the files were last checked
+    checked: float = 0.0
+
+    @property
+    def cache_size(self) -> int:
+        """Return the number of bytes held by this asset."""
+        return sum(len(body) for body, _ in self.variants.values())
+
+
+@dataclass(slots=True)
+class UncachedAsset:
+    """A path whose asset is not held in memory, it's streamed from disk."""
+
+    fingerprint: _Fingerprint
+    # Loop time the files were last checked
+    checked: float = 0.0
+
+
+def _asset_fingerprint(filepath: Path) -> _Fingerprint:
+    """Return the mtime and size of an asset and its pre-compressed files."""
+    fingerprint: list[tuple[int, int] | None] = []
+    for path in (
+        filepath,
+        *(
+            filepath.with_name(filepath.name + suffix)
+            for _, suffix in _PRECOMPRESSED_SUFFIXES
+        ),
+    ):
+        try:
+            st = os.stat(path)
+        except OSError:
+            fingerprint.append(None)
+            continue
+        fingerprint.append((st.st_mtime_ns, st.st_size))
+    return tuple(fingerprint)
+
+
+def _load_asset(filepath: Path, max_file_size: int) -> CachedAsset | UncachedAsset:
+    """Read an asset and its compressed variants from disk.
+
+    Returns an UncachedAsset if the file is missing, too large, can't be read
+    or changed while reading.
+    """
+    fingerprint = _asset_fingerprint(filepath)
+    if (raw_fingerprint := fingerprint[0]) is None:
+        return UncachedAsset(fingerprint)
+    mtime_ns, size = raw_fingerprint
+    if size > max_file_size:
+        return UncachedAsset(fingerprint)
+    content_type = mimetypes.guess_type(str(filepath))[0] or "application/octet-stream"
+    try:
+        raw = filepath.read_bytes()
+    except OSError:
+        return UncachedAsset(fingerprint)
+    if len(raw) != size:
+        # The file changed while we were reading it
+        return UncachedAsset(fingerprint)
+    variants: dict[str | None, tuple[bytes, str]] = {
+        None: (raw, f"{mtime_ns:x}-{size:x}")
+    }
+    for (encoding, suffix), compressed_fingerprint in zip(
+        _PRECOMPRESSED_SUFFIXES, fingerprint[1:]
+    ):
+        if compressed_fingerprint is None:
+            continue
+        try:
+            body = filepath.with_name(filepath.name + suffix).read_bytes()
+        except OSError:
+            continue
+        compressed_mtime_ns, compressed_size = compressed_fingerprint
+        variants[encoding] = (body, f"{compressed_mtime_ns:x}-{compressed_size:x}")
+
+    if "gzip" not in variants and (
+        content_type.startswith("text/") or content_type in _COMPRESSIBLE_TYPES
+    ):
+        compressor = zlib.compressobj(9, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        body = compressor.compress(raw) + compressor.flush()
+        if len(body) < len(raw):
+            variants["gzip"] = (body, f"{mtime_ns:x}-{len(body):x}-gzip")
+
+    return CachedAsset(mtime_ns, size, content_type, variants, fingerprint)
+
+
+class StaticAssetCache:
+    """Keep small static assets in memory, bounded by total size.
+
+    Assets are keyed by path. Once the revalidate interval has passed since
+    the files of an asset were last checked, the next request compares the
+    mtime and size of the file and its pre-compressed files in the executor
+    and reloads the asset if any of them changed. Paths which can't be
+    cached, like files over the size limit, are remembered the same way so
+    they are not read again on every request. Concurrent requests for an
+    asset that is being loaded share the same job.
+    """
+
+    def __init__(
+        self,
+        max_size: int = ASSET_CACHE_MAX_SIZE,
+        max_file_size: int = ASSET_CACHE_MAX_FILE_SIZE,
+        revalidate_interval: float = ASSET_REVALIDATE_INTERVAL,
+    ) -> None:
+        """Initialize the asset cache."""
+        self.max_size = max_size
+        self.max_file_size = max_file_size
+        self.revalidate_interval = revalidate_interval
+        self.size = 0
+        self._assets: OrderedDict[Path, CachedAsset] = OrderedDict()
+        self._uncached: MutableMapping[Path, UncachedAsset] = LRU(
+            ASSET_CACHE_MAX_UNCACHED
+        )
+        self._loading: dict[Path, asyncio.Future[CachedAsset | None]] = {}
+
+    @callback
+    def async_clear(self) -> None:
+        """Drop all cached assets."""
+        self._assets.clear()
+        self._uncached.clear()
+        self.size = 0
+
+    async def async_get(
+        self, hass: HomeAssistant, filepath: Path
+    ) -> CachedAsset | None:
+        """Return the cached asset for a path, loading it if needed."""
+        now = hass.loop.time()
+        if (asset := self._assets.get(filepath)) is not None:
+            self._assets.move_to_end(filepath)
+            if now - asset.checked < self.revalidate_interval:
+                return asset
+            # Requests arriving during the check are served the cached asset
+            asset.checked = now
+            fingerprint = await hass.async_add_executor_job(
+                _asset_fingerprint, filepath
+            )
+            if fingerprint == asset.fingerprint:
+                return asset
+            if self._assets.get(filepath) is asset:
+                self._async_evict(filepath)
+        elif (uncached := self._uncached.get(filepath)) is not None:
+            if now - uncached.checked < self.revalidate_interval:
+                return None
+            uncached.checked = now
+            fingerprint = await hass.async_add_executor_job(
+                _asset_fingerprint, filepath
+            )
+            if fingerprint == uncached.fingerprint:
+                return None
+            if self._uncached.get(filepath) is uncached:
+                del self._uncached[filepath]
+
+        if (future := self._loading.get(filepath)) is not None:
+            return await future
+
+        future = self._loading[filepath] = hass.loop.create_future()
+        asset = None
+        try:
+            loaded = await hass.async_add_executor_job(
+                _load_asset, filepath, self.max_file_size
+            )
+            if isinstance(loaded, UncachedAsset) or loaded.cache_size > self.max_size:
+                self._uncached[filepath] = UncachedAsset(loaded.fingerprint, now)
+            else:
+                asset = loaded
+                asset.checked = now
+                self._async_evict(filepath)
+                self._assets[filepath] = asset
+                self.size += asset.cache_size
+                while self.size > self.max_size:
+                    self._async_evict(next(iter(self._assets)))
+        finally:
+            del self._loading[filepath]
+            future.set_result(asset)
+        return asset
+
+    @callback
+    def _async_evict(self, filepath: Path) -> None:
+        """Remove an asset from the cache."""
+        if (asset := self._assets.pop(filepath, None)) is not None:
+            self.size -= asset.cache_size
+
+
+ASSET_CACHE = StaticAssetCache()
+
+
+def _accepted_encodings(accept_encoding: str) -> dict[str, float]:
+    """Parse an Accept-Encoding header into content codings and their q-values."""
+    encodings: dict[str, float] = {}
+    for token in accept_encoding.split(","):
+        coding, *params = token.split(";")
+        if not (coding := coding.strip().lower()):
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        encodings[coding] = quality
+    return encodings
+
+
+def _asset_response(request: Request, asset: CachedAsset) -> Response:
+    """Create a response for a cached asset."""
+    accepted = _accepted_encodings(request.headers.get(hdrs.ACCEPT_ENCODING, ""))
+    encoding: str | None = None
+    for candidate in ("br", "gzip"):
+        if candidate in asset.variants and accepted.get(
+            candidate, accepted.get("*", 0.0)
+        ):
+            encoding = candidate
+            break
+    body, etag = asset.variants[encoding]
+
+    headers = {
+        **CACHE_HEADERS,
+        hdrs.CONTENT_TYPE: asset.content_type,
+        hdrs.ACCEPT_RANGES: "bytes",
+    }
+    if len(asset.variants) > 1:
+        headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+
+    last_modified = asset.mtime_ns / 1e9
+    if_none_match = request.if_none_match
+    if_modified_since = request.if_modified_since
+    if (
+        if_none_match is not None
+        and any(tag.value in (etag, ETAG_ANY) for tag in if_none_match)
+    ) or (
+        if_none_match is None
+        and if_modified_since is not None
+        and last_modified <= if_modified_since.timestamp()
+    ):
+        response = Response(status=304, headers=headers)
+    else:
+        if encoding:
+            headers[hdrs.CONTENT_ENCODING] = encoding
+        response = Response(body=body, headers=headers)
+    response.etag = etag  # type: ignore[assignment]
+    response.last_modified = last_modified  # type: ignore[assignment]
+    return response
+
+
 class CachingStaticResource(StaticResource):
     """Static Resource handler that will add cache headers."""
 
@@ -63,6 +354,10 @@ class CachingStaticResource(StaticResource):
             raise HTTPNotFound() from error
 
         if filepath:
+            if not any(
+                header in request.headers for header in _UNCACHED_REQUEST_HEADERS
+            ) and (asset := await ASSET_CACHE.async_get(hass, filepath)):
+                return _asset_response(request, asset)
             return FileResponse(
                 filepath,
                 chunk_size=self._chunk_size,
@@ -14,16 +14,17 @@ from typing import Any, cast
 from lru import LRU  # pylint: disable=no-name-in-module
 import voluptuous as vol
 
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
+from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE, Platform
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
 
-from .const import DOMAIN
+from .const import DOMAIN, LOOP_MONITOR
+from .loop_monitor import DEFAULT_SLOW_JOB_THRESHOLD, LoopMonitor
 
 SERVICE_START = "start"
 SERVICE_MEMORY = "memory"
@@ -35,6 +36,8 @@ SERVICE_DUMP_LOG_OBJECTS = "dump_log_objects"
 SERVICE_LRU_STATS = "lru_stats"
 SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
+SERVICE_START_LOOP_MONITOR = "start_loop_monitor"
+SERVICE_STOP_LOOP_MONITOR = "stop_loop_monitor"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -57,14 +60,19 @@ SERVICES = (
     SERVICE_LRU_STATS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_START_LOOP_MONITOR,
+    SERVICE_STOP_LOOP_MONITOR,
 )
 
+PLATFORMS = [Platform.SENSOR]
+
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 
 DEFAULT_MAX_OBJECTS = 5
 
 CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
+CONF_THRESHOLD = "threshold"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
 
@@ -78,6 +86,8 @@ async def async_setup_entry(  # noqa: C901
     """Set up Profiler from a config entry."""
     lock = asyncio.Lock()
     domain_data = hass.data[DOMAIN] = {}
+    loop_monitor = domain_data[LOOP_MONITOR] = LoopMonitor(hass)
+    loop_monitor.async_start()
 
     async def _async_run_profile(call: ServiceCall) -> None:
         async with lock:
@@ -348,19 +358,72 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_scheduled,
     )
 
+    @callback
+    def _async_start_loop_monitor(call: ServiceCall) -> None:
+        loop_monitor.async_start_job_timing(call.data[CONF_THRESHOLD])
+
+    @callback
+    def _async_stop_loop_monitor(call: ServiceCall) -> None:
+        loop_monitor.async_stop_job_timing()
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_LOOP_MONITOR,
+        _async_start_loop_monitor,
+        schema=vol.Schema(
+            {
+                vol.Optional(
+                    CONF_THRESHOLD, default=DEFAULT_SLOW_JOB_THRESHOLD
+                ): vol.All(vol.Coerce(float), vol.Range(min=0))
+            }
+        ),
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_LOOP_MONITOR,
+        _async_stop_loop_monitor,
+    )
+
+    websocket_api.async_register_command(hass, websocket_loop_monitor)
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
     for service in SERVICES:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    hass.data[DOMAIN][LOOP_MONITOR].async_stop()
     hass.data.pop(DOMAIN)
     return True
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/loop_monitor"})
+@callback
+def websocket_loop_monitor(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return event loop lag and job timing data."""
+    if DOMAIN not in hass.data:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Profiler is not loaded"
+        )
+        return
+    connection.send_result(msg["id"], hass.data[DOMAIN][LOOP_MONITOR].async_as_dict())
+
+
 async def _async_generate_profile(hass: HomeAssistant, call: ServiceCall):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
@@ -0,0 +1,263 @@
+"""Event loop lag and job timing for the profiler integration."""
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict, deque
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from functools import lru_cache, partial
+import threading
+import time
+from typing import Any
+
+from homeassistant.core import HassJob, HassJobType, HomeAssistant, callback
+
+# How often the lag of the event loop is sampled
+LAG_SAMPLE_INTERVAL = 1.0
+# Number of lag samples kept, one minute worth
+LAG_WINDOW = 60
+MAX_SLOW_JOBS = 50
+DEFAULT_SLOW_JOB_THRESHOLD = 0.1
+
+_CORE = "homeassistant"
+_OTHER = "other"
+
+
+@dataclass(slots=True)
+class SlowJob:
+    """A job which blocked the event loop for longer than the threshold."""
+
+    name: str
+    integration: str
+    duration: float
+    timestamp: float
+
+
+@dataclass(slots=True)
+class IntegrationTiming:
+    """Time spent running the jobs of an integration."""
+
+    loop_jobs: int = 0
+    loop_time: float = 0.0
+    executor_jobs: int = 0
+    executor_time: float = 0.0
+
+
+@lru_cache(maxsize=1024)
+def _integration_from_module(module: str | None) -> str:
+    """Return the integration a module belongs to."""
+    if module is None:
+        return _OTHER
+    parts = module.split(".", 3)
+    if parts[0] == "homeassistant":
+        if len(parts) > 2 and parts[1] == "components":
+            return parts[2]
+        return _CORE
+    if parts[0] == "custom_components" and len(parts) > 1:
+        return parts[1]
+    return _OTHER
+
+
+def _integration_from_target(target: Callable[..., Any]) -> str:
+    """Return the integration a job target belongs to."""
+    while isinstance(target, partial):
+        target = target.func
+    return _integration_from_module(getattr(target, "__module__", None))
+
+
+def _job_name(target: Callable[..., Any], name: str | None) -> str:
+    """Return a readable name of a job."""
+    if name:
+        return name
+    while isinstance(target, partial):
+        target = target.func
+    return getattr(target, "__qualname__", None) or repr(target)
+
+
+class LoopMonitor:
+    """Measure event loop lag and, when enabled, time jobs per integration.
+
+    Lag is sampled once a second by checking how late a scheduled timer
+    fires, which is cheap enough to run while the integration is loaded.
+    Job timing wraps the job runners of the Home Assistant instance and is
+    only active between async_start_job_timing and async_stop_job_timing.
+    Callback jobs are timed on the event loop and jobs longer than the
+    threshold are recorded. Executor jobs are timed with the CPU time of
+    the worker thread.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the loop monitor."""
+        self.hass = hass
+        self.lag_samples: deque[float] = deque(maxlen=LAG_WINDOW)
+        self.max_lag = 0.0
+        self.slow_job_threshold = DEFAULT_SLOW_JOB_THRESHOLD
+        self.slow_jobs: deque[SlowJob] = deque(maxlen=MAX_SLOW_JOBS)
+        self.slow_job_count = 0
+        self.integrations: defaultdict[str, IntegrationTiming] = defaultdict(
+            IntegrationTiming
+        )
+        self._executor_lock = threading.Lock()
+        self._sample_handle: asyncio.TimerHandle | None = None
+        self._expected: float = 0.0
+        self._job_timing = False
+
+    @property
+    def job_timing(self) -> bool:
+        """Return if jobs are being timed."""
+        return self._job_timing
+
+    @property
+    def recent_max_lag(self) -> float | None:
+        """Return the highest lag sampled in the last minute."""
+        return max(self.lag_samples) if self.lag_samples else None
+
+    @callback
+    def async_start(self) -> None:
+        """Start sampling the event loop lag."""
+        self._async_schedule_sample()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop sampling and timing jobs."""
+        if self._sample_handle is not None:
+            self._sample_handle.cancel()
+            self._sample_handle = None
+        self.async_stop_job_timing()
+
+    @callback
+    def _async_schedule_sample(self) -> None:
+        """Schedule the next lag sample."""
+        loop = self.hass.loop
+        self._expected = loop.time() + LAG_SAMPLE_INTERVAL
+        self._sample_handle = loop.call_at(self._expected, self._async_sample)
+
+    @callback
+    def _async_sample(self) -> None:
+        """Record how late the sample timer fired."""
+        lag = max(self.hass.loop.time() - self._expected, 0.0)
+        self.lag_samples.append(lag)
+        if lag > self.max_lag:
+            self.max_lag = lag
+        self._async_schedule_sample()
+
+    @callback
+    def async_start_job_timing(self, threshold: float) -> None:
+        """Start timing jobs, recording those longer than threshold seconds."""
+        self.slow_job_threshold = threshold
+        if self._job_timing:
+            return
+        self._job_timing = True
+        hass = self.hass
+        run_hass_job = hass.async_run_hass_job
+        add_hass_job = hass.async_add_hass_job
+        add_executor_job = hass.async_add_executor_job
+        record = self._async_record_loop_job
+
+        @callback
+        def _timed_run_hass_job(hassjob: HassJob[..., Any], *args: Any) -> Any:
+            if hassjob.job_type != HassJobType.Callback:
+                return run_hass_job(hassjob, *args)
+            start = time.perf_counter()
+            try:
+                return run_hass_job(hassjob, *args)
+            finally:
+                record(hassjob.target, hassjob.name, time.perf_counter() - start)
+
+        @callback
+        def _timed_add_hass_job(hassjob: HassJob[..., Any], *args: Any) -> Any:
+            if hassjob.job_type != HassJobType.Callback:
+                return add_hass_job(hassjob, *args)
+            hass.loop.call_soon(self._async_run_timed, hassjob, args)
+            return None
+
+        @callback
+        def _timed_add_executor_job(target: Callable[..., Any], *args: Any) -> Any:
+            return add_executor_job(self._run_timed_executor_job, target, args)
+
+        # Shadow the methods on the instance, deleting the attributes
+        # again restores the originals
+        hass.async_run_hass_job = _timed_run_hass_job  # type: ignore[method-assign]
+        hass.async_add_hass_job = _timed_add_hass_job  # type: ignore[method-assign]
+        hass.async_add_executor_job = (  # type: ignore[method-assign]
+            _timed_add_executor_job
+        )
+
+    @callback
+    def async_stop_job_timing(self) -> None:
+        """Stop timing jobs."""
+        if not self._job_timing:
+            return
+        self._job_timing = False
+        for name in (
+            "async_run_hass_job",
+            "async_add_hass_job",
+            "async_add_executor_job",
+        ):
+            self.hass.__dict__.pop(name, None)
+
+    @callback
+    def _async_run_timed(
+        self, hassjob: HassJob[..., Any], args: tuple[Any, ...]
+    ) -> None:
+        """Run a callback job scheduled with async_add_hass_job and time it."""
+        start = time.perf_counter()
+        try:
+            hassjob.target(*args)
+        finally:
+            self._async_record_loop_job(
+                hassjob.target, hassjob.name, time.perf_counter() - start
+            )
+
+    @callback
+    def _async_record_loop_job(
+        self, target: Callable[..., Any], name: str | None, duration: float
+    ) -> None:
+        """Record the time a job ran in the event loop."""
+        integration = _integration_from_target(target)
+        timing = self.integrations[integration]
+        timing.loop_jobs += 1
+        timing.loop_time += duration
+        if duration >= self.slow_job_threshold:
+            self.slow_job_count += 1
+            self.slow_jobs.append(
+                SlowJob(_job_name(target, name), integration, duration, time.time())
+            )
+
+    def _run_timed_executor_job(
+        self, target: Callable[..., Any], args: tuple[Any, ...]
+    ) -> Any:
+        """Run an executor job and record the CPU time it used."""
+        start = time.thread_time()
+        try:
+            return target(*args)
+        finally:
+            duration = time.thread_time() - start
+            integration = _integration_from_target(target)
+            with self._executor_lock:
+                timing = self.integrations[integration]
+                timing.executor_jobs += 1
+                timing.executor_time += duration
+
+    @callback
+    def async_as_dict(self) -> dict[str, Any]:
+        """Return the collected data."""
+        samples = self.lag_samples
+        with self._executor_lock:
+            integrations = {
+                integration: asdict(timing)
+                for integration, timing in self.integrations.items()
+            }
+        return {
+            "job_timing": self._job_timing,
+            "slow_job_threshold": self.slow_job_threshold,
+            "lag": {
+                "last": samples[-1] if samples else None,
+                "mean": sum(samples) / len(samples) if samples else None,
+                "recent_max": self.recent_max_lag,
+                "max": self.max_lag,
+            },
+            "slow_job_count": self.slow_job_count,
+            "slow_jobs": [asdict(slow_job) for slow_job in self.slow_jobs],
+            "integrations": integrations,
+        }
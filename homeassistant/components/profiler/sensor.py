@@ -0,0 +1,75 @@
+"""Sensors exposing the event loop monitor of the profiler."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, LOOP_MONITOR
+from .loop_monitor import LoopMonitor
+
+SCAN_INTERVAL = timedelta(seconds=30)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the platform from config_entry."""
+    loop_monitor: LoopMonitor = hass.data[DOMAIN][LOOP_MONITOR]
+    async_add_entities(
+        [EventLoopLagSensor(entry, loop_monitor), SlowJobsSensor(entry, loop_monitor)]
+    )
+
+
+class LoopMonitorSensor(SensorEntity):
+    """Base class of the loop monitor sensors."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_has_entity_name = True
+
+    def __init__(self, entry: ConfigEntry, loop_monitor: LoopMonitor) -> None:
+        """Initialize the sensor."""
+        self._loop_monitor = loop_monitor
+        self._attr_unique_id = f"{entry.entry_id}-{self.translation_key}"
+        self._attr_device_info = DeviceInfo(
+            name=entry.title,
+            identifiers={(DOMAIN, entry.entry_id)},
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+
+class EventLoopLagSensor(LoopMonitorSensor):
+    """Highest event loop lag sampled in the last minute."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 1
+    _attr_translation_key = "event_loop_lag"
+
+    async def async_update(self) -> None:
+        """Update the lag."""
+        lag = self._loop_monitor.recent_max_lag
+        self._attr_native_value = None if lag is None else lag * 1000
+
+
+class SlowJobsSensor(LoopMonitorSensor):
+    """Number of jobs which blocked the event loop for too long."""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_translation_key = "slow_jobs"
+
+    async def async_update(self) -> None:
+        """Update the count."""
+        self._attr_native_value = self._loop_monitor.slow_job_count
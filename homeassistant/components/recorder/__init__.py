@@ -31,6 +31,7 @@ from .const import (  # noqa: F401
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_EXCLUDE_ATTRIBUTES,
     INTEGRATION_PLATFORMS_LOAD_IN_RECORDER_THREAD,
+    SIGNAL_STATISTICS_CHANGED,
     SQLITE_URL_PREFIX,
     SupportedDialect,
 )
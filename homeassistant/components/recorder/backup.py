@@ -1,13 +1,18 @@
 """Backup platform for the Recorder integration."""
 from logging import getLogger
+from pathlib import Path
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 
-from .util import async_migration_in_progress, get_instance
+from .const import SupportedDialect
+from .util import async_migration_in_progress, dburl_to_path, get_instance
 
 _LOGGER = getLogger(__name__)
 
+# Files SQLite keeps next to the database, the snapshot replaces them
+_SQLITE_SUFFIXES = ("-journal", "-shm", "-wal")
+
 
 async def async_pre_backup(hass: HomeAssistant) -> None:
     """Perform operations before a backup starts."""
@@ -24,3 +29,31 @@ async def async_post_backup(hass: HomeAssistant) -> None:
     _LOGGER.info("Backup end notification, releasing write lock")
     if not instance.unlock_database():
         raise HomeAssistantError("Could not release database write lock")
+
+
+async def async_backup_snapshot(
+    hass: HomeAssistant, snapshot_dir: Path
+) -> dict[str, Path | None]:
+    """Snapshot the database for an incremental backup."""
+    instance = get_instance(hass)
+    if async_migration_in_progress(hass):
+        raise HomeAssistantError("Database migration in progress")
+    if instance.dialect_name != SupportedDialect.SQLITE:
+        return {}
+
+    # The path of sqlite:////config/home-assistant_v2.db starts with two slashes
+    db_path = Path(dburl_to_path(instance.db_url).removeprefix("/"))
+    try:
+        relative_path = db_path.relative_to(hass.config.config_dir).as_posix()
+    except ValueError:
+        # In memory or outside of the config directory, not part of backups
+        return {}
+
+    _LOGGER.info("Backup start notification, taking database snapshot")
+    snapshot_path = snapshot_dir / db_path.name
+    if not await instance.async_snapshot_database(snapshot_path.as_posix()):
+        return {}
+    return {
+        relative_path: snapshot_path,
+        **{f"{relative_path}{suffix}": None for suffix in _SQLITE_SUFFIXES},
+    }
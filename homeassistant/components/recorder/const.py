@@ -15,6 +15,8 @@ DOMAIN = "recorder"
 
 EVENT_RECORDER_5MIN_STATISTICS_GENERATED = "recorder_5min_statistics_generated"
 EVENT_RECORDER_HOURLY_STATISTICS_GENERATED = "recorder_hourly_statistics_generated"
+# Sent with the ids of statistics which were imported, adjusted or cleared
+SIGNAL_STATISTICS_CHANGED = "recorder_statistics_changed"
 
 CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 
@@ -99,6 +99,7 @@ from .tasks import (
     CommitTask,
     CompileMissingStatisticsTask,
     DatabaseLockTask,
+    DatabaseSnapshotTask,
     EntityIDMigrationTask,
     EntityIDPostMigrationTask,
     EventIdMigrationTask,
@@ -128,6 +129,7 @@ from .util import (
     move_away_broken_database,
     session_scope,
     setup_connection_for_dialect,
+    snapshot_db_sqlite,
     validate_or_move_away_sqlite_database,
     write_lock_db_sqlite,
 )
@@ -1008,6 +1010,18 @@ class Recorder(threading.Thread):
             self.backlog,
         )
 
+    def _snapshot_database(self, task: DatabaseSnapshotTask) -> None:
+        """Snapshot the database while no other writes happen."""
+        if task.cancelled:
+            return
+        self.hass.loop.call_soon_threadsafe(task.started.set)
+        try:
+            snapshot_db_sqlite(self, task.target)
+        except Exception as err:  # pylint: disable=broad-except
+            task.error = err
+        finally:
+            self.hass.loop.call_soon_threadsafe(task.done.set)
+
     def _process_one_event(self, event: Event) -> None:
         if not self.enabled:
             return
@@ -1319,6 +1333,35 @@ class Recorder(threading.Thread):
         self._database_lock_task = task
         return True
 
+    async def async_snapshot_database(self, target: str) -> bool:
+        """Write a consistent copy of the database to target.
+
+        The copy is made by the recorder thread with the SQLite online backup
+        API, so writes are only held up while it runs instead of for the whole
+        backup like with lock_database.
+
+        Returns False if the database is not SQLite. Raises TimeoutError if
+        the recorder does not get to the snapshot in time.
+        """
+        if self.dialect_name != SupportedDialect.SQLITE:
+            return False
+
+        task = DatabaseSnapshotTask(target, asyncio.Event(), asyncio.Event())
+        self.queue_task(task)
+        try:
+            async with asyncio.timeout(DB_LOCK_TIMEOUT):
+                await task.started.wait()
+        except asyncio.TimeoutError as err:
+            task.cancelled = True
+            raise TimeoutError(
+                f"Could not snapshot database within {DB_LOCK_TIMEOUT} seconds."
+            ) from err
+        # Copying a large database takes longer than the timeout
+        await task.done.wait()
+        if task.error is not None:
+            raise task.error
+        return True
+
     @callback
     def unlock_database(self) -> bool:
         """Unlock database.
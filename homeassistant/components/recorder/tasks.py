@@ -11,10 +11,11 @@ import threading
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import Event
+from homeassistant.helpers.dispatcher import dispatcher_send
 from homeassistant.helpers.typing import UndefinedType
 
 from . import entity_registry, purge, statistics
-from .const import DOMAIN
+from .const import DOMAIN, SIGNAL_STATISTICS_CHANGED
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
 from .util import periodic_db_cleanups, session_scope
@@ -64,6 +65,7 @@ class ClearStatisticsTask(RecorderTask):
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
         statistics.clear_statistics(instance, self.statistic_ids)
+        dispatcher_send(instance.hass, SIGNAL_STATISTICS_CHANGED, self.statistic_ids)
 
 
 @dataclass(slots=True)
@@ -193,6 +195,11 @@ class ImportStatisticsTask(RecorderTask):
         if statistics.import_statistics(
             instance, self.metadata, self.statistics, self.table
         ):
+            dispatcher_send(
+                instance.hass,
+                SIGNAL_STATISTICS_CHANGED,
+                [self.metadata["statistic_id"]],
+            )
             return
         # Schedule a new statistics task if this one didn't finish
         instance.queue_task(
@@ -218,6 +225,9 @@ class AdjustStatisticsTask(RecorderTask):
             self.sum_adjustment,
             self.adjustment_unit,
         ):
+            dispatcher_send(
+                instance.hass, SIGNAL_STATISTICS_CHANGED, [self.statistic_id]
+            )
             return
         # Schedule a new adjust statistics task if this one didn't finish
         instance.queue_task(
@@ -257,6 +267,21 @@ class DatabaseLockTask(RecorderTask):
         instance._lock_database(self)  # pylint: disable=[protected-access]
 
 
+@dataclass(slots=True)
+class DatabaseSnapshotTask(RecorderTask):
+    """An object to insert into the recorder queue to snapshot the database."""
+
+    target: str
+    started: asyncio.Event
+    done: asyncio.Event
+    error: Exception | None = None
+    cancelled: bool = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._snapshot_database(self)  # pylint: disable=[protected-access]
+
+
 @dataclass(slots=True)
 class StopTask(RecorderTask):
     """An object to insert into the recorder queue to stop the event handler."""
@@ -2,13 +2,14 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Generator, Iterable, Sequence
-from contextlib import contextmanager
+from contextlib import closing, contextmanager
 from datetime import date, datetime, timedelta
 import functools
 from functools import partial
 from itertools import islice
 import logging
 import os
+import sqlite3
 import time
 from typing import TYPE_CHECKING, Any, Concatenate, NoReturn, ParamSpec, TypeVar
 
@@ -699,6 +700,15 @@ def write_lock_db_sqlite(instance: Recorder) -> Generator[None, None, None]:
             connection.execute(text("END;"))
 
 
+def snapshot_db_sqlite(instance: Recorder, target: str) -> None:
+    """Copy the database to target with the SQLite online backup API."""
+    assert instance.engine is not None
+    with instance.engine.connect() as connection, closing(
+        sqlite3.connect(target)
+    ) as target_connection:
+        connection.connection.driver_connection.backup(target_connection)
+
+
 def async_migration_in_progress(hass: HomeAssistant) -> bool:
     """Determine if a migration is in progress.
 
@@ -11,6 +11,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.blueprint import CONF_USE_BLUEPRINT
+from homeassistant.components.trace import async_remove_trace_runs
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -37,7 +38,7 @@ from homeassistant.core import (
     SupportsResponse,
     callback,
 )
-from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import entity_registry as er, reference_index
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import make_entity_service_schema
 from homeassistant.helpers.entity import ToggleEntity
@@ -55,7 +56,7 @@ from homeassistant.helpers.script import (
     script_stack_cv,
 )
 from homeassistant.helpers.service import async_set_service_schema
-from homeassistant.helpers.trace import trace_get, trace_path
+from homeassistant.helpers.trace import trace_path
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 from homeassistant.util.dt import parse_datetime
@@ -95,13 +96,9 @@ def _scripts_with_x(
     if DOMAIN not in hass.data:
         return []
 
-    component: EntityComponent[BaseScriptEntity] = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if referenced_id in getattr(script_entity, property_name)
-    ]
+    return reference_index.async_get(hass).async_referencing(
+        DOMAIN, property_name, referenced_id
+    )
 
 
 def _x_in_script(hass: HomeAssistant, entity_id: str, property_name: str) -> list[str]:
@@ -159,13 +156,9 @@ def scripts_with_blueprint(hass: HomeAssistant, blueprint_path: str) -> list[str
     if DOMAIN not in hass.data:
         return []
 
-    component: EntityComponent[BaseScriptEntity] = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if script_entity.referenced_blueprint == blueprint_path
-    ]
+    return reference_index.async_get(hass).async_referencing(
+        DOMAIN, "referenced_blueprint", blueprint_path
+    )
 
 
 @callback
@@ -404,6 +397,25 @@ class BaseScriptEntity(ToggleEntity, ABC):
     def referenced_entities(self) -> set[str]:
         """Return a set of referenced entities."""
 
+    async def async_added_to_hass(self) -> None:
+        """Add the references of the script to the reference index."""
+        await super().async_added_to_hass()
+        blueprint = self.referenced_blueprint
+        reference_index.async_get(self.hass).async_add(
+            self.entity_id,
+            {
+                "referenced_areas": self.referenced_areas,
+                "referenced_blueprint": [blueprint] if blueprint else [],
+                "referenced_devices": self.referenced_devices,
+                "referenced_entities": self.referenced_entities,
+            },
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Remove the references of the script from the reference index."""
+        await super().async_will_remove_from_hass()
+        reference_index.async_get(self.hass).async_remove(self.entity_id)
+
 
 class UnavailableScriptEntity(BaseScriptEntity):
     """A non-functional script entity with its state set to unavailable.
@@ -586,15 +598,12 @@ class ScriptEntity(BaseScriptEntity, RestoreEntity):
             self._blueprint_inputs,
             context,
             self._trace_config,
-        ) as script_trace:
-            # Prepare tracing the execution of the script's sequence
-            script_trace.set_trace(trace_get())
-            with trace_path("sequence"):
-                this = None
-                if state := self.hass.states.get(self.entity_id):
-                    this = state.as_dict()
-                script_vars = {"this": this, **(variables or {})}
-                return await self.script.async_run(script_vars, context)
+        ), trace_path("sequence"):
+            this = None
+            if state := self.hass.states.get(self.entity_id):
+                this = state.as_dict()
+            script_vars = {"this": this, **(variables or {})}
+            return await self.script.async_run(script_vars, context)
 
     async def async_turn_off(self, **kwargs):
         """Stop running the script.
@@ -614,6 +623,7 @@ class ScriptEntity(BaseScriptEntity, RestoreEntity):
 
     async def async_added_to_hass(self) -> None:
         """Restore last triggered on startup and register service."""
+        await super().async_added_to_hass()
 
         unique_id = cast(str, self.unique_id)
         self.hass.services.async_register(
@@ -638,10 +648,12 @@ class ScriptEntity(BaseScriptEntity, RestoreEntity):
 
     async def async_will_remove_from_hass(self):
         """Stop script and remove service when it will be removed from HA."""
+        await super().async_will_remove_from_hass()
         await self.script.async_stop()
 
         # remove service
         self.hass.services.async_remove(DOMAIN, self.unique_id)
+        async_remove_trace_runs(self.hass, DOMAIN, self.unique_id)
 
 
 @websocket_api.websocket_command({"type": "script/config", "entity_id": str})
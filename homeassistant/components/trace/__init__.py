@@ -13,16 +13,26 @@ from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.storage import Store
+from homeassistant.helpers.trace import trace_disable, trace_get
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.limited_size_dict import LimitedSizeDict
 
 from . import websocket_api
 from .const import (
+    CONF_SAMPLE_INTERVAL,
     CONF_STORED_TRACES,
+    CONF_TRACE_MODE,
     DATA_TRACE,
+    DATA_TRACE_RUNS,
     DATA_TRACE_STORE,
     DATA_TRACES_RESTORED,
+    DEFAULT_SAMPLE_INTERVAL,
     DEFAULT_STORED_TRACES,
+    TRACE_MODE_ERRORS,
+    TRACE_MODE_FULL,
+    TRACE_MODE_OFF,
+    TRACE_MODE_SAMPLED,
+    TRACE_MODES,
 )
 from .models import ActionTrace, BaseTrace, RestoredTrace
 
@@ -34,7 +44,11 @@ STORAGE_KEY = "trace.saved_traces"
 STORAGE_VERSION = 1
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    vol.Optional(CONF_TRACE_MODE, default=TRACE_MODE_FULL): vol.In(TRACE_MODES),
+    vol.Optional(CONF_SAMPLE_INTERVAL, default=DEFAULT_SAMPLE_INTERVAL): vol.All(
+        vol.Coerce(int), vol.Range(min=1)
+    ),
 }
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -50,6 +64,7 @@ def _get_data(hass: HomeAssistant) -> TraceData:
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Initialize the trace integration."""
     hass.data[DATA_TRACE] = {}
+    hass.data[DATA_TRACE_RUNS] = {}
     websocket_api.async_setup(hass)
     store = Store[dict[str, list]](
         hass, STORAGE_VERSION, STORAGE_KEY, encoder=ExtendedJSONEncoder
@@ -151,6 +166,63 @@ def async_store_trace(
         traces[key][trace.run_id] = trace
 
 
+@callback
+def _async_get_trace_mode(
+    hass: HomeAssistant, key: str, trace_config: ConfigType
+) -> str:
+    """Return how the next run of a script or automation is traced.
+
+    Sampled runs resolve to full or off, the first run and then one in every
+    sample_interval runs is traced.
+    """
+    mode: str = trace_config[CONF_TRACE_MODE]
+    if mode != TRACE_MODE_SAMPLED:
+        return mode
+    runs: dict[str, int] = hass.data[DATA_TRACE_RUNS]
+    count = runs.get(key, 0)
+    runs[key] = count + 1
+    if count % trace_config[CONF_SAMPLE_INTERVAL]:
+        return TRACE_MODE_OFF
+    return TRACE_MODE_FULL
+
+
+@callback
+def async_remove_trace_runs(
+    hass: HomeAssistant, domain: str, item_id: str | None
+) -> None:
+    """Forget the sampled run count of a removed script or automation."""
+    hass.data[DATA_TRACE_RUNS].pop(f"{domain}.{item_id}", None)
+
+
+@callback
+def async_start_trace(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: ConfigType
+) -> str:
+    """Start tracing a run of a script or automation.
+
+    Returns the trace mode of the run, which should be passed to
+    async_finish_trace. Runs which are not traced don't record anything.
+    """
+    mode = _async_get_trace_mode(hass, trace.key, trace_config)
+    if mode == TRACE_MODE_OFF:
+        trace_disable()
+        return mode
+
+    trace.set_trace(trace_get())
+    if mode == TRACE_MODE_FULL:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    return mode
+
+
+@callback
+def async_finish_trace(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: ConfigType, mode: str
+) -> None:
+    """Finish tracing a run, storing the trace of failed runs in errors mode."""
+    if mode == TRACE_MODE_ERRORS and trace.has_error:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+
+
 def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> None:
     """Store a restored trace and move it to the end of the LimitedSizeDict."""
     key = trace.key
@@ -1,7 +1,17 @@
 """Shared constants for script and automation tracing and debugging."""
 
+CONF_SAMPLE_INTERVAL = "sample_interval"
 CONF_STORED_TRACES = "stored_traces"
+CONF_TRACE_MODE = "mode"
 DATA_TRACE = "trace"
+DATA_TRACE_RUNS = "trace_runs"
 DATA_TRACE_STORE = "trace_store"
 DATA_TRACES_RESTORED = "trace_traces_restored"
+DEFAULT_SAMPLE_INTERVAL = 10  # Trace one in every 10 runs when sampling
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+
+TRACE_MODE_ERRORS = "errors"
+TRACE_MODE_FULL = "full"
+TRACE_MODE_OFF = "off"
+TRACE_MODE_SAMPLED = "sampled"
+TRACE_MODES = [TRACE_MODE_FULL, TRACE_MODE_SAMPLED, TRACE_MODE_ERRORS, TRACE_MODE_OFF]
@@ -79,6 +79,11 @@ class ActionTrace(BaseTrace):
         """Set error."""
         self._error = ex
 
+    @property
+    def has_error(self) -> bool:
+        """Return if the run failed."""
+        return self._error is not None or self._script_execution == "error"
+
     def finished(self) -> None:
         """Set finish time."""
         self._timestamp_finish = dt_util.utcnow()
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
+from collections import OrderedDict
 from collections.abc import Mapping
 from datetime import datetime
 from functools import partial
@@ -37,7 +38,13 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import HassJob, HomeAssistant, ServiceCall, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    HassJob,
+    HomeAssistant,
+    ServiceCall,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_component import EntityComponent
@@ -101,6 +108,11 @@ _RE_VOICE_FILE = re.compile(
 )
 KEY_PATTERN = "{0}_{1}_{2}_{3}"
 
+# Total size of the voice data kept in memory
+MEM_CACHE_MAX_SIZE = 32 * 1024 * 1024
+# Size of the chunks cached files are streamed in
+STREAM_CHUNK_SIZE = 64 * 1024
+
 SCHEMA_SERVICE_CLEAR_CACHE = vol.Schema({})
 
 
@@ -411,7 +423,14 @@ class SpeechManager:
         self.cache_dir = cache_dir
         self.time_memory = time_memory
         self.file_cache: dict[str, str] = {}
-        self.mem_cache: dict[str, TTSCache] = {}
+        # Least recently used first
+        self.mem_cache: OrderedDict[str, TTSCache] = OrderedDict()
+        self.mem_cache_size = 0
+        self.mem_cache_max_size = MEM_CACHE_MAX_SIZE
+        self._mem_cache_expiry: dict[str, CALLBACK_TYPE] = {}
+        # Running engine requests and file loads, shared by concurrent requests
+        self._tts_tasks: dict[str, asyncio.Task[str]] = {}
+        self._file_loads: dict[str, asyncio.Task[None]] = {}
 
     async def async_init_cache(self) -> None:
         """Init config folder and load file cache."""
@@ -434,7 +453,8 @@ class SpeechManager:
 
     async def async_clear_cache(self) -> None:
         """Read file cache and delete files."""
-        self.mem_cache = {}
+        for cache_key in list(self.mem_cache):
+            self._async_remove_from_memcache(cache_key)
 
         def remove_files() -> None:
             """Remove files from filesystem."""
@@ -511,12 +531,12 @@ class SpeechManager:
         use_cache = cache if cache is not None else self.use_cache
 
         # Is speech already in memory
-        if cache_key in self.mem_cache:
-            filename = self.mem_cache[cache_key]["filename"]
-        # Is file store in file cache
+        if cached := self.mem_cache.get(cache_key):
+            self.mem_cache.move_to_end(cache_key)
+            filename = cached["filename"]
+        # Is file store in file cache, it is streamed from disk when requested
         elif use_cache and cache_key in self.file_cache:
             filename = self.file_cache[cache_key]
-            self.hass.async_create_task(self._async_file_to_mem(cache_key))
         # Load speech from engine into memory
         else:
             filename = await self._async_get_tts_audio(
@@ -547,19 +567,17 @@ class SpeechManager:
         use_cache = cache if cache is not None else self.use_cache
 
         # If we have the file, load it into memory if necessary
-        if cache_key not in self.mem_cache:
-            if use_cache and cache_key in self.file_cache:
-                await self._async_file_to_mem(cache_key)
-            else:
-                await self._async_get_tts_audio(
-                    engine_instance, cache_key, message, use_cache, language, options
-                )
+        if cache_key in self.mem_cache:
+            self.mem_cache.move_to_end(cache_key)
+        elif use_cache and cache_key in self.file_cache:
+            await self._async_file_to_mem(cache_key)
+        else:
+            await self._async_get_tts_audio(
+                engine_instance, cache_key, message, use_cache, language, options
+            )
 
-        extension = os.path.splitext(self.mem_cache[cache_key]["filename"])[1][1:]
-        cached = self.mem_cache[cache_key]
-        if pending := cached.get("pending"):
-            await pending
-            cached = self.mem_cache[cache_key]
+        cached = await self._async_get_from_memcache(cache_key)
+        extension = os.path.splitext(cached["filename"])[1][1:]
         return extension, cached["voice"]
 
     @callback
@@ -639,15 +657,21 @@ class SpeechManager:
 
             return filename
 
-        audio_task = self.hass.async_create_task(get_tts_data())
+        # Identical requests which arrive while the engine is still working on
+        # the first one share its result
+        if (audio_task := self._tts_tasks.get(cache_key)) is None:
+            audio_task = self._tts_tasks[cache_key] = self.hass.async_create_task(
+                get_tts_data()
+            )
+            audio_task.add_done_callback(lambda _: self._tts_tasks.pop(cache_key, None))
 
         if expected_extension is None:
-            return await audio_task
+            return await asyncio.shield(audio_task)
 
         def handle_error(_future: asyncio.Future) -> None:
             """Handle error."""
             if audio_task.exception():
-                self.mem_cache.pop(cache_key, None)
+                self._async_remove_from_memcache(cache_key)
 
         audio_task.add_done_callback(handle_error)
 
@@ -682,6 +706,20 @@ class SpeechManager:
     async def _async_file_to_mem(self, cache_key: str) -> None:
         """Load voice from file cache into memory.
 
+        Concurrent loads of the same file share one read.
+
+        This method is a coroutine.
+        """
+        if (load_task := self._file_loads.get(cache_key)) is None:
+            load_task = self._file_loads[cache_key] = self.hass.async_create_task(
+                self._async_load_file(cache_key)
+            )
+            load_task.add_done_callback(lambda _: self._file_loads.pop(cache_key, None))
+        await asyncio.shield(load_task)
+
+    async def _async_load_file(self, cache_key: str) -> None:
+        """Read a voice file and store it in memory.
+
         This method is a coroutine.
         """
         if not (filename := self.file_cache.get(cache_key)):
@@ -697,7 +735,7 @@ class SpeechManager:
         try:
             data = await self.hass.async_add_executor_job(load_speech)
         except OSError as err:
-            del self.file_cache[cache_key]
+            self.file_cache.pop(cache_key, None)
             raise HomeAssistantError(f"Can't read {voice_file}") from err
 
         self._async_store_to_memcache(cache_key, filename, data)
@@ -706,19 +744,36 @@ class SpeechManager:
     def _async_store_to_memcache(
         self, cache_key: str, filename: str, data: bytes
     ) -> None:
-        """Store data to memcache and set timer to remove it."""
+        """Store data to memcache and set timer to remove it.
+
+        The least recently used voices are dropped once the memcache holds
+        more than mem_cache_max_size bytes. The voice just stored is always
+        kept so the caller can read it, even when it exceeds the budget.
+        """
+        self._async_remove_from_memcache(cache_key)
         self.mem_cache[cache_key] = {
             "filename": filename,
             "voice": data,
             "pending": None,
         }
+        self.mem_cache_size += len(data)
+        if self.mem_cache_size > self.mem_cache_max_size:
+            for key in [
+                key
+                for key, cached in self.mem_cache.items()
+                if key != cache_key and not cached["pending"]
+            ]:
+                self._async_remove_from_memcache(key)
+                if self.mem_cache_size <= self.mem_cache_max_size:
+                    break
 
         @callback
         def async_remove_from_mem(_: datetime) -> None:
             """Cleanup memcache."""
-            self.mem_cache.pop(cache_key, None)
+            self._mem_cache_expiry.pop(cache_key, None)
+            self._async_remove_from_memcache(cache_key)
 
-        async_call_later(
+        self._mem_cache_expiry[cache_key] = async_call_later(
             self.hass,
             self.time_memory,
             HassJob(
@@ -728,30 +783,62 @@ class SpeechManager:
             ),
         )
 
+    @callback
+    def _async_remove_from_memcache(self, cache_key: str) -> None:
+        """Remove a voice from memcache and cancel its expiry timer."""
+        if (cancel := self._mem_cache_expiry.pop(cache_key, None)) is not None:
+            cancel()
+        if (cached := self.mem_cache.pop(cache_key, None)) is not None:
+            self.mem_cache_size -= len(cached["voice"])
+
+    async def _async_get_from_memcache(self, cache_key: str) -> TTSCache:
+        """Return a voice from memcache, waiting for it if it is pending.
+
+        This method is a coroutine.
+        """
+        if (cached := self.mem_cache.get(cache_key)) is None:
+            raise HomeAssistantError(f"{cache_key} not in cache!")
+        if pending := cached["pending"]:
+            await asyncio.shield(pending)
+            if (cached := self.mem_cache.get(cache_key)) is None:
+                raise HomeAssistantError(f"{cache_key} not in cache!")
+        return cached
+
+    async def async_get_tts_file(self, filename: str) -> str | None:
+        """Return the path of a voice which is only cached on disk.
+
+        Such voices are streamed to the client instead of being read into
+        memory. Returns None when the voice is in memory or being generated.
+
+        This method is a coroutine.
+        """
+        cache_key = _cache_key_from_filename(filename)
+        if cache_key in self.mem_cache or cache_key in self._tts_tasks:
+            return None
+        if (cached_filename := self.file_cache.get(cache_key)) is None:
+            return None
+        voice_file = os.path.join(self.cache_dir, cached_filename)
+        if not await self.hass.async_add_executor_job(os.path.isfile, voice_file):
+            self.file_cache.pop(cache_key, None)
+            raise HomeAssistantError(f"Can't read {voice_file}")
+        return voice_file
+
     async def async_read_tts(self, filename: str) -> tuple[str | None, bytes]:
         """Read a voice file and return binary.
 
         This method is a coroutine.
         """
-        if not (record := _RE_VOICE_FILE.match(filename.lower())) and not (
-            record := _RE_LEGACY_VOICE_FILE.match(filename.lower())
-        ):
-            raise HomeAssistantError("Wrong tts file format!")
+        cache_key = _cache_key_from_filename(filename)
 
-        cache_key = KEY_PATTERN.format(
-            record.group(1), record.group(2), record.group(3), record.group(4)
-        )
-
-        if cache_key not in self.mem_cache:
+        if cache_key in self.mem_cache:
+            self.mem_cache.move_to_end(cache_key)
+        else:
             if cache_key not in self.file_cache:
                 raise HomeAssistantError(f"{cache_key} not in cache!")
             await self._async_file_to_mem(cache_key)
 
         content, _ = mimetypes.guess_type(filename)
-        cached = self.mem_cache[cache_key]
-        if pending := cached.get("pending"):
-            await pending
-            cached = self.mem_cache[cache_key]
+        cached = await self._async_get_from_memcache(cache_key)
         return content, cached["voice"]
 
     @staticmethod
@@ -807,6 +894,18 @@ class SpeechManager:
         return data_bytes.getvalue()
 
 
+def _cache_key_from_filename(filename: str) -> str:
+    """Return the cache key of a voice file name."""
+    if not (record := _RE_VOICE_FILE.match(filename.lower())) and not (
+        record := _RE_LEGACY_VOICE_FILE.match(filename.lower())
+    ):
+        raise HomeAssistantError("Wrong tts file format!")
+
+    return KEY_PATTERN.format(
+        record.group(1), record.group(2), record.group(3), record.group(4)
+    )
+
+
 def _init_tts_cache_dir(hass: HomeAssistant, cache_dir: str) -> str:
     """Init cache folder."""
     if not os.path.isabs(cache_dir):
@@ -890,9 +989,11 @@ class TextToSpeechView(HomeAssistantView):
         """Initialize a tts view."""
         self.tts = tts
 
-    async def get(self, request: web.Request, filename: str) -> web.Response:
+    async def get(self, request: web.Request, filename: str) -> web.StreamResponse:
         """Start a get request."""
         try:
+            if (path := await self.tts.async_get_tts_file(filename)) is not None:
+                return web.FileResponse(path, chunk_size=STREAM_CHUNK_SIZE)
             content, data = await self.tts.async_read_tts(filename)
         except HomeAssistantError as err:
             _LOGGER.error("Error on load tts: %s", err)
@@ -4,11 +4,12 @@ from __future__ import annotations
 import asyncio
 import contextlib
 from contextlib import suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from fnmatch import translate
 from functools import lru_cache
 from ipaddress import IPv4Address, IPv6Address
 import logging
+from operator import itemgetter
 import re
 import sys
 from typing import Any, Final, cast
@@ -38,6 +39,7 @@ from homeassistant.loader import (
     bind_hass,
 )
 from homeassistant.setup import async_when_setup_or_start
+from homeassistant.util.globs import GlobSet
 
 from .models import HaAsyncServiceBrowser, HaAsyncZeroconf, HaZeroconf
 from .usage import install_multiple_zeroconf_catcher
@@ -79,6 +81,10 @@ ATTR_PROPERTIES: Final = "properties"
 # Attributes for ZeroconfServiceInfo[ATTR_PROPERTIES]
 ATTR_PROPERTIES_ID: Final = "id"
 
+# Number of leading characters of a pattern used to index matchers
+MATCHER_INDEX_KEY_LENGTH = 3
+_PATTERN_CHARS = frozenset("*?[")
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.All(
@@ -294,20 +300,15 @@ async def _async_register_hass_zc_service(
 
 
 def _match_against_data(
-    matcher: dict[str, str | dict[str, str]], match_data: dict[str, str]
+    matcher: dict[str, str | dict[str, str]],
+    matched_patterns: dict[str, frozenset[str]],
 ) -> bool:
-    """Check a matcher to ensure all values in match_data match."""
-    for key in LOWER_MATCH_ATTRS:
-        if key not in matcher:
-            continue
-        if key not in match_data:
-            return False
-        match_val = matcher[key]
-        assert isinstance(match_val, str)
-
-        if not _memorized_fnmatch(match_data[key], match_val):
-            return False
-    return True
+    """Check a matcher to ensure all its patterns matched the data."""
+    return all(
+        matcher[key] in matched_patterns[key]
+        for key in LOWER_MATCH_ATTRS
+        if key in matcher
+    )
 
 
 def _match_against_props(matcher: dict[str, str], props: dict[str, str]) -> bool:
@@ -330,6 +331,127 @@ def is_homekit_paired(props: dict[str, Any]) -> bool:
     return False
 
 
+def _matcher_index_key(pattern: str) -> str | None:
+    """Return the key a pattern is indexed by.
+
+    Patterns which are too short or have wildcards in their first characters
+    cannot be indexed.
+    """
+    key = pattern[:MATCHER_INDEX_KEY_LENGTH]
+    if len(key) < MATCHER_INDEX_KEY_LENGTH or not _PATTERN_CHARS.isdisjoint(key):
+        return None
+    return key
+
+
+_IndexedMatcher = tuple[int, dict[str, str | dict[str, str]]]
+
+
+@dataclass(slots=True)
+class _ServiceTypeMatchers:
+    """Matchers of a service type by the bucket they are most likely to match."""
+
+    unconditional: list[_IndexedMatcher] = field(default_factory=list)
+    # Match attribute -> patterns of all matchers of the service type
+    globs: dict[str, GlobSet] = field(default_factory=dict)
+    name: dict[str, list[_IndexedMatcher]] = field(default_factory=dict)
+    properties: dict[str, dict[str, list[_IndexedMatcher]]] = field(
+        default_factory=dict
+    )
+    other: list[_IndexedMatcher] = field(default_factory=list)
+
+
+class ZeroconfMatcherIndex:
+    """Index of the zeroconf matchers of integrations.
+
+    Matchers are grouped by service type and put in the bucket they are most
+    likely to match, keyed by the first characters of their name pattern or,
+    failing that, of one of their property patterns. Only the matchers in the
+    buckets of a discovered service are checked, which rejects most services
+    with a few dict lookups. The name patterns of a service type are checked
+    together in one go.
+    """
+
+    def __init__(
+        self, zeroconf_types: dict[str, list[dict[str, str | dict[str, str]]]]
+    ) -> None:
+        """Initialize the index."""
+        self._service_types: dict[str, _ServiceTypeMatchers] = {}
+        for service_type, matchers in zeroconf_types.items():
+            index = self._service_types[service_type] = _ServiceTypeMatchers()
+            for position, matcher in enumerate(matchers):
+                self._add(index, (position, matcher))
+            index.globs = {
+                key: GlobSet(
+                    cast(str, matcher[key]) for matcher in matchers if key in matcher
+                )
+                for key in LOWER_MATCH_ATTRS
+            }
+
+    @staticmethod
+    def _add(index: _ServiceTypeMatchers, indexed: _IndexedMatcher) -> None:
+        """Put a matcher in its bucket."""
+        matcher = indexed[1]
+        if len(matcher) == 1:
+            index.unconditional.append(indexed)
+            return
+
+        name = matcher.get("name")
+        if isinstance(name, str) and (key := _matcher_index_key(name)):
+            index.name.setdefault(key, []).append(indexed)
+            return
+
+        properties = matcher.get(ATTR_PROPERTIES)
+        if isinstance(properties, dict):
+            for prop, pattern in properties.items():
+                if key := _matcher_index_key(pattern):
+                    index.properties.setdefault(prop, {}).setdefault(key, []).append(
+                        indexed
+                    )
+                    return
+
+        index.other.append(indexed)
+
+    def match(
+        self, service_type: str, match_data: dict[str, str], props: dict[str, Any]
+    ) -> list[dict[str, str | dict[str, str]]]:
+        """Return the matchers matching a service, in the order of the manifests."""
+        if (index := self._service_types.get(service_type)) is None:
+            return []
+
+        candidates = list(index.other)
+        if (name := match_data.get("name")) is not None and (
+            by_name := index.name.get(name[:MATCHER_INDEX_KEY_LENGTH])
+        ):
+            candidates.extend(by_name)
+        for prop, by_key in index.properties.items():
+            if isinstance(value := props.get(prop), str) and (
+                by_value := by_key.get(value.lower()[:MATCHER_INDEX_KEY_LENGTH])
+            ):
+                candidates.extend(by_value)
+
+        matches = list(index.unconditional)
+        if not candidates:
+            return [matcher for _, matcher in matches]
+
+        matched_patterns = {
+            key: globs.matching(match_data[key]) if key in match_data else frozenset()
+            for key, globs in index.globs.items()
+        }
+        for position, matcher in candidates:
+            if not _match_against_data(matcher, matched_patterns):
+                continue
+            if ATTR_PROPERTIES in matcher:
+                matcher_props = matcher[ATTR_PROPERTIES]
+                assert isinstance(matcher_props, dict)
+                if not _match_against_props(matcher_props, props):
+                    continue
+            matches.append((position, matcher))
+
+        if len(matches) > 1:
+            matches.sort(key=itemgetter(0))
+        return [matcher for _, matcher in matches]
+
+
 class ZeroconfDiscovery:
     """Discovery via zeroconf."""
 
@@ -346,6 +468,7 @@ class ZeroconfDiscovery:
         self.hass = hass
         self.zeroconf = zeroconf
         self.zeroconf_types = zeroconf_types
+        self.matcher_index = ZeroconfMatcherIndex(zeroconf_types)
         self.homekit_model_lookups = homekit_model_lookups
         self.homekit_model_matchers = homekit_model_matchers
 
@@ -479,16 +602,7 @@ class ZeroconfDiscovery:
 
         # Not all homekit types are currently used for discovery
         # so not all service type exist in zeroconf_types
-        for matcher in self.zeroconf_types.get(service_type, []):
-            if len(matcher) > 1:
-                if not _match_against_data(matcher, match_data):
-                    continue
-                if ATTR_PROPERTIES in matcher:
-                    matcher_props = matcher[ATTR_PROPERTIES]
-                    assert isinstance(matcher_props, dict)
-                    if not _match_against_props(matcher_props, props):
-                        continue
-
+        for matcher in self.matcher_index.match(service_type, match_data, props):
             matcher_domain = matcher["domain"]
             assert isinstance(matcher_domain, str)
             context = {
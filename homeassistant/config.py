@@ -58,6 +58,7 @@ from .helpers import (
     config_validation as cv,
     extract_domain_configs,
     issue_registry as ir,
+    storage,
 )
 from .helpers.entity_values import EntityValues
 from .helpers.typing import ConfigType
@@ -66,6 +67,7 @@ from .requirements import RequirementsNotFound, async_get_integration_with_requi
 from .util.package import is_docker_env
 from .util.unit_system import get_unit_system, validate_unit_system
 from .util.yaml import SECRET_YAML, Secrets, load_yaml
+from .util.yaml.loader import YamlCache
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -76,6 +78,10 @@ YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
+DATA_YAML_CACHE = "yaml_cache"
+
+YAML_CACHE_STORAGE_KEY = "core.yaml_cache"
+YAML_CACHE_STORAGE_VERSION = 1
 
 AUTOMATION_CONFIG_PATH = "automations.yaml"
 SCRIPT_CONFIG_PATH = "scripts.yaml"
@@ -389,29 +395,64 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     configuration by itself. Include package merge.
     """
     secrets = Secrets(Path(hass.config.config_dir))
+    cache = await async_get_yaml_cache(hass)
 
-    # Not using async_add_executor_job because this is an internal method.
-    config = await hass.loop.run_in_executor(
-        None,
-        load_yaml_config_file,
-        hass.config.path(YAML_CONFIG_FILE),
-        secrets,
-    )
+    try:
+        # Not using async_add_executor_job because this is an internal method.
+        config = await hass.loop.run_in_executor(
+            None,
+            load_yaml_config_file,
+            hass.config.path(YAML_CONFIG_FILE),
+            secrets,
+            cache,
+        )
+    finally:
+        await async_save_yaml_cache(hass)
     core_config = config.get(CONF_CORE, {})
     await merge_packages_config(hass, config, core_config.get(CONF_PACKAGES, {}))
     return config
 
 
+async def async_get_yaml_cache(hass: HomeAssistant) -> YamlCache:
+    """Return the cache of parsed YAML configuration files."""
+    if DATA_YAML_CACHE not in hass.data:
+        store = storage.Store[dict[str, list[Any]]](
+            hass, YAML_CACHE_STORAGE_VERSION, YAML_CACHE_STORAGE_KEY, private=True
+        )
+        try:
+            data = await store.async_load()
+        except HomeAssistantError as err:
+            _LOGGER.warning("Unable to load YAML configuration cache: %s", err)
+            data = None
+        hass.data[DATA_YAML_CACHE] = (store, YamlCache(data))
+    cache: YamlCache = hass.data[DATA_YAML_CACHE][1]
+    return cache
+
+
+async def async_save_yaml_cache(hass: HomeAssistant) -> None:
+    """Save the cache of parsed YAML configuration files if it changed."""
+    if DATA_YAML_CACHE not in hass.data:
+        return
+    store, cache = hass.data[DATA_YAML_CACHE]
+    if not cache.dirty:
+        return
+    cache.dirty = False
+    await store.async_save(cache.as_dict())
+
+
 def load_yaml_config_file(
-    config_path: str, secrets: Secrets | None = None
+    config_path: str, secrets: Secrets | None = None, cache: YamlCache | None = None
 ) -> dict[Any, Any]:
     """Parse a YAML configuration file.
 
+    Files are only parsed again if they changed since they were added to
+    the cache.
+
     Raises FileNotFoundError or HomeAssistantError.
 
     This method needs to run in an executor.
     """
-    conf_dict = load_yaml(config_path, secrets)
+    conf_dict = load_yaml(config_path, secrets, cache)
 
     if not isinstance(conf_dict, dict):
         msg = (
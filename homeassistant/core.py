@@ -1414,11 +1414,13 @@ class State:
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_reservations", "_bus", "_loop")
+    __slots__ = ("_states", "_domain_index", "_reservations", "_bus", "_loop")
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states: dict[str, State] = {}
+        # Domain -> entity_id -> State, in the same order as _states
+        self._domain_index: dict[str, dict[str, State]] = {}
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
@@ -1442,12 +1444,14 @@ class StateMachine:
             return list(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._domain_index.get(domain_filter.lower(), ()))
 
+        domain_index = self._domain_index
         return [
-            state.entity_id
-            for state in self._states.values()
-            if state.domain in domain_filter
+            entity_id
+            for domain in dict.fromkeys(domain_filter)
+            if domain in domain_index
+            for entity_id in domain_index[domain]
         ]
 
     @callback
@@ -1464,8 +1468,11 @@ class StateMachine:
         if isinstance(domain_filter, str):
             domain_filter = (domain_filter.lower(),)
 
-        return len(
-            [None for state in self._states.values() if state.domain in domain_filter]
+        domain_index = self._domain_index
+        return sum(
+            len(domain_index[domain])
+            for domain in dict.fromkeys(domain_filter)
+            if domain in domain_index
         )
 
     def all(self, domain_filter: str | Iterable[str] | None = None) -> list[State]:
@@ -1486,10 +1493,16 @@ class StateMachine:
             return list(self._states.values())
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            if (states := self._domain_index.get(domain_filter.lower())) is None:
+                return []
+            return list(states.values())
 
+        domain_index = self._domain_index
         return [
-            state for state in self._states.values() if state.domain in domain_filter
+            state
+            for domain in dict.fromkeys(domain_filter)
+            if domain in domain_index
+            for state in domain_index[domain].values()
         ]
 
     def get(self, entity_id: str) -> State | None:
@@ -1533,6 +1546,11 @@ class StateMachine:
         if old_state is None:
             return False
 
+        domain_states = self._domain_index[old_state.domain]
+        del domain_states[entity_id]
+        if not domain_states:
+            del self._domain_index[old_state.domain]
+
         old_state.expire()
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
@@ -1654,6 +1672,10 @@ class StateMachine:
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
+        if (domain_states := self._domain_index.get(state.domain)) is None:
+            self._domain_index[state.domain] = {entity_id: state}
+        else:
+            domain_states[entity_id] = state
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": state},
@@ -1768,6 +1790,20 @@ class ServiceRegistry:
             return SupportsResponse.NONE
         return handler.supports_response
 
+    def is_callback(self, domain: str, service: str) -> bool:
+        """Return if the service is handled by a callback.
+
+        Calls to such services complete without yielding to the event loop.
+        Will return False if the service does not exist.
+
+        Async friendly.
+        """
+        if not (services := self._services.get(domain.lower())) or not (
+            handler := services.get(service.lower())
+        ):
+            return False
+        return handler.job.job_type == HassJobType.Callback
+
     def register(
         self,
         domain: str,
@@ -1,10 +1,12 @@
 """Helper to check the configuration file."""
 from __future__ import annotations
 
+import asyncio
 from collections import OrderedDict
 import logging
 import os
 from pathlib import Path
+import time
 from typing import NamedTuple, Self
 
 import voluptuous as vol
@@ -16,8 +18,9 @@ from homeassistant.config import (  # type: ignore[attr-defined]
     CORE_CONFIG_SCHEMA,
     YAML_CONFIG_FILE,
     _format_config_error,
+    async_get_yaml_cache,
+    async_save_yaml_cache,
     config_per_platform,
-    extract_domain_configs,
     load_yaml_config_file,
     merge_packages_config,
 )
@@ -32,6 +35,8 @@ import homeassistant.util.yaml.loader as yaml_loader
 
 from .typing import ConfigType
 
+_LOGGER = logging.getLogger(__name__)
+
 
 class CheckConfigError(NamedTuple):
     """Configuration check error."""
@@ -48,6 +53,7 @@ class HomeAssistantConfig(OrderedDict):
         """Initialize HA config."""
         super().__init__()
         self.errors: list[CheckConfigError] = []
+        self.validation_times: dict[str, float] = {}
 
     def add_error(
         self,
@@ -67,9 +73,13 @@ class HomeAssistantConfig(OrderedDict):
 
 async def async_check_ha_config_file(  # noqa: C901
     hass: HomeAssistant,
+    timings: bool = False,
 ) -> HomeAssistantConfig:
     """Load and check if Home Assistant configuration file is valid.
 
+    With timings, the integrations are validated one after the other and the
+    time spent on each is recorded in validation_times.
+
     This method is a coroutine.
     """
     result = HomeAssistantConfig()
@@ -84,10 +94,6 @@ async def async_check_ha_config_file(  # noqa: C901
         pack_config = core_config[CONF_PACKAGES].get(package, config)
         result.add_error(message, domain, pack_config)
 
-    def _comp_error(ex: Exception, domain: str, config: ConfigType) -> None:
-        """Handle errors from components: async_log_exception."""
-        result.add_error(_format_config_error(ex, domain, config)[0], domain, config)
-
     # Load configuration.yaml
     config_path = hass.config.path(YAML_CONFIG_FILE)
     try:
@@ -98,11 +104,14 @@ async def async_check_ha_config_file(  # noqa: C901
             load_yaml_config_file,
             config_path,
             yaml_loader.Secrets(Path(hass.config.config_dir)),
+            await async_get_yaml_cache(hass),
         )
     except FileNotFoundError:
         return result.add_error(f"File not found: {config_path}")
     except HomeAssistantError as err:
         return result.add_error(f"Error loading {config_path}: {err}")
+    finally:
+        await async_save_yaml_cache(hass)
 
     # Extract and validate core [homeassistant] config
     try:
@@ -122,23 +131,30 @@ async def async_check_ha_config_file(  # noqa: C901
     # Filter out repeating config sections
     components = {key.partition(" ")[0] for key in config}
 
-    # Process and validate config
-    for domain in components:
+    async def _async_validate_domain(domain: str, result: HomeAssistantConfig) -> None:
+        """Validate the config of a single integration."""
+
+        def _comp_error(ex: Exception, domain: str, config: ConfigType) -> None:
+            """Handle errors from components: async_log_exception."""
+            result.add_error(
+                _format_config_error(ex, domain, config)[0], domain, config
+            )
+
         try:
             integration = await async_get_integration_with_requirements(hass, domain)
         except loader.IntegrationNotFound as ex:
             if not hass.config.safe_mode:
                 result.add_error(f"Integration error: {domain} - {ex}")
-            continue
+            return
         except RequirementsNotFound as ex:
             result.add_error(f"Integration error: {domain} - {ex}")
-            continue
+            return
 
         try:
             component = integration.get_component()
         except ImportError as ex:
             result.add_error(f"Component error: {domain} - {ex}")
-            continue
+            return
 
         # Check if the integration has a custom config validator
         config_validator = None
@@ -150,7 +166,7 @@ async def async_check_ha_config_file(  # noqa: C901
             # that still fails.
             if err.name != f"{integration.pkg_path}.config":
                 result.add_error(f"Error importing config platform {domain}: {err}")
-                continue
+                return
 
         if config_validator is not None and hasattr(
             config_validator, "async_validate_config"
@@ -159,31 +175,30 @@ async def async_check_ha_config_file(  # noqa: C901
                 result[domain] = (
                     await config_validator.async_validate_config(hass, config)
                 )[domain]
-                continue
+                return
             except (vol.Invalid, HomeAssistantError) as ex:
                 _comp_error(ex, domain, config)
-                continue
+                return
             except Exception as err:  # pylint: disable=broad-except
-                logging.getLogger(__name__).exception(
-                    "Unexpected error validating config"
-                )
+                _LOGGER.exception("Unexpected error validating config")
                 result.add_error(
                     f"Unexpected error calling config validator: {err}",
                     domain,
                     config.get(domain),
                 )
-                continue
+                return
 
+        domain_config = config
         config_schema = getattr(component, "CONFIG_SCHEMA", None)
         if config_schema is not None:
             try:
-                config = config_schema(config)
+                domain_config = config_schema(config)
                 # Don't fail if the validator removed the domain from the config
-                if domain in config:
-                    result[domain] = config[domain]
+                if domain in domain_config:
+                    result[domain] = domain_config[domain]
             except vol.Invalid as ex:
                 _comp_error(ex, domain, config)
-                continue
+                return
 
         component_platform_schema = getattr(
             component,
@@ -192,15 +207,15 @@ async def async_check_ha_config_file(  # noqa: C901
         )
 
         if component_platform_schema is None:
-            continue
+            return
 
         platforms = []
-        for p_name, p_config in config_per_platform(config, domain):
+        for p_name, p_config in config_per_platform(domain_config, domain):
             # Validate component specific platform schema
             try:
                 p_validated = component_platform_schema(p_config)
             except vol.Invalid as ex:
-                _comp_error(ex, domain, config)
+                _comp_error(ex, domain, domain_config)
                 continue
 
             # Not all platform components follow same pattern for platforms
@@ -237,9 +252,33 @@ async def async_check_ha_config_file(  # noqa: C901
 
             platforms.append(p_validated)
 
-        # Remove config for current component and add validated config back in.
-        for filter_comp in extract_domain_configs(config, domain):
-            del config[filter_comp]
         result[domain] = platforms
 
+    async def _async_validate_domain_result(domain: str) -> HomeAssistantConfig:
+        """Validate the config of a single integration."""
+        domain_result = HomeAssistantConfig()
+        await _async_validate_domain(domain, domain_result)
+        return domain_result
+
+    sorted_components = sorted(components)
+    if timings:
+        # Concurrent validations would add each other's work to their times
+        for domain in sorted_components:
+            start = time.monotonic()
+            await _async_validate_domain(domain, result)
+            validation_time = time.monotonic() - start
+            result.validation_times[domain] = validation_time
+            _LOGGER.debug("Validated config of %s in %.3fs", domain, validation_time)
+        return result
+
+    # Validate the integrations concurrently so waiting on requirements,
+    # imports and config validators of one integration does not hold up the
+    # others. The results are merged in a deterministic order.
+    domain_results = await asyncio.gather(
+        *(_async_validate_domain_result(domain) for domain in sorted_components)
+    )
+    for domain_result in domain_results:
+        result.update(domain_result)
+        result.errors.extend(domain_result.errors)
+
     return result
@@ -63,6 +63,7 @@ from .template import Template, attach as template_attach, render_complex
 from .trace import (
     TraceElement,
     trace_append_element,
+    trace_cv,
     trace_path,
     trace_path_get,
     trace_stack_cv,
@@ -94,6 +95,20 @@ INPUT_ENTITY_ID = re.compile(
     r"^input_(?:select|text|number|boolean|datetime)\.(?!.+__)(?!_)[\da-z_]+(?<!_)$"
 )
 
+# Relative cost of evaluating a condition, used to evaluate cheap conditions
+# first when the order can't be observed in a trace.
+_CONDITION_COSTS = {
+    "trigger": 0,
+    "state": 1,
+    "numeric_state": 1,
+    "time": 2,
+    "zone": 2,
+    "sun": 3,
+    "template": 4,
+}
+# Device and integration conditions
+_DEFAULT_CONDITION_COST = 5
+
 
 class ConditionProtocol(Protocol):
     """Define the format of device_condition modules.
@@ -148,9 +163,52 @@ def condition_trace_update_result(**kwargs: Any) -> None:
     node.update_result(**kwargs)
 
 
+def _condition_cost(config: ConfigType) -> int:
+    """Return the relative cost of evaluating a condition config."""
+    if (condition := config[CONF_CONDITION]) in ("and", "or", "not"):
+        return max(
+            (_condition_cost(entry) for entry in config["conditions"]), default=0
+        )
+    if condition == "numeric_state" and CONF_VALUE_TEMPLATE in config:
+        return _CONDITION_COSTS["template"]
+    return _CONDITION_COSTS.get(condition, _DEFAULT_CONDITION_COST)
+
+
+def _untraced_checks(
+    configs: list[ConfigType], checks: list[ConditionCheckerType]
+) -> list[tuple[int, ConditionCheckerType]]:
+    """Return the checks to run when not tracing, cheapest first.
+
+    Disabled conditions are dropped as they never affect the result.
+    """
+    return sorted(
+        (
+            (index, check)
+            for index, (config, check) in enumerate(zip(configs, checks))
+            if config.get(CONF_ENABLED, True)
+        ),
+        key=lambda item: _condition_cost(configs[item[0]]),
+    )
+
+
+def _tracing() -> bool:
+    """Return if condition evaluation is being traced.
+
+    Without a trace there is nobody to look at the trace elements, so they
+    are not created.
+    """
+    return trace_cv.get() is not None
+
+
 @contextmanager
-def trace_condition(variables: TemplateVarsType) -> Generator[TraceElement, None, None]:
+def trace_condition(
+    variables: TemplateVarsType,
+) -> Generator[TraceElement | None, None, None]:
     """Trace condition evaluation."""
+    if not _tracing():
+        yield None
+        return
+
     should_pop = True
     trace_element = trace_stack_top(trace_stack_cv)
     if trace_element and trace_element.reuse_by_child:
@@ -175,6 +233,8 @@ def trace_condition_function(condition: ConditionCheckerType) -> ConditionChecke
     @ft.wraps(condition)
     def wrapper(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool | None:
         """Trace condition."""
+        if not _tracing():
+            return condition(hass, variables)
         with trace_condition(variables):
             result = condition(hass, variables)
             condition_trace_update_result(result=result)
@@ -252,6 +312,7 @@ async def async_and_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'AND'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    untraced_checks = _untraced_checks(config["conditions"], checks)
 
     @trace_condition_function
     def if_and_condition(
@@ -259,6 +320,22 @@ async def async_and_from_config(
     ) -> bool:
         """Test and condition."""
         errors = []
+        if not _tracing():
+            for index, check in untraced_checks:
+                try:
+                    if check(hass, variables) is False:
+                        return False
+                except ConditionError as ex:
+                    errors.append(
+                        ConditionErrorIndex(
+                            "and", index=index, total=len(checks), error=ex
+                        )
+                    )
+            if errors:
+                errors.sort(key=lambda error: error.index)
+                raise ConditionErrorContainer("and", errors=errors)
+            return True
+
         for index, check in enumerate(checks):
             try:
                 with trace_path(["conditions", str(index)]):
@@ -283,6 +360,7 @@ async def async_or_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'OR'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    untraced_checks = _untraced_checks(config["conditions"], checks)
 
     @trace_condition_function
     def if_or_condition(
@@ -290,6 +368,22 @@ async def async_or_from_config(
     ) -> bool:
         """Test or condition."""
         errors = []
+        if not _tracing():
+            for index, check in untraced_checks:
+                try:
+                    if check(hass, variables) is True:
+                        return True
+                except ConditionError as ex:
+                    errors.append(
+                        ConditionErrorIndex(
+                            "or", index=index, total=len(checks), error=ex
+                        )
+                    )
+            if errors:
+                errors.sort(key=lambda error: error.index)
+                raise ConditionErrorContainer("or", errors=errors)
+            return False
+
         for index, check in enumerate(checks):
             try:
                 with trace_path(["conditions", str(index)]):
@@ -314,6 +408,7 @@ async def async_not_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'NOT'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    untraced_checks = _untraced_checks(config["conditions"], checks)
 
     @trace_condition_function
     def if_not_condition(
@@ -321,6 +416,22 @@ async def async_not_from_config(
     ) -> bool:
         """Test not condition."""
         errors = []
+        if not _tracing():
+            for index, check in untraced_checks:
+                try:
+                    if check(hass, variables):
+                        return False
+                except ConditionError as ex:
+                    errors.append(
+                        ConditionErrorIndex(
+                            "not", index=index, total=len(checks), error=ex
+                        )
+                    )
+            if errors:
+                errors.sort(key=lambda error: error.index)
+                raise ConditionErrorContainer("not", errors=errors)
+            return True
+
         for index, check in enumerate(checks):
             try:
                 with trace_path(["conditions", str(index)]):
@@ -617,9 +728,20 @@ def state_from_config(config: ConfigType) -> ConditionCheckerType:
     if not isinstance(req_states, list):
         req_states = [req_states]
 
+    # States referring to input entities are resolved on every evaluation,
+    # all other states can be compared against directly.
+    has_entity_references = any(
+        isinstance(req_state, str) and INPUT_ENTITY_ID.match(req_state) is not None
+        for req_state in req_states
+    )
+    can_skip_untraced = for_period is None and not has_entity_references
+
     @trace_condition_function
     def if_state(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Test if condition."""
+        if can_skip_untraced and not _tracing():
+            if (result := _if_state_untraced(hass)) is not None:
+                return result
         template_attach(hass, for_period)
         errors = []
         result: bool = match != ENTITY_MATCH_ANY
@@ -645,6 +767,26 @@ def state_from_config(config: ConfigType) -> ConditionCheckerType:
 
         return result
 
+    def _if_state_untraced(hass: HomeAssistant) -> bool | None:
+        """Test if condition, return None if it needs the full evaluation."""
+        result = match != ENTITY_MATCH_ANY
+        for entity_id in entity_ids:
+            if (entity := hass.states.get(entity_id)) is None:
+                # Let the full evaluation report the error
+                return None
+            if attribute is None:
+                is_state = entity.state in req_states
+            else:
+                is_state = (
+                    attribute in entity.attributes
+                    and entity.attributes[attribute] in req_states
+                )
+            if is_state:
+                result = True
+            elif match == ENTITY_MATCH_ALL:
+                return False
+        return result
+
     return if_state
 
 
@@ -778,12 +920,28 @@ def async_template(
 def async_template_from_config(config: ConfigType) -> ConditionCheckerType:
     """Wrap action method with state based condition."""
     value_template = cast(Template, config.get(CONF_VALUE_TEMPLATE))
+    # A template without any template syntax always renders the same
+    static_result = (
+        value_template.template.strip().lower() == "true"
+        if value_template.is_static
+        else None
+    )
 
     @trace_condition_function
     def template_if(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Validate template based if-condition."""
         value_template.hass = hass
 
+        if not _tracing():
+            if static_result is not None:
+                return static_result
+            # Rendering to info is only needed to trace the entities
+            try:
+                value = value_template.async_render(variables, parse_result=False)
+            except TemplateError as ex:
+                raise ConditionErrorMessage("template", str(ex)) from ex
+            return cast(str, value).lower() == "true"
+
         return async_template(hass, value_template, variables)
 
     return template_if
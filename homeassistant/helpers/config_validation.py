@@ -10,6 +10,7 @@ from datetime import (
     timedelta,
 )
 from enum import Enum, StrEnum
+from functools import lru_cache
 import inspect
 import logging
 from numbers import Number
@@ -321,10 +322,23 @@ def entity_id_or_uuid(value: Any) -> str:
     raise vol.Invalid(f"Entity {value} is neither a valid entity ID nor a valid UUID")
 
 
+@lru_cache(maxsize=512)
+def _entity_ids_str(value: str, allow_uuid: bool) -> tuple[str, ...]:
+    """Validate a comma separated string of entity IDs or UUIDs.
+
+    Service calls tend to pass the same strings over and over, so the
+    result is memoized. A tuple is cached to keep callers from mutating it.
+    """
+    validator = entity_id_or_uuid if allow_uuid else entity_id
+    return tuple(validator(ent_id.strip()) for ent_id in value.split(","))
+
+
 def _entity_ids(value: str | list, allow_uuid: bool) -> list[str]:
     """Help validate entity IDs or UUIDs."""
     if value is None:
         raise vol.Invalid("Entity IDs cannot be None")
+    if type(value) is str:  # noqa: E721
+        return list(_entity_ids_str(value, allow_uuid))
     if isinstance(value, str):
         value = [ent_id.strip() for ent_id in value.split(",")]
 
@@ -342,17 +356,44 @@ def entity_ids_or_uuids(value: str | list) -> list[str]:
     return _entity_ids(value, True)
 
 
-comp_entity_ids = vol.Any(
+_comp_entity_ids = vol.Any(
     vol.All(vol.Lower, vol.Any(ENTITY_MATCH_ALL, ENTITY_MATCH_NONE)), entity_ids
 )
-
-
-comp_entity_ids_or_uuids = vol.Any(
+_comp_entity_ids_or_uuids = vol.Any(
     vol.All(vol.Lower, vol.Any(ENTITY_MATCH_ALL, ENTITY_MATCH_NONE)),
     entity_ids_or_uuids,
 )
 
 
+def _compile_comp_entity_ids(
+    validator: Callable[[Any], list[str]], fallback: vol.Any
+) -> Callable[[Any], str | list[str]]:
+    """Compile a validator for entity IDs or the all/none keywords.
+
+    Equivalent to the vol.Any fallback, but the common cases are validated
+    directly instead of raising and catching an exception for every failing
+    branch. Invalid input is passed on to the fallback so errors stay the same.
+    """
+
+    def validate(value: Any) -> str | list[str]:
+        """Validate entity IDs or the all/none keywords."""
+        if isinstance(value, str):
+            lowered = value.lower()
+            if lowered in (ENTITY_MATCH_ALL, ENTITY_MATCH_NONE):
+                return lowered
+        with contextlib.suppress(vol.Invalid):
+            return validator(value)
+        return cast(str | list[str], fallback(value))
+
+    return validate
+
+
+comp_entity_ids = _compile_comp_entity_ids(entity_ids, _comp_entity_ids)
+comp_entity_ids_or_uuids = _compile_comp_entity_ids(
+    entity_ids_or_uuids, _comp_entity_ids_or_uuids
+)
+
+
 def entity_domain(domain: str | list[str]) -> Callable[[Any], str]:
     """Validate that entity belong to domain."""
     ent_domain = entities_domain(domain)
@@ -500,7 +541,28 @@ def time_period_seconds(value: float | str) -> timedelta:
         raise vol.Invalid(f"Expected seconds, got {value}") from err
 
 
-time_period = vol.Any(time_period_str, time_period_seconds, timedelta, time_period_dict)
+_time_period = vol.Any(
+    time_period_str, time_period_seconds, timedelta, time_period_dict
+)
+_cached_time_period_str = lru_cache(maxsize=512)(time_period_str)
+
+
+def time_period(value: Any) -> timedelta:
+    """Validate and transform a time period.
+
+    Dispatches on the type of the value instead of trying every validator in
+    turn. Anything not handled here goes through the original vol.Any chain,
+    which also produces the error message for invalid values.
+    """
+    if isinstance(value, timedelta):
+        return value
+    if type(value) is str:  # noqa: E721
+        with contextlib.suppress(vol.Invalid):
+            return _cached_time_period_str(value)
+    elif isinstance(value, (int, float)):
+        with contextlib.suppress(vol.Invalid):
+            return time_period_seconds(value)
+    return cast(timedelta, _time_period(value))
 
 
 def match_all(value: _T) -> _T:
@@ -2,13 +2,14 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-import fnmatch
-import re
+from functools import lru_cache
 
+from lru import LRU  # pylint: disable=no-name-in-module
 import voluptuous as vol
 
 from homeassistant.const import CONF_DOMAINS, CONF_ENTITIES, CONF_EXCLUDE, CONF_INCLUDE
 from homeassistant.core import split_entity_id
+from homeassistant.util.globs import GlobSet
 
 from . import config_validation as cv
 
@@ -21,6 +22,13 @@ CONF_EXCLUDE_ENTITIES = "exclude_entities"
 
 CONF_ENTITY_GLOBS = "entity_globs"
 
+# Number of entity ids for which a filter remembers its verdict
+MAX_FILTER_CACHE_SIZE = 4096
+# Number of filters kept to share them between equal configs
+MAX_SHARED_FILTERS = 64
+
+_SHARED_FILTERS: LRU = LRU(MAX_SHARED_FILTERS)
+
 
 class EntityFilter:
     """A entity filter."""
@@ -66,8 +74,19 @@ class EntityFilter:
 
 
 def convert_filter(config: dict[str, list[str]]) -> EntityFilter:
-    """Convert the filter schema into a filter."""
-    return EntityFilter(config)
+    """Convert the filter schema into a filter.
+
+    Equal configs share a filter, so integrations filtering the same entities,
+    like the recorder and the logbook, share the verdicts it remembers.
+    """
+    key = tuple(
+        sorted((conf_key, tuple(values)) for conf_key, values in config.items())
+    )
+    if (entity_filter := _SHARED_FILTERS.get(key)) is None:
+        entity_filter = _SHARED_FILTERS[key] = EntityFilter(
+            {conf_key: list(values) for conf_key, values in config.items()}
+        )
+    return entity_filter
 
 
 BASE_FILTER_SCHEMA = vol.Schema(
@@ -136,22 +155,11 @@ INCLUDE_EXCLUDE_FILTER_SCHEMA = vol.All(
 )
 
 
-def _convert_globs_to_pattern(globs: list[str] | None) -> re.Pattern[str] | None:
-    """Convert a list of globs to a re pattern list."""
-    if globs is None:
-        return None
-
-    translated_patterns: list[str] = []
-    for glob in set(globs):
-        if pattern := fnmatch.translate(glob):
-            translated_patterns.append(pattern)
-
-    if not translated_patterns:
+def _convert_globs_to_pattern(globs: list[str] | None) -> GlobSet | None:
+    """Convert a list of globs to a glob set."""
+    if not globs:
         return None
-
-    inner = "|".join(translated_patterns)
-    combined = f"(?:{inner})"
-    return re.compile(combined)
+    return GlobSet(globs)
 
 
 def generate_filter(
@@ -173,13 +181,22 @@ def generate_filter(
     )
 
 
+def _cache_verdicts(entity_filter: Callable[[str], bool]) -> Callable[[str], bool]:
+    """Remember the verdicts of a filter.
+
+    The same entities are filtered on every state change, and as the sets and
+    patterns of a filter never change, neither do its verdicts.
+    """
+    return lru_cache(maxsize=MAX_FILTER_CACHE_SIZE)(entity_filter)
+
+
 def _generate_filter_from_sets_and_pattern_lists(
     include_d: set[str],
     include_e: set[str],
     exclude_d: set[str],
     exclude_e: set[str],
-    include_eg: re.Pattern[str] | None,
-    exclude_eg: re.Pattern[str] | None,
+    include_eg: GlobSet | None,
+    exclude_eg: GlobSet | None,
 ) -> Callable[[str], bool]:
     """Generate a filter from pre-comuted sets and pattern lists."""
     have_exclude = bool(exclude_e or exclude_d or exclude_eg)
@@ -206,7 +223,7 @@ def _generate_filter_from_sets_and_pattern_lists(
             )
 
         # Return filter function for case 2
-        return entity_included
+        return _cache_verdicts(entity_included)
 
     # Case 3 - Only excludes
     # - Entity listed in exclude: exclude
@@ -223,7 +240,7 @@ def _generate_filter_from_sets_and_pattern_lists(
                 or (exclude_eg and exclude_eg.match(entity_id))
             )
 
-        return entity_not_excluded
+        return _cache_verdicts(entity_not_excluded)
 
     # Case 4 - Domain and/or glob includes (may also have excludes)
     # - Entity listed in entities include: include
@@ -247,7 +264,7 @@ def _generate_filter_from_sets_and_pattern_lists(
                 )
             )
 
-        return entity_filter_4a
+        return _cache_verdicts(entity_filter_4a)
 
     # Case 5 - Domain and/or glob excludes (no domain and/or glob includes)
     # - Entity listed in entities include: include
@@ -264,7 +281,7 @@ def _generate_filter_from_sets_and_pattern_lists(
                 return entity_id in include_e
             return entity_id not in exclude_e
 
-        return entity_filter_4b
+        return _cache_verdicts(entity_filter_4b)
 
     # Case 6 - No Domain and/or glob includes or excludes
     # - Entity listed in entities include: include
@@ -0,0 +1,80 @@
+"""Reverse index of the items referenced by automations and scripts."""
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+
+from homeassistant.core import HomeAssistant, callback
+
+DATA_REFERENCE_INDEX = "reference_index"
+
+
+class ReferenceIndex:
+    """Map referenced entities, devices, areas and blueprints to their users.
+
+    Entities which reference other items, like automations and scripts, add
+    their references when they are added to Home Assistant and remove them
+    when they are removed. Looking up which entities reference an item is then
+    a dictionary lookup instead of a walk over all entities and their configs.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        # domain -> kind of reference -> referenced id -> referencing entity ids,
+        # kept in a dict to return them in the order they were added
+        self._index: defaultdict[
+            str, defaultdict[str, defaultdict[str, dict[str, None]]]
+        ] = defaultdict(lambda: defaultdict(lambda: defaultdict(dict)))
+        # entity id -> references as added, used to remove them again
+        self._references: dict[str, dict[str, frozenset[str]]] = {}
+
+    @callback
+    def async_add(
+        self, entity_id: str, references: Mapping[str, Iterable[str]]
+    ) -> None:
+        """Add the references of an entity, replacing earlier ones."""
+        self.async_remove(entity_id)
+        domain = entity_id.partition(".")[0]
+        index = self._index[domain]
+        added = self._references[entity_id] = {
+            kind: frozenset(referenced_ids)
+            for kind, referenced_ids in references.items()
+        }
+        for kind, referenced_ids in added.items():
+            for referenced_id in referenced_ids:
+                index[kind][referenced_id][entity_id] = None
+
+    @callback
+    def async_remove(self, entity_id: str) -> None:
+        """Remove the references of an entity."""
+        if (removed := self._references.pop(entity_id, None)) is None:
+            return
+        index = self._index[entity_id.partition(".")[0]]
+        for kind, referenced_ids in removed.items():
+            by_id = index[kind]
+            for referenced_id in referenced_ids:
+                entity_ids = by_id[referenced_id]
+                entity_ids.pop(entity_id, None)
+                if not entity_ids:
+                    del by_id[referenced_id]
+
+    @callback
+    def async_referencing(
+        self, domain: str, kind: str, referenced_id: str
+    ) -> list[str]:
+        """Return the entities of a domain which reference an item."""
+        if (
+            (by_kind := self._index.get(domain)) is None
+            or (by_id := by_kind.get(kind)) is None
+            or (entity_ids := by_id.get(referenced_id)) is None
+        ):
+            return []
+        return list(entity_ids)
+
+
+@callback
+def async_get(hass: HomeAssistant) -> ReferenceIndex:
+    """Return the reference index."""
+    if (index := hass.data.get(DATA_REFERENCE_INDEX)) is None:
+        index = hass.data[DATA_REFERENCE_INDEX] = ReferenceIndex()
+    return index
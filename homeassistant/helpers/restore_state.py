@@ -6,6 +6,9 @@ from datetime import datetime, timedelta
 import logging
 from typing import Any, Self, cast
 
+import orjson
+
+from homeassistant.backports.functools import cached_property
 from homeassistant.const import ATTR_RESTORED, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
@@ -15,7 +18,7 @@ from . import start
 from .entity import Entity
 from .event import async_track_time_interval
 from .frame import report
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes
 from .storage import Store
 
 DATA_RESTORE_STATE = "restore_state"
@@ -78,6 +81,18 @@ class StoredState:
         }
         return result
 
+    def as_storage_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the stored state to be saved.
+
+        The state is included as a JSON fragment which is cached on the
+        State object, so unchanged states are not encoded again on every dump.
+        """
+        return {
+            "state": orjson.Fragment(self.state.as_dict_json()),
+            "extra_data": self.extra_data.as_dict() if self.extra_data else None,
+            "last_seen": self.last_seen,
+        }
+
     @classmethod
     def from_dict(cls, json_dict: dict) -> Self:
         """Initialize a stored state from a dict."""
@@ -93,6 +108,57 @@ class StoredState:
         )
 
 
+class LazyStoredState(StoredState):
+    """Stored state loaded from storage that is decoded on first access.
+
+    Most stored states are never restored or are restored long after startup,
+    so only the last seen time is parsed when loading.
+    """
+
+    def __init__(self, json_dict: dict[str, Any], last_seen: datetime) -> None:
+        """Initialize a new lazy stored state."""
+        # pylint: disable-next=super-init-not-called
+        self._json_dict = json_dict
+        self.last_seen = last_seen
+
+    @cached_property  # type: ignore[override]
+    def state(self) -> State:
+        """Return the decoded state."""
+        return cast(State, State.from_dict(self._json_dict["state"]))
+
+    @cached_property  # type: ignore[override]
+    def extra_data(self) -> ExtraStoredData | None:
+        """Return the decoded extra data."""
+        if extra_data_dict := self._json_dict.get("extra_data"):
+            return RestoredExtraData(extra_data_dict)
+        return None
+
+    @cached_property
+    def _state_fragment(self) -> orjson.Fragment:
+        """Return the stored state encoded as a JSON fragment."""
+        return orjson.Fragment(json_bytes(self._json_dict["state"]))
+
+    def as_storage_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the stored state to be saved."""
+        if "state" in self.__dict__:
+            return super().as_storage_dict()
+        return {
+            "state": self._state_fragment,
+            "extra_data": self._json_dict.get("extra_data"),
+            "last_seen": self.last_seen,
+        }
+
+    @classmethod
+    def from_dict(cls, json_dict: dict) -> Self:
+        """Initialize a lazy stored state from a dict."""
+        last_seen = json_dict["last_seen"]
+
+        if isinstance(last_seen, str):
+            last_seen = dt_util.parse_datetime(last_seen)
+
+        return cls(json_dict, last_seen)
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     restore_state = RestoreStateData(hass)
@@ -161,7 +227,7 @@ class RestoreStateData:
             self.last_states = {}
         else:
             self.last_states = {
-                item["state"]["entity_id"]: StoredState.from_dict(item)
+                item["state"]["entity_id"]: LazyStoredState.from_dict(item)
                 for item in stored_states
                 if valid_entity_id(item["state"]["entity_id"])
             }
@@ -214,13 +280,18 @@ class RestoreStateData:
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
+        data: list[dict[str, Any]] = []
+        for stored_state in self.async_get_stored_states():
+            try:
+                data.append(stored_state.as_storage_dict())
+            except TypeError as exc:
+                _LOGGER.error(
+                    "Error serializing state of %s",
+                    stored_state.state.entity_id,
+                    exc_info=exc,
+                )
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            await self.store.async_save(data)
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
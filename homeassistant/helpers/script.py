@@ -86,6 +86,7 @@ from .trace import (
     async_trace_path,
     script_execution_set,
     trace_append_element,
+    trace_cv,
     trace_id_get,
     trace_path,
     trace_path_get,
@@ -159,6 +160,11 @@ def action_trace_append(variables, path):
 @asynccontextmanager
 async def trace_action(hass, script_run, stop, variables):
     """Trace action execution."""
+    if trace_cv.get() is None:
+        # The run is not traced, there is nothing to record or debug
+        yield None
+        return
+
     path = trace_path_get()
     trace_element = action_trace_append(variables, path)
     trace_stack_push(trace_stack_cv, trace_element)
@@ -701,16 +707,20 @@ class _ScriptRun:
             or params[CONF_DOMAIN] in ("python_script", "script")
         )
         trace_set_result(params=params, running_script=running_script)
-        response_data = await self._async_run_long_action(
-            self._hass.async_create_task(
-                self._hass.services.async_call(
-                    **params,
-                    blocking=True,
-                    context=self._context,
-                    return_response=return_response,
-                )
-            ),
+        service_call = self._hass.services.async_call(
+            **params,
+            blocking=True,
+            context=self._context,
+            return_response=return_response,
         )
+        if self._hass.services.is_callback(params[CONF_DOMAIN], params[CONF_SERVICE]):
+            # The call completes without yielding, so it can't be stopped
+            # halfway and doesn't need to run in its own task
+            response_data = await service_call
+        else:
+            response_data = await self._async_run_long_action(
+                self._hass.async_create_task(service_call)
+            )
         if response_variable:
             self._variables[response_variable] = response_data
 
@@ -1080,11 +1090,23 @@ class _QueuedScriptRun(_ScriptRun):
 
     async def async_run(self) -> None:
         """Run script."""
+        # pylint: disable=protected-access
+        queue_lck = self._script._queue_lck
+        if (
+            not queue_lck.locked()
+            and self._script._runs[0] is self
+            and not self._stop.is_set()
+        ):
+            # No earlier run is holding or waiting for the lock, so acquiring
+            # it won't yield and there's no need to monitor for a stop request
+            await queue_lck.acquire()
+            self.lock_acquired = True
+            await super().async_run()
+            return
+
         # Wait for previous run, if any, to finish by attempting to acquire the script's
         # shared lock. At the same time monitor if we've been told to stop.
-        lock_task = self._hass.async_create_task(
-            self._script._queue_lck.acquire()  # pylint: disable=protected-access
-        )
+        lock_task = self._hass.async_create_task(queue_lck.acquire())
         stop_task = self._hass.async_create_task(self._stop.wait())
         try:
             await asyncio.wait(
@@ -5,6 +5,7 @@ import asyncio
 from collections.abc import Callable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+from dataclasses import dataclass
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
@@ -25,6 +26,7 @@ from homeassistant.loader import MAX_LOAD_CONCURRENTLY, bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
 from homeassistant.util.file import WriteError
+from homeassistant.util.ulid import ulid
 
 from . import json as json_helper
 
@@ -36,8 +38,159 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
 
+JOURNAL_SUFFIX = ".journal"
+# Fold the journal back into the base file once it grows past this
+# fraction of the size of the base file.
+JOURNAL_COMPACT_RATIO = 0.5
+
 _T = TypeVar("_T", bound=Mapping[str, Any] | Sequence[Any])
 
+_JournalSnapshot = dict[str, bytes | dict[str, bytes]]
+
+
+@dataclass(slots=True)
+class _JournalState:
+    """State of the change journal of a store."""
+
+    journal_id: str
+    version: tuple[int, int]
+    snapshot: _JournalSnapshot
+    base_size: int
+    journal_size: int = 0
+
+
+def _journal_snapshot(data: Any) -> _JournalSnapshot | None:
+    """Serialize data into a snapshot that can be diffed.
+
+    Lists of dicts that all have a unique string "id" are snapshotted
+    per item so changes to a single item can be journaled on their own.
+    Returns None if the data cannot be journaled.
+    """
+    if not isinstance(data, dict):
+        return None
+    snapshot: _JournalSnapshot = {}
+    try:
+        for key, value in data.items():
+            if not isinstance(key, str):
+                return None
+            if isinstance(value, list) and all(
+                isinstance(item, dict) and isinstance(item.get("id"), str)
+                for item in value
+            ):
+                items = {item["id"]: json_helper.json_bytes(item) for item in value}
+                if len(items) == len(value):
+                    snapshot[key] = items
+                    continue
+            snapshot[key] = json_helper.json_bytes(value)
+    except TypeError:
+        return None
+    return snapshot
+
+
+def _journal_value(value: bytes | dict[str, bytes]) -> bytes:
+    """Return the serialized value of a snapshot entry."""
+    if isinstance(value, bytes):
+        return value
+    return b"[" + b",".join(value.values()) + b"]"
+
+
+def _journal_diff(old: _JournalSnapshot, new: _JournalSnapshot) -> list[bytes]:
+    """Return the serialized journal operations to go from old to new."""
+    ops: list[bytes] = []
+    for key in old:
+        if key not in new:
+            ops.append(b'{"k":' + json_helper.json_bytes(key) + b"}")
+    for key, value in new.items():
+        old_value = old.get(key)
+        # Dict equality ignores the order of the items
+        if old_value == value and (
+            not isinstance(value, dict) or list(old_value) == list(value)  # type: ignore[arg-type]
+        ):
+            continue
+        key_bytes = json_helper.json_bytes(key)
+        if isinstance(value, dict) and isinstance(old_value, dict):
+            kept = [item_id for item_id in old_value if item_id in value]
+            # Items can be changed, removed or appended but a reordering
+            # can't be expressed per item and replaces the whole list
+            if list(value)[: len(kept)] == kept:
+                for item_id in old_value:
+                    if item_id in value:
+                        continue
+                    ops.append(
+                        b'{"k":'
+                        + key_bytes
+                        + b',"i":'
+                        + json_helper.json_bytes(item_id)
+                        + b"}"
+                    )
+                for item_id, item in value.items():
+                    if old_value.get(item_id) != item:
+                        ops.append(
+                            b'{"k":'
+                            + key_bytes
+                            + b',"i":'
+                            + json_helper.json_bytes(item_id)
+                            + b',"v":'
+                            + item
+                            + b"}"
+                        )
+                continue
+        ops.append(b'{"k":' + key_bytes + b',"v":' + _journal_value(value) + b"}")
+    return ops
+
+
+def _replay_journal(
+    data: dict[str, Any], journal_id: str, path: str
+) -> tuple[int, bool]:
+    """Replay the journal at path on top of data.
+
+    Returns the size of the complete records of the journal and whether
+    anything follows them. Records written for another base file are skipped
+    and a torn record at the end of the journal, left behind by an unclean
+    shutdown, is discarded.
+    """
+    try:
+        with open(path, "rb") as fdesc:
+            content = fdesc.read()
+    except FileNotFoundError:
+        return 0, False
+
+    # A record is only complete with its newline, which is written with it
+    lines = content.split(b"\n")[:-1]
+    keyed: dict[str, dict[str, Any]] = {}
+    size = 0
+    for line in lines:
+        try:
+            record = json_util.json_loads(line)
+        except json_util.JSON_DECODE_EXCEPTIONS:
+            break
+        size += len(line) + 1
+        if not isinstance(record, dict) or record.get("id") != journal_id:
+            continue
+        for op in record["ops"]:
+            key = op["k"]
+            if "i" in op:
+                if (items := keyed.get(key)) is None:
+                    items = keyed[key] = {
+                        item["id"]: item for item in data.get(key, ())
+                    }
+                if "v" in op:
+                    items[op["i"]] = op["v"]
+                else:
+                    items.pop(op["i"], None)
+                continue
+            keyed.pop(key, None)
+            if "v" in op:
+                data[key] = op["v"]
+            else:
+                data.pop(key, None)
+
+    for key, items in keyed.items():
+        data[key] = list(items.values())
+    if torn := size < len(content):
+        _LOGGER.warning("Discarding incomplete journal record in %s", path)
+    return size, torn
+
 
 @bind_hass
 async def async_migrator(
@@ -94,8 +247,15 @@ class Store(Generic[_T]):
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        With journal enabled, delayed saves only append the changes since the
+        last write to a journal next to the storage file. The journal is
+        replayed on load and compacted into the storage file when it grows
+        too large and on the final write.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -109,12 +269,23 @@ class Store(Generic[_T]):
         self._encoder = encoder
         self._atomic_writes = atomic_writes
         self._read_only = read_only
+        # Journaling relies on the orjson serialization of the default encoder
+        self._journal = journal and (
+            encoder is None or encoder is json_helper.JSONEncoder
+        )
+        self._journal_state: _JournalState | None = None
+        self._journal_generation = 0
 
     @property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @property
+    def journal_path(self) -> str:
+        """Return the path of the change journal."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     async def async_load(self) -> _T | None:
         """Load data.
 
@@ -157,9 +328,10 @@ class Store(Generic[_T]):
             # and we don't want that to mess with what we're trying to store.
             data = deepcopy(data)
         else:
+            journal_generation = self._journal_generation
             try:
-                data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
+                data, journal_state = await self.hass.async_add_executor_job(
+                    self._load_data
                 )
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
@@ -218,6 +390,10 @@ class Store(Generic[_T]):
             if data == {}:
                 return None
 
+            # Only track the journal if nothing was written while loading
+            if journal_generation == self._journal_generation:
+                self._journal_state = journal_state
+
         # Add minor_version if not set
         if "minor_version" not in data:
             data["minor_version"] = 1
@@ -251,6 +427,48 @@ class Store(Generic[_T]):
 
         return stored
 
+    def _load_data(self) -> tuple[Any, _JournalState | None]:
+        """Load the data and replay the journal."""
+        data = json_util.load_json(self.path)
+        if (
+            not self._journal
+            or not isinstance(data, dict)
+            or not isinstance(journal_id := data.get("journal_id"), str)
+            or not isinstance(data.get("data"), dict)
+        ):
+            return data, None
+
+        journal_size, torn = _replay_journal(
+            data["data"], journal_id, self.journal_path
+        )
+        if torn:
+            # Records appended after a torn record would be glued onto it
+            # and lost on the next load. If the journal can't be cut back,
+            # the next write replaces the base file and starts a new journal.
+            if self._read_only:
+                return data, None
+            try:
+                os.truncate(self.journal_path, journal_size)
+            except OSError as err:
+                _LOGGER.warning(
+                    "Could not truncate journal %s: %s", self.journal_path, err
+                )
+                return data, None
+
+        version = (data["version"], data.get("minor_version", 1))
+        if version != (self.version, self.minor_version) or (
+            (snapshot := _journal_snapshot(data["data"])) is None
+        ):
+            return data, None
+
+        return data, _JournalState(
+            journal_id,
+            version,
+            snapshot,
+            os.path.getsize(self.path),
+            journal_size,
+        )
+
     async def async_save(self, data: _T) -> None:
         """Save data."""
         self._data = {
@@ -326,10 +544,13 @@ class Store(Generic[_T]):
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
-        await self._async_handle_write_data()
+        await self._async_handle_write_data(compact=True)
 
-    async def _async_handle_write_data(self, *_args):
-        """Handle writing the config."""
+    async def _async_handle_write_data(self, *_args, compact: bool = False):
+        """Handle writing the config.
+
+        When compact is set, the journal is folded into the storage file.
+        """
         async with self._write_lock:
             self._async_cleanup_delay_listener()
             self._async_cleanup_final_write_listener()
@@ -344,12 +565,16 @@ class Store(Generic[_T]):
                 data["data"] = data.pop("data_func")()
 
             self._data = None
+            self._journal_generation += 1
 
             if self._read_only:
                 return
 
             try:
-                await self._async_write_data(self.path, data)
+                if self._journal_state is None or compact:
+                    await self._async_write_data(self.path, data)
+                else:
+                    await self.hass.async_add_executor_job(self._write_journal, data)
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
@@ -360,6 +585,13 @@ class Store(Generic[_T]):
         """Write the data."""
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
+        if self._journal:
+            # A new journal id orphans the records of the old journal in
+            # case we crash before the old journal has been removed
+            self._journal_state = None
+            journal_id = ulid()
+            data = {**data, "journal_id": journal_id}
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -369,6 +601,67 @@ class Store(Generic[_T]):
             atomic_writes=self._atomic_writes,
         )
 
+        if not self._journal:
+            return
+
+        with suppress(FileNotFoundError):
+            os.unlink(self.journal_path)
+        if (snapshot := _journal_snapshot(data["data"])) is not None:
+            self._journal_state = _JournalState(
+                journal_id,
+                (data["version"], data["minor_version"]),
+                snapshot,
+                os.path.getsize(path),
+            )
+
+    def _write_journal(self, data: dict) -> None:
+        """Append the changes since the last write to the journal."""
+        state = self._journal_state
+        assert state is not None
+        if (data["version"], data["minor_version"]) != state.version or (
+            (snapshot := _journal_snapshot(data["data"])) is None
+        ):
+            self._write_data(self.path, data)
+            return
+
+        if not (ops := _journal_diff(state.snapshot, snapshot)):
+            return
+
+        record = (
+            b'{"id":'
+            + json_helper.json_bytes(state.journal_id)
+            + b',"ops":['
+            + b",".join(ops)
+            + b"]}\n"
+        )
+        if state.journal_size + len(record) > state.base_size * JOURNAL_COMPACT_RATIO:
+            self._write_data(self.path, data)
+            return
+
+        _LOGGER.debug(
+            "Writing %s bytes for %s to %s", len(record), self.key, self.journal_path
+        )
+        try:
+            fd = os.open(
+                self.journal_path,
+                os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                0o600 if self._private else 0o644,
+            )
+            try:
+                os.write(fd, record)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError as error:
+            # The journal may end in a partial record now, the next write
+            # replaces the base file and starts a new journal
+            self._journal_state = None
+            _LOGGER.exception("Saving journal failed: %s", self.journal_path)
+            raise WriteError(error) from error
+
+        state.snapshot = snapshot
+        state.journal_size += len(record)
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -377,6 +670,10 @@ class Store(Generic[_T]):
         """Remove all data."""
         self._async_cleanup_delay_listener()
         self._async_cleanup_final_write_listener()
+        self._journal_state = None
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal:
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
@@ -1099,19 +1099,22 @@ def _state_generator(
 ) -> Generator[TemplateState, None, None]:
     """State generator for a domain or all states."""
     states = hass.states
-    # If domain is None, we want to iterate over all states, but making
-    # a copy of the dict is expensive. So we iterate over the protected
-    # _states dict instead. This is safe because we're not modifying it
-    # and everything is happening in the same thread (MainThread).
+    # Making a copy of the states is expensive. So we iterate over the
+    # protected _states dict, or the per domain dict of the domain index,
+    # instead. This is safe because we're not modifying it and everything
+    # is happening in the same thread (MainThread).
     #
-    # We do not want to expose this method in the public API though to
-    # ensure it does not get misused.
+    # We do not want to expose these dicts in the public API though to
+    # ensure they do not get misused.
     #
+    # pylint: disable=protected-access
     container: Iterable[State]
     if domain is None:
-        container = states._states.values()  # pylint: disable=protected-access
+        container = states._states.values()
+    elif (domain_states := states._domain_index.get(domain)) is not None:
+        container = domain_states.values()
     else:
-        container = states.async_all(domain)
+        return
     for state in container:
         yield _template_state_no_collect(hass, state)
 
@@ -41,11 +41,16 @@ class TraceElement:
         if variables is None:
             variables = {}
         last_variables = variables_cv.get() or {}
+        # The shallow copy shares its values with the variables of the run,
+        # values which did not change are the same object and are not compared
         variables_cv.set(dict(variables))
         changed_variables = {
             key: value
             for key, value in variables.items()
-            if key not in last_variables or last_variables[key] != value
+            if key not in last_variables
+            or (
+                (last_value := last_variables[key]) is not value and last_value != value
+            )
         }
         self._variables = changed_variables
 
@@ -196,6 +201,16 @@ def trace_clear() -> None:
     script_execution_cv.set(StopReason())
 
 
+def trace_disable() -> None:
+    """Disable tracing in the current context."""
+    trace_cv.set(None)
+    trace_stack_cv.set(None)
+    trace_path_stack_cv.set(None)
+    variables_cv.set(None)
+    trace_id_cv.set(None)
+    script_execution_cv.set(StopReason())
+
+
 def trace_set_child_id(child_key: str, child_run_id: str) -> None:
     """Set child trace_id of TraceElement at the top of the stack."""
     node = cast(TraceElement, trace_stack_top(trace_stack_cv))
@@ -206,13 +221,15 @@ def trace_set_child_id(child_key: str, child_run_id: str) -> None:
 def trace_set_result(**kwargs: Any) -> None:
     """Set the result of TraceElement at the top of the stack."""
     node = cast(TraceElement, trace_stack_top(trace_stack_cv))
-    node.set_result(**kwargs)
+    if node:
+        node.set_result(**kwargs)
 
 
 def trace_update_result(**kwargs: Any) -> None:
     """Update the result of TraceElement at the top of the stack."""
     node = cast(TraceElement, trace_stack_top(trace_stack_cv))
-    node.update_result(**kwargs)
+    if node:
+        node.update_result(**kwargs)
 
 
 class StopReason:
@@ -3,7 +3,8 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Generator
+from collections.abc import Awaitable, Callable, Coroutine, Generator, Hashable
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
 from random import randint
@@ -30,6 +31,10 @@ from .debounce import Debouncer
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
 REQUEST_REFRESH_DEFAULT_IMMEDIATE = True
 
+GROUP_DEFAULT_BACKOFF_FACTOR = 2.0
+GROUP_DEFAULT_MIN_INTERVAL_RATIO = 0.5
+GROUP_DEFAULT_MAX_INTERVAL_RATIO = 8.0
+
 _DataT = TypeVar("_DataT")
 _BaseDataUpdateCoordinatorT = TypeVar(
     "_BaseDataUpdateCoordinatorT", bound="BaseDataUpdateCoordinatorProtocol"
@@ -53,12 +58,179 @@ class BaseDataUpdateCoordinatorProtocol(Protocol):
         """Listen for data updates."""
 
 
+@dataclass(slots=True)
+class CoordinatorStats:
+    """Refresh statistics of a coordinator in a group."""
+
+    refreshes: int = 0
+    failures: int = 0
+    skipped_fetches: int = 0
+    total_latency: float = 0.0
+    last_latency: float | None = None
+    interval_ratio: float = 1.0
+
+    @property
+    def success_rate(self) -> float | None:
+        """Return the share of refreshes that succeeded."""
+        if not self.refreshes:
+            return None
+        return (self.refreshes - self.failures) / self.refreshes
+
+    @property
+    def mean_latency(self) -> float | None:
+        """Return the mean time spent fetching data."""
+        if not self.refreshes:
+            return None
+        return self.total_latency / self.refreshes
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dict for diagnostics."""
+        return {
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "skipped_fetches": self.skipped_fetches,
+            "success_rate": self.success_rate,
+            "mean_latency": self.mean_latency,
+            "last_latency": self.last_latency,
+            "interval_ratio": self.interval_ratio,
+        }
+
+
+class DataUpdateCoordinatorGroup:
+    """Share fetches and adapt the refresh interval of related coordinators.
+
+    Coordinators talking to the same host or account can be put in a group.
+    Overlapping refreshes of coordinators with the same ``group_key`` share a
+    single fetch, so they must fetch the same data. The refresh interval of
+    each coordinator backs off when fetches fail or return unchanged data and
+    speeds up again when the data changes, bounded by ratios of the
+    coordinator's own ``update_interval``.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        *,
+        backoff_factor: float = GROUP_DEFAULT_BACKOFF_FACTOR,
+        min_interval_ratio: float = GROUP_DEFAULT_MIN_INTERVAL_RATIO,
+        max_interval_ratio: float = GROUP_DEFAULT_MAX_INTERVAL_RATIO,
+    ) -> None:
+        """Initialize the coordinator group."""
+        self.hass = hass
+        self.backoff_factor = backoff_factor
+        self.min_interval_ratio = min_interval_ratio
+        self.max_interval_ratio = max_interval_ratio
+        self._stats: dict[DataUpdateCoordinator[Any], CoordinatorStats] = {}
+        self._fetches: dict[Hashable, asyncio.Task[Any]] = {}
+
+    @callback
+    def async_add(self, coordinator: DataUpdateCoordinator[Any]) -> None:
+        """Add a coordinator to the group."""
+        self._stats[coordinator] = CoordinatorStats()
+
+    @callback
+    def async_remove(self, coordinator: DataUpdateCoordinator[Any]) -> None:
+        """Remove a coordinator from the group."""
+        self._stats.pop(coordinator, None)
+
+    @callback
+    def async_get_stats(
+        self, coordinator: DataUpdateCoordinator[Any]
+    ) -> CoordinatorStats | None:
+        """Return the statistics of a coordinator."""
+        return self._stats.get(coordinator)
+
+    async def async_fetch(
+        self,
+        coordinator: DataUpdateCoordinator[_DataT],
+        fetch: Callable[[], Coroutine[Any, Any, _DataT]],
+    ) -> _DataT:
+        """Fetch data, joining an identical fetch which is in progress."""
+        if (key := coordinator.group_key) is None:
+            return await fetch()
+
+        if (task := self._fetches.get(key)) is not None:
+            if stats := self._stats.get(coordinator):
+                stats.skipped_fetches += 1
+            return await asyncio.shield(task)
+
+        task = self._fetches[key] = self.hass.async_create_task(
+            fetch(), f"DataUpdateCoordinatorGroup fetch {key}"
+        )
+
+        def _fetch_done(task: asyncio.Task[Any]) -> None:
+            if self._fetches.get(key) is task:
+                del self._fetches[key]
+            # Mark the exception retrieved in case all refreshes were cancelled
+            if not task.cancelled():
+                task.exception()
+
+        task.add_done_callback(_fetch_done)
+        return await asyncio.shield(task)
+
+    @callback
+    def async_record_refresh(
+        self,
+        coordinator: DataUpdateCoordinator[Any],
+        latency: float,
+        success: bool,
+        changed: bool,
+    ) -> None:
+        """Record the outcome of a refresh and adapt the refresh interval."""
+        if (stats := self._stats.get(coordinator)) is None:
+            return
+        stats.refreshes += 1
+        stats.total_latency += latency
+        stats.last_latency = latency
+        if not success:
+            stats.failures += 1
+        if success and changed:
+            stats.interval_ratio = max(
+                self.min_interval_ratio, stats.interval_ratio / self.backoff_factor
+            )
+        else:
+            stats.interval_ratio = min(
+                self.max_interval_ratio, stats.interval_ratio * self.backoff_factor
+            )
+
+    @callback
+    def async_get_interval(
+        self, coordinator: DataUpdateCoordinator[Any], update_interval: timedelta
+    ) -> float:
+        """Return the current refresh interval of a coordinator in seconds."""
+        seconds = update_interval.total_seconds()
+        if (stats := self._stats.get(coordinator)) is None:
+            return seconds
+        return seconds * stats.interval_ratio
+
+    @callback
+    def async_diagnostics(self) -> list[dict[str, Any]]:
+        """Return the statistics of all coordinators for diagnostics."""
+        return [
+            {
+                "name": coordinator.name,
+                "group_key": coordinator.group_key,
+                "update_interval": (
+                    coordinator.update_interval.total_seconds()
+                    if coordinator.update_interval
+                    else None
+                ),
+                **stats.as_dict(),
+            }
+            for coordinator, stats in self._stats.items()
+        ]
+
+
 class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     """Class to manage fetching data from single endpoint.
 
     Setting :attr:`always_update` to ``False`` will cause coordinator to only
     callback listeners when data has changed. This requires that the data
     implements ``__eq__`` or uses a python object that already does.
+
+    Passing a :class:`DataUpdateCoordinatorGroup` makes the refresh interval
+    adaptive and records refresh statistics. Coordinators in a group with the
+    same ``group_key`` share overlapping fetches.
     """
 
     def __init__(
@@ -71,6 +243,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         update_method: Callable[[], Awaitable[_DataT]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        group: DataUpdateCoordinatorGroup | None = None,
+        group_key: Hashable | None = None,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -82,6 +256,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self.config_entry = config_entries.current_entry.get()
         self.always_update = always_update
         self._next_refresh: float | None = None
+        self.group = group
+        self.group_key = group_key
+        if group is not None:
+            group.async_add(self)
 
         # It's None before the first successful update.
         # Components should call async_config_entry_first_refresh
@@ -175,6 +353,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     async def async_shutdown(self) -> None:
         """Cancel any scheduled call, and ignore new runs."""
         self._shutdown_requested = True
+        if self.group is not None:
+            self.group.async_remove(self)
         self._async_unsub_refresh()
         self._async_unsub_shutdown()
         await self._debounced_refresh.async_shutdown()
@@ -222,7 +402,12 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         now = self.hass.loop.time()
         if self._next_refresh is None or self._next_refresh <= now:
             self._next_refresh = int(now) + self._microsecond
-        self._next_refresh += self.update_interval.total_seconds()
+        if self.group is not None:
+            self._next_refresh += self.group.async_get_interval(
+                self, self.update_interval
+            )
+        else:
+            self._next_refresh += self.update_interval.total_seconds()
         self._unsub_refresh = event.async_call_at(
             self.hass,
             self._job,
@@ -282,7 +467,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if self._shutdown_requested or scheduled and self.hass.is_stopping:
             return
 
-        if log_timing := self.logger.isEnabledFor(logging.DEBUG):
+        log_timing = self.logger.isEnabledFor(logging.DEBUG)
+        if log_timing or self.group is not None:
             start = monotonic()
 
         auth_failed = False
@@ -290,7 +476,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         previous_data = self.data
 
         try:
-            self.data = await self._async_update_data()
+            if self.group is not None:
+                self.data = await self.group.async_fetch(self, self._async_update_data)
+            else:
+                self.data = await self._async_update_data()
 
         except (asyncio.TimeoutError, requests.exceptions.Timeout) as err:
             self.last_exception = err
@@ -371,6 +560,13 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
                 self.logger.info("Fetching %s data recovered", self.name)
 
         finally:
+            if self.group is not None:
+                self.group.async_record_refresh(
+                    self,
+                    monotonic() - start,
+                    self.last_update_success,
+                    previous_data != self.data,
+                )
             if log_timing:
                 self.logger.debug(
                     "Finished fetching %s data in %.3f seconds (success: %s)",
@@ -8,11 +8,24 @@ from collections.abc import Callable
 from contextlib import suppress
 import json
 import logging
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 from typing import TypeVar
 
+from aiohttp import hdrs, web
+from aiohttp.test_utils import make_mocked_request
+
 from homeassistant import core
+from homeassistant.auth import auth_manager_from_config
+from homeassistant.components.http.auth import async_setup_auth
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import (
+    condition,
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+    script,
+)
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
@@ -301,6 +314,203 @@ async def valid_entity_id(hass):
     return timer() - start
 
 
+@benchmark
+async def entity_service_schema(hass):
+    """Validate 100k light service call payloads against an entity service schema."""
+    schema = cv.make_entity_service_schema(
+        {"brightness": cv.positive_int, "transition": cv.time_period}
+    )
+    payloads = [
+        {"entity_id": "light.kitchen", "brightness": 100, "transition": 2},
+        {"entity_id": ["light.kitchen", "light.hall"], "transition": "00:00:02"},
+        {"entity_id": "all", "brightness": 10},
+    ]
+
+    start = timer()
+    for i in range(10**5):
+        schema(payloads[i % 3])
+    return timer() - start
+
+
+@benchmark
+async def service_call_validation(hass):
+    """Call a service with a validated schema 100k times."""
+    schema = cv.make_entity_service_schema(
+        {"brightness": cv.positive_int, "transition": cv.time_period}
+    )
+
+    async def handle_service(call):
+        """Handle the service call."""
+
+    hass.services.async_register("light", "turn_on", handle_service, schema)
+    data = {"entity_id": "light.kitchen", "brightness": 100, "transition": 2}
+
+    start = timer()
+    for _ in range(10**5):
+        await hass.services.async_call("light", "turn_on", data, blocking=True)
+    return timer() - start
+
+
+@benchmark
+async def auth_middleware(hass):
+    """Authenticate 100k requests with a bearer token through the auth middleware."""
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        await dr.async_load(hass)
+        await er.async_load(hass)
+        hass.auth = await auth_manager_from_config(hass, [], [])
+        app = web.Application()
+        await async_setup_auth(hass, app)
+        middleware = app.middlewares[-1]
+
+        user = await hass.auth.async_create_user("Benchmark")
+        refresh_token = await hass.auth.async_create_refresh_token(user, "client")
+        access_token = hass.auth.async_create_access_token(refresh_token)
+        request = make_mocked_request(
+            "GET", "/api/", headers={hdrs.AUTHORIZATION: f"Bearer {access_token}"}
+        )
+
+        async def handler(request):
+            """Return an empty response."""
+            return web.Response()
+
+        start = timer()
+        for _ in range(10**5):
+            await middleware(request, handler)
+        return timer() - start
+
+
+@benchmark
+async def evaluate_conditions(hass):
+    """Evaluate 100k condition trees mixing state, numeric and template checks."""
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    hass.states.async_set("sensor.temperature", "21.5")
+    hass.states.async_set("input_boolean.guest_mode", "off")
+    check = await condition.async_from_config(
+        hass,
+        cv.CONDITION_SCHEMA(
+            {
+                "condition": "and",
+                "conditions": [
+                    "{{ is_state('input_boolean.guest_mode', 'off') }}",
+                    {
+                        "condition": "numeric_state",
+                        "entity_id": "sensor.temperature",
+                        "above": 18,
+                        "below": 25,
+                    },
+                    {
+                        "condition": "or",
+                        "conditions": [
+                            {
+                                "condition": "state",
+                                "entity_id": "light.kitchen",
+                                "state": "off",
+                            },
+                            {
+                                "condition": "state",
+                                "entity_id": "light.kitchen",
+                                "attribute": "brightness",
+                                "state": 100,
+                            },
+                        ],
+                    },
+                ],
+            }
+        ),
+    )
+    variables = {"trigger": {"platform": "event"}}
+
+    start = timer()
+    for _ in range(10**5):
+        check(hass, variables)
+    return timer() - start
+
+
+async def _run_10_step_script(hass, script_mode):
+    """Run a 10 step script 10k times in a script mode."""
+    hass.states.async_set("sensor.temperature", "21.5")
+
+    @core.callback
+    def callback_service(call):
+        """Handle a service call without awaiting anything."""
+
+    async def async_service(call):
+        """Handle a service call."""
+
+    hass.services.async_register("test", "callback", callback_service)
+    hass.services.async_register("test", "async", async_service)
+    script_obj = script.Script(
+        hass,
+        cv.SCRIPT_SCHEMA(
+            [
+                {"variables": {"target": 20}},
+                {"condition": "template", "value_template": "{{ target > 10 }}"},
+                {"service": "test.callback", "data": {"value": "{{ target }}"}},
+                {"event": "test_event", "event_data": {"target": "{{ target }}"}},
+                {"service": "test.async"},
+                {
+                    "condition": "numeric_state",
+                    "entity_id": "sensor.temperature",
+                    "above": 18,
+                },
+                {"service": "test.callback"},
+                {"variables": {"target": "{{ target + 1 }}"}},
+                {"event": "test_event"},
+                {"service": "test.callback", "data": {"value": "{{ target }}"}},
+            ]
+        ),
+        "Benchmark",
+        "benchmark",
+        script_mode=script_mode,
+        max_runs=10,
+    )
+    context = core.Context()
+
+    start = timer()
+    if script_mode == script.SCRIPT_MODE_SINGLE:
+        for _ in range(10**4):
+            await script_obj.async_run(context=context)
+    else:
+        for _ in range(10**3):
+            await asyncio.gather(
+                *(script_obj.async_run(context=context) for _ in range(10))
+            )
+    return timer() - start
+
+
+@benchmark
+async def script_single(hass):
+    """Run a 10 step script 10k times in single mode."""
+    return await _run_10_step_script(hass, script.SCRIPT_MODE_SINGLE)
+
+
+@benchmark
+async def script_queued(hass):
+    """Run a 10 step script 10k times in queued mode, 10 runs at a time."""
+    return await _run_10_step_script(hass, script.SCRIPT_MODE_QUEUED)
+
+
+@benchmark
+async def script_parallel(hass):
+    """Run a 10 step script 10k times in parallel mode, 10 runs at a time."""
+    return await _run_10_step_script(hass, script.SCRIPT_MODE_PARALLEL)
+
+
+@benchmark
+async def states_by_domain(hass):
+    """Count and list the states of a domain 10k times with 5k states."""
+    for domain in ("sensor", "binary_sensor", "light", "switch", "automation"):
+        for i in range(1000):
+            hass.states.async_set(f"{domain}.entity_{i}", "on")
+
+    start = timer()
+    for _ in range(10**4):
+        hass.states.async_entity_ids_count("light")
+        hass.states.async_all("light")
+    return timer() - start
+
+
 @benchmark
 async def json_serialize_states(hass):
     """Serialize million states with websocket default encoder."""
@@ -314,6 +524,57 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def discovery_matching(hass):
+    """Replay 100k zeroconf and dhcp discoveries through the matchers."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import dhcp, zeroconf
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.generated.dhcp import DHCP
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.generated.zeroconf import ZEROCONF
+
+    services = [
+        ("_http._tcp.local.", "shellyplug-s-c8c9a3._http._tcp.local.", {}),
+        ("_http._tcp.local.", "brother printer._http._tcp.local.", {"ty": "hl"}),
+        ("_http._tcp.local.", "nas._http._tcp.local.", {"vendor": "synology"}),
+        (
+            "_airplay._tcp.local.",
+            "living room._airplay._tcp.local.",
+            {"manufacturer": "apple", "model": "appletv6,2"},
+        ),
+        ("_googlecast._tcp.local.", "chromecast-1234._googlecast._tcp.local.", {}),
+        ("_hap._tcp.local.", "bridge._hap._tcp.local.", {"md": "bridge"}),
+        ("_spotify-connect._tcp.local.", "kitchen._spotify-connect._tcp.local.", {}),
+        ("_printer._tcp.local.", "office._printer._tcp.local.", {}),
+    ]
+    clients = [
+        ("B8B7F1A1B2C3", "connect"),
+        ("ACCC8E123456", "axis-accc8e123456"),
+        ("001A2B3C4D5E", "android-5e4f3a2b1c"),
+        ("DCA632AABBCC", "raspberrypi"),
+        ("F0B429123456", "iphone"),
+        ("3C6105A1B2C3", "esp_a1b2c3"),
+    ]
+    zeroconf_index = zeroconf.ZeroconfMatcherIndex(ZEROCONF)
+    dhcp_index = dhcp.DHCPMatcherIndex(DHCP)
+    services_size = len(services)
+    clients_size = len(clients)
+    no_devices: set[str] = set()
+
+    start = timer()
+
+    for i in range(10**5):
+        service_type, name, props = services[i % services_size]
+        zeroconf_index.match(service_type, {"name": name.lower()}, props)
+        mac, hostname = clients[i % clients_size]
+        dhcp_index.match(mac, hostname, no_devices)
+
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
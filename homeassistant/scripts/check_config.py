@@ -81,6 +81,12 @@ def run(script_args: list) -> int:
     parser.add_argument(
         "-s", "--secrets", action="store_true", help="Show secret information"
     )
+    parser.add_argument(
+        "-t",
+        "--timings",
+        action="store_true",
+        help="Show how long validating the config of each integration took",
+    )
 
     args, unknown = parser.parse_known_args()
     if unknown:
@@ -90,7 +96,7 @@ def run(script_args: list) -> int:
 
     print(color("bold", "Testing configuration at", config_dir))
 
-    res = check(config_dir, args.secrets)
+    res = check(config_dir, args.secrets, args.timings)
 
     domain_info: list[str] = []
     if args.info:
@@ -109,6 +115,15 @@ def run(script_args: list) -> int:
             the_color = "" if yfn in res["yaml_files"] else "red"
             print(color(the_color, "-", yfn))
 
+    if args.timings and "components" in res:
+        print(color(C_HEAD, "Validation times"))
+        for domain, validation_time in sorted(
+            res["components"].validation_times.items(),
+            key=lambda item: item[1],
+            reverse=True,
+        ):
+            print(f" - {domain}: {validation_time:.3f}s")
+
     if res["except"]:
         print(color("bold_white", "Failed config"))
         for domain, config in res["except"].items():
@@ -155,7 +170,7 @@ def run(script_args: list) -> int:
     return len(res["except"])
 
 
-def check(config_dir, secrets=False):
+def check(config_dir, secrets=False, timings=False):
     """Perform a check by mocking hass load functions."""
     logging.getLogger("homeassistant.loader").setLevel(logging.CRITICAL)
     res: dict[str, Any] = {
@@ -167,8 +182,11 @@ def check(config_dir, secrets=False):
     }
 
     # pylint: disable=possibly-unused-variable
-    def mock_load(filename, secrets=None):
-        """Mock hass.util.load_yaml to save config file names."""
+    def mock_load(filename, secrets=None, cache=None):
+        """Mock hass.util.load_yaml to save config file names.
+
+        The cache is not used so all included files are loaded through here.
+        """
         res["yaml_files"][filename] = True
         return MOCKS["load"][1](filename, secrets)
 
@@ -206,7 +224,7 @@ def check(config_dir, secrets=False):
 
     try:
         with patch.object(yaml_loader, "Secrets", secrets_proxy):
-            res["components"] = asyncio.run(async_check_config(config_dir))
+            res["components"] = asyncio.run(async_check_config(config_dir, timings))
         res["secret_cache"] = {
             str(key): val for key, val in res["secret_cache"].items()
         }
@@ -230,7 +248,7 @@ def check(config_dir, secrets=False):
     return res
 
 
-async def async_check_config(config_dir):
+async def async_check_config(config_dir, timings=False):
     """Check the HA config."""
     hass = core.HomeAssistant(config_dir)
     loader.async_setup(hass)
@@ -239,7 +257,7 @@ async def async_check_config(config_dir):
     await dr.async_load(hass)
     await er.async_load(hass)
     await ir.async_load(hass, read_only=True)
-    components = await async_check_ha_config_file(hass)
+    components = await async_check_ha_config_file(hass, timings)
     await hass.async_stop(force=True)
     return components
 
@@ -0,0 +1,69 @@
+"""Match strings against sets of fnmatch style glob patterns."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from fnmatch import translate
+import re
+from typing import Any
+
+from lru import LRU  # pylint: disable=no-name-in-module
+
+# Number of strings for which the matching patterns are remembered
+DEFAULT_CACHE_SIZE = 1024
+
+
+def _no_match(name: str) -> None:
+    """Match nothing."""
+    return None
+
+
+class GlobSet:
+    """A set of glob patterns compiled into combined regular expressions.
+
+    Whether any pattern matches a string is checked with one alternation of
+    all patterns. Which patterns match is found with one expression of an
+    optional lookahead per pattern, each capturing when its pattern matches.
+    Either way a string is run through a single compiled expression instead
+    of through an expression per pattern. As the same strings tend to be
+    matched over and over, the matching patterns of recent strings are kept.
+    """
+
+    __slots__ = ("patterns", "match", "_each", "_cache")
+
+    def __init__(
+        self, patterns: Iterable[str], cache_size: int = DEFAULT_CACHE_SIZE
+    ) -> None:
+        """Compile the patterns."""
+        self.patterns: tuple[str, ...] = tuple(dict.fromkeys(patterns))
+        # Return a truthy value if any of the patterns matches
+        self.match: Callable[[str], Any] = _no_match
+        self._each: re.Pattern[str] | None = None
+        self._cache: LRU = LRU(cache_size)
+        if not self.patterns:
+            return
+        translated = [translate(pattern) for pattern in self.patterns]
+        self.match = re.compile("|".join(translated)).match
+        self._each = re.compile(
+            "".join(f"(?:(?=({pattern})))?" for pattern in translated)
+        )
+
+    def __len__(self) -> int:
+        """Return the number of patterns."""
+        return len(self.patterns)
+
+    def matching(self, name: str) -> frozenset[str]:
+        """Return the patterns which match."""
+        if (matching := self._cache.get(name)) is not None:
+            return matching
+        if self._each is None or not self.match(name):
+            matching = frozenset()
+        else:
+            match = self._each.match(name)
+            assert match is not None
+            matching = frozenset(
+                pattern
+                for pattern, group in zip(self.patterns, match.groups())
+                if group is not None
+            )
+        self._cache[name] = matching
+        return matching
@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
+from dataclasses import dataclass
 import fnmatch
-from io import StringIO, TextIOWrapper
+from io import StringIO, TextIOWrapper, UnsupportedOperation
 import logging
+import math
 import os
 from pathlib import Path
 from typing import Any, TextIO, TypeVar, overload
@@ -104,7 +106,12 @@ class Secrets:
 class SafeLoader(FastestAvailableSafeLoader):
     """The fastest available safe loader."""
 
-    def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+    def __init__(
+        self,
+        stream: Any,
+        secrets: Secrets | None = None,
+        cache: YamlCache | None = None,
+    ) -> None:
         """Initialize a safe line loader."""
         self.stream = stream
         if isinstance(stream, str):
@@ -115,6 +122,7 @@ class SafeLoader(FastestAvailableSafeLoader):
             self.name = getattr(stream, "name", "<file>")
         super().__init__(stream)
         self.secrets = secrets
+        self.cache = cache
 
     def get_name(self) -> str:
         """Get the name of the loader."""
@@ -128,10 +136,16 @@ class SafeLoader(FastestAvailableSafeLoader):
 class SafeLineLoader(yaml.SafeLoader):
     """Loader class that keeps track of line numbers."""
 
-    def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+    def __init__(
+        self,
+        stream: Any,
+        secrets: Secrets | None = None,
+        cache: YamlCache | None = None,
+    ) -> None:
         """Initialize a safe line loader."""
         super().__init__(stream)
         self.secrets = secrets
+        self.cache = cache
 
     def compose_node(  # type: ignore[override]
         self, parent: yaml.nodes.Node, index: int
@@ -156,8 +170,181 @@ class SafeLineLoader(yaml.SafeLoader):
 LoaderType = SafeLineLoader | SafeLoader
 
 
-def load_yaml(fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
+@dataclass(slots=True, frozen=True)
+class _DeferredTag:
+    """Tag that is resolved every time a cached YAML file is loaded.
+
+    Includes, secrets and environment variables can change without the file
+    that references them changing, so they are kept unresolved in the cache.
+    """
+
+    tag: str
+    value: str
+    line: int
+    mark: str
+
+
+class YamlCache:
+    """Cache of parsed YAML files keyed by path, modification time and size.
+
+    Files are stored as a tree of JSON serializable values which keeps the
+    line numbers of the nodes and the unresolved tags, so loading a file
+    from the cache does not need to parse it again.
+    """
+
+    def __init__(self, data: dict[str, list[Any]] | None = None) -> None:
+        """Initialize the cache with previously stored data."""
+        self._entries: dict[str, list[Any]] = data or {}
+        self._used: set[str] = set()
+        self.dirty = False
+
+    def as_dict(self) -> dict[str, list[Any]]:
+        """Return the data to store of the files that have been loaded."""
+        return {
+            fname: entry
+            for fname, entry in dict(self._entries).items()
+            if fname in self._used
+        }
+
+    def load(self, fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
+        """Load a YAML file, only parsing it if it changed since it was cached."""
+        try:
+            with open(fname, encoding="utf-8") as conf_file:
+                try:
+                    stat = os.fstat(conf_file.fileno())
+                except (AttributeError, UnsupportedOperation):
+                    # Not a real file, don't cache it
+                    return parse_yaml(conf_file, secrets)
+
+                self._used.add(fname)
+                entry = self._entries.get(fname)
+                if (
+                    entry is None
+                    or entry[0] != stat.st_mtime_ns
+                    or entry[1] != stat.st_size
+                ):
+                    try:
+                        tree = _encode_cache_tree(
+                            _parse_yaml_fastest(conf_file, secrets, self)
+                        )
+                    except TypeError:
+                        # Contains values we can't cache
+                        self._entries.pop(fname, None)
+                        conf_file.seek(0, 0)
+                        return parse_yaml(conf_file, secrets)
+                    entry = [stat.st_mtime_ns, stat.st_size, tree]
+                    self._entries[fname] = entry
+                    self.dirty = True
+        except UnicodeDecodeError as exc:
+            _LOGGER.error("Unable to read file %s: %s", fname, exc)
+            raise HomeAssistantError(exc) from exc
+
+        return _decode_cache_tree(entry[2], fname, secrets, self)
+
+
+def _encode_cache_tree(obj: Any) -> Any:
+    """Encode a parsed YAML tree into JSON serializable values.
+
+    Lists are used as tagged nodes, so every list is tagged by its first item.
+    Raises TypeError for values that can't be cached.
+    """
+    if obj is None or isinstance(obj, (bool, int)):
+        return obj
+    if isinstance(obj, str):
+        if obj.__class__ is not str:
+            raise TypeError
+        return obj
+    if isinstance(obj, float):
+        if math.isfinite(obj):
+            return obj
+        return ["f", repr(obj)]
+    if isinstance(obj, NodeDictClass):
+        encoded: list[Any] = ["d", getattr(obj, "__line__", None)]
+        for key, value in obj.items():
+            encoded.append(_encode_cache_tree(key))
+            encoded.append(_encode_cache_tree(value))
+        return encoded
+    if isinstance(obj, NodeListClass):
+        return [
+            "l",
+            getattr(obj, "__line__", None),
+            *(_encode_cache_tree(item) for item in obj),
+        ]
+    if isinstance(obj, Input):
+        return ["i", obj.name]
+    if isinstance(obj, _DeferredTag):
+        return ["!", obj.tag, obj.value, obj.line, obj.mark]
+    raise TypeError
+
+
+def _decode_cache_tree(
+    obj: Any, fname: str, secrets: Secrets | None, cache: YamlCache
+) -> Any:
+    """Decode a cached YAML tree, resolving the deferred tags."""
+    if not isinstance(obj, list):
+        return obj
+    kind = obj[0]
+    if kind == "d":
+        mapping = NodeDictClass()
+        values = iter(obj[2:])
+        for key in values:
+            decoded_key = _decode_cache_tree(key, fname, secrets, cache)
+            mapping[decoded_key] = _decode_cache_tree(
+                next(values), fname, secrets, cache
+            )
+        return _add_file_reference(mapping, fname, obj[1])
+    if kind == "l":
+        return _add_file_reference(
+            NodeListClass(
+                _decode_cache_tree(item, fname, secrets, cache) for item in obj[2:]
+            ),
+            fname,
+            obj[1],
+        )
+    if kind == "f":
+        return float(obj[1])
+    if kind == "i":
+        return Input(obj[1])
+    return _resolve_deferred_tag(
+        _DeferredTag(obj[1], obj[2], obj[3], obj[4]), fname, secrets, cache
+    )
+
+
+def _resolve_deferred_tag(
+    deferred: _DeferredTag,
+    fname: str,
+    secrets: Secrets | None,
+    cache: YamlCache | None,
+) -> JSON_TYPE:
+    """Resolve a tag of a file loaded from the cache."""
+    tag = deferred.tag
+    if tag == "!secret":
+        if secrets is None:
+            raise HomeAssistantError("Secrets not supported in this YAML file")
+        return secrets.get(fname, deferred.value)
+    if tag == "!env_var":
+        return _env_var(deferred.value)
+    path = os.path.join(os.path.dirname(fname), deferred.value)
+    if tag == "!include":
+        try:
+            loaded = load_yaml(path, secrets, cache)
+        except FileNotFoundError as exc:
+            raise HomeAssistantError(
+                f"{deferred.mark}: Unable to read file {path}."
+            ) from exc
+    else:
+        loaded = _INCLUDE_DIR_LOADERS[tag](path, secrets, cache)
+        if tag == "!include_dir_list":
+            return loaded
+    return _add_file_reference(loaded, fname, deferred.line)
+
+
+def load_yaml(
+    fname: str, secrets: Secrets | None = None, cache: YamlCache | None = None
+) -> JSON_TYPE:
     """Load a YAML file."""
+    if cache is not None:
+        return cache.load(fname, secrets)
     try:
         with open(fname, encoding="utf-8") as conf_file:
             return parse_yaml(conf_file, secrets)
@@ -170,25 +357,40 @@ def parse_yaml(
     content: str | TextIO | StringIO, secrets: Secrets | None = None
 ) -> JSON_TYPE:
     """Parse YAML with the fastest available loader."""
+    return _parse_yaml_fastest(content, secrets)
+
+
+def _parse_yaml_fastest(
+    content: str | TextIO | StringIO,
+    secrets: Secrets | None = None,
+    cache: YamlCache | None = None,
+) -> JSON_TYPE:
+    """Parse YAML with the fastest available loader.
+
+    When a cache is passed, includes, secrets and environment variables
+    are returned as deferred tags.
+    """
     if not HAS_C_LOADER:
-        return _parse_yaml_pure_python(content, secrets)
+        return _parse_yaml_pure_python(content, secrets, cache)
     try:
-        return _parse_yaml(SafeLoader, content, secrets)
+        return _parse_yaml(SafeLoader, content, secrets, cache)
     except yaml.YAMLError:
         # Loading failed, so we now load with the slow line loader
         # since the C one will not give us line numbers
         if isinstance(content, (StringIO, TextIO, TextIOWrapper)):
             # Rewind the stream so we can try again
             content.seek(0, 0)
-        return _parse_yaml_pure_python(content, secrets)
+        return _parse_yaml_pure_python(content, secrets, cache)
 
 
 def _parse_yaml_pure_python(
-    content: str | TextIO | StringIO, secrets: Secrets | None = None
+    content: str | TextIO | StringIO,
+    secrets: Secrets | None = None,
+    cache: YamlCache | None = None,
 ) -> JSON_TYPE:
     """Parse YAML with the pure python loader (this is very slow)."""
     try:
-        return _parse_yaml(SafeLineLoader, content, secrets)
+        return _parse_yaml(SafeLineLoader, content, secrets, cache)
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc) from exc
@@ -198,16 +400,24 @@ def _parse_yaml(
     loader: type[SafeLoader] | type[SafeLineLoader],
     content: str | TextIO,
     secrets: Secrets | None = None,
+    cache: YamlCache | None = None,
 ) -> JSON_TYPE:
     """Load a YAML file."""
     # If configuration file is empty YAML returns None
     # We convert that to an empty dict
     return (
-        yaml.load(content, Loader=lambda stream: loader(stream, secrets))
+        yaml.load(content, Loader=lambda stream: loader(stream, secrets, cache))
         or NodeDictClass()
     )
 
 
+def _defer_tag(loader: LoaderType, node: yaml.nodes.Node) -> _DeferredTag:
+    """Return a tag to be resolved when the file is loaded from the cache."""
+    return _DeferredTag(
+        node.tag, node.value, node.start_mark.line, str(node.start_mark)
+    )
+
+
 @overload
 def _add_reference(
     obj: list | NodeListClass,
@@ -235,12 +445,19 @@ def _add_reference(  # type: ignore[no-untyped-def]
     obj, loader: LoaderType, node: yaml.nodes.Node
 ):
     """Add file reference information to an object."""
+    return _add_file_reference(obj, loader.get_name(), node.start_mark.line)
+
+
+def _add_file_reference(  # type: ignore[no-untyped-def]
+    obj, fname: str, line: int | None
+):
+    """Add the file name and line an object was loaded from."""
     if isinstance(obj, list):
         obj = NodeListClass(obj)
     if isinstance(obj, str):
         obj = NodeStrClass(obj)
-    setattr(obj, "__config_file__", loader.get_name())
-    setattr(obj, "__line__", node.start_mark.line)
+    setattr(obj, "__config_file__", fname)
+    setattr(obj, "__line__", line)
     return obj
 
 
@@ -251,6 +468,8 @@ def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
         device_tracker: !include device_tracker.yaml
 
     """
+    if loader.cache is not None:
+        return _defer_tag(loader, node)
     fname = os.path.join(os.path.dirname(loader.get_name()), node.value)
     try:
         return _add_reference(load_yaml(fname, loader.secrets), loader, node)
@@ -275,58 +494,104 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
-def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> NodeDictClass:
+def _load_dir_named(
+    loc: str, secrets: Secrets | None, cache: YamlCache | None
+) -> NodeDictClass:
     """Load multiple files from directory as a dictionary."""
     mapping = NodeDictClass()
-    loc = os.path.join(os.path.dirname(loader.get_name()), node.value)
     for fname in _find_files(loc, "*.yaml"):
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        mapping[filename] = load_yaml(fname, loader.secrets)
-    return _add_reference(mapping, loader, node)
+        mapping[filename] = load_yaml(fname, secrets, cache)
+    return mapping
 
 
-def _include_dir_merge_named_yaml(
-    loader: LoaderType, node: yaml.nodes.Node
+def _load_dir_merge_named(
+    loc: str, secrets: Secrets | None, cache: YamlCache | None
 ) -> NodeDictClass:
     """Load multiple files from directory as a merged dictionary."""
     mapping = NodeDictClass()
-    loc = os.path.join(os.path.dirname(loader.get_name()), node.value)
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, secrets, cache)
         if isinstance(loaded_yaml, dict):
             mapping.update(loaded_yaml)
-    return _add_reference(mapping, loader, node)
+    return mapping
 
 
-def _include_dir_list_yaml(
-    loader: LoaderType, node: yaml.nodes.Node
+def _load_dir_list(
+    loc: str, secrets: Secrets | None, cache: YamlCache | None
 ) -> list[JSON_TYPE]:
     """Load multiple files from directory as a list."""
-    loc = os.path.join(os.path.dirname(loader.get_name()), node.value)
     return [
-        load_yaml(f, loader.secrets)
+        load_yaml(f, secrets, cache)
         for f in _find_files(loc, "*.yaml")
         if os.path.basename(f) != SECRET_YAML
     ]
 
 
-def _include_dir_merge_list_yaml(
-    loader: LoaderType, node: yaml.nodes.Node
-) -> JSON_TYPE:
+def _load_dir_merge_list(
+    loc: str, secrets: Secrets | None, cache: YamlCache | None
+) -> list[JSON_TYPE]:
     """Load multiple files from directory as a merged list."""
-    loc: str = os.path.join(os.path.dirname(loader.get_name()), node.value)
     merged_list: list[JSON_TYPE] = []
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, secrets, cache)
         if isinstance(loaded_yaml, list):
             merged_list.extend(loaded_yaml)
-    return _add_reference(merged_list, loader, node)
+    return merged_list
+
+
+_INCLUDE_DIR_LOADERS = {
+    "!include_dir_list": _load_dir_list,
+    "!include_dir_merge_list": _load_dir_merge_list,
+    "!include_dir_named": _load_dir_named,
+    "!include_dir_merge_named": _load_dir_merge_named,
+}
+
+
+def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> NodeDictClass:
+    """Load multiple files from directory as a dictionary."""
+    if loader.cache is not None:
+        return _defer_tag(loader, node)  # type: ignore[return-value]
+    loc = os.path.join(os.path.dirname(loader.get_name()), node.value)
+    return _add_reference(_load_dir_named(loc, loader.secrets, None), loader, node)
+
+
+def _include_dir_merge_named_yaml(
+    loader: LoaderType, node: yaml.nodes.Node
+) -> NodeDictClass:
+    """Load multiple files from directory as a merged dictionary."""
+    if loader.cache is not None:
+        return _defer_tag(loader, node)  # type: ignore[return-value]
+    loc = os.path.join(os.path.dirname(loader.get_name()), node.value)
+    return _add_reference(
+        _load_dir_merge_named(loc, loader.secrets, None), loader, node
+    )
+
+
+def _include_dir_list_yaml(
+    loader: LoaderType, node: yaml.nodes.Node
+) -> list[JSON_TYPE]:
+    """Load multiple files from directory as a list."""
+    if loader.cache is not None:
+        return _defer_tag(loader, node)  # type: ignore[return-value]
+    loc = os.path.join(os.path.dirname(loader.get_name()), node.value)
+    return _load_dir_list(loc, loader.secrets, None)
+
+
+def _include_dir_merge_list_yaml(
+    loader: LoaderType, node: yaml.nodes.Node
+) -> JSON_TYPE:
+    """Load multiple files from directory as a merged list."""
+    if loader.cache is not None:
+        return _defer_tag(loader, node)  # type: ignore[return-value]
+    loc: str = os.path.join(os.path.dirname(loader.get_name()), node.value)
+    return _add_reference(_load_dir_merge_list(loc, loader.secrets, None), loader, node)
 
 
 def _handle_mapping_tag(
@@ -373,19 +638,28 @@ def _construct_seq(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
 
 def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
-    args = node.value.split()
+    if loader.cache is not None:
+        return _defer_tag(loader, node)  # type: ignore[return-value]
+    return _env_var(node.value)
+
+
+def _env_var(value: str) -> str:
+    """Return the value of an environment variable."""
+    args = value.split()
 
     # Check for a default value
     if len(args) > 1:
         return os.getenv(args[0], " ".join(args[1:]))
     if args[0] in os.environ:
         return os.environ[args[0]]
-    _LOGGER.error("Environment variable %s not defined", node.value)
-    raise HomeAssistantError(node.value)
+    _LOGGER.error("Environment variable %s not defined", value)
+    raise HomeAssistantError(value)
 
 
 def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load secrets and embed it into the configuration YAML."""
+    if loader.cache is not None:
+        return _defer_tag(loader, node)  # type: ignore[return-value]
     if loader.secrets is None:
         raise HomeAssistantError("Secrets not supported in this YAML file")
 
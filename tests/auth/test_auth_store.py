@@ -258,3 +258,30 @@ async def test_loading_race_condition(hass: HomeAssistant) -> None:
         mock_dev_registry.assert_called_once_with(hass)
         mock_load.assert_called_once_with()
         assert results[0] == results[1]
+
+
+async def test_refresh_token_indexes(hass: HomeAssistant) -> None:
+    """Test refresh tokens are looked up through the indexes."""
+    store = auth_store.AuthStore(hass)
+    user = await store.async_create_user("Paulus")
+    other_user = await store.async_create_user("Other")
+    refresh_token = await store.async_create_refresh_token(user, "client")
+    other_refresh_token = await store.async_create_refresh_token(other_user, "client")
+
+    assert await store.async_get_refresh_token(refresh_token.id) is refresh_token
+    assert (
+        await store.async_get_refresh_token_by_token(refresh_token.token)
+        is refresh_token
+    )
+    assert await store.async_get_refresh_token("unknown") is None
+    assert await store.async_get_refresh_token_by_token("unknown") is None
+
+    await store.async_remove_refresh_token(refresh_token)
+    assert await store.async_get_refresh_token(refresh_token.id) is None
+    assert await store.async_get_refresh_token_by_token(refresh_token.token) is None
+
+    await store.async_remove_user(other_user)
+    assert await store.async_get_refresh_token(other_refresh_token.id) is None
+    assert (
+        await store.async_get_refresh_token_by_token(other_refresh_token.token) is None
+    )
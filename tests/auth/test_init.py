@@ -1298,3 +1298,65 @@ async def test_access_token_from_the_future(mock_hass) -> None:
     with freeze_time(now + timedelta(days=365)):
         rt = await manager.async_validate_access_token(access_token)
         assert rt.id == refresh_token.id
+
+
+async def test_verified_access_tokens_are_cached(mock_hass) -> None:
+    """Test a verified access token is not verified again until the TTL expires."""
+    now = dt_util.utcnow()
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    with patch(
+        "homeassistant.auth.jwt_wrapper.verify_and_decode",
+        wraps=auth.jwt_wrapper.verify_and_decode,
+    ) as mock_verify:
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+        assert mock_verify.call_count == 1
+
+        with freeze_time(now + timedelta(minutes=2)):
+            assert (
+                await manager.async_validate_access_token(access_token) is refresh_token
+            )
+        assert mock_verify.call_count == 2
+
+        # Tokens that failed verification are never cached
+        header, payload, signature = access_token.split(".")
+        invalid_token = f"{header}.{payload}.{'a' * len(signature)}"
+        assert await manager.async_validate_access_token(invalid_token) is None
+        assert await manager.async_validate_access_token(invalid_token) is None
+        assert mock_verify.call_count == 4
+
+
+async def test_verified_access_token_cache_invalidation(mock_hass) -> None:
+    """Test cached access tokens are forgotten on revocation and deactivation."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+    other_refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    other_access_token = manager.async_create_access_token(other_refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+    assert (
+        await manager.async_validate_access_token(other_access_token)
+        is other_refresh_token
+    )
+
+    await manager.async_remove_refresh_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is None
+    assert (
+        await manager.async_validate_access_token(other_access_token)
+        is other_refresh_token
+    )
+
+    await manager.async_deactivate_user(user)
+    assert await manager.async_validate_access_token(other_access_token) is None
+
+    await manager.async_activate_user(user)
+    assert (
+        await manager.async_validate_access_token(other_access_token)
+        is other_refresh_token
+    )
@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 from collections.abc import AsyncIterable, Generator
+import time
 from typing import Any
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -36,6 +37,16 @@ def mock_tts_cache_dir_autouse(mock_tts_cache_dir):
     return mock_tts_cache_dir
 
 
+@pytest.fixture(autouse=True)
+def mock_monotonic() -> Generator[None, None, None]:
+    """Make processing times in pipeline events stable for snapshots."""
+    with patch(
+        "homeassistant.components.assist_pipeline.pipeline.time",
+        Mock(wraps=time, monotonic=Mock(return_value=0.0)),
+    ):
+        yield
+
+
 class BaseProvider:
     """Mock STT provider."""
 
@@ -36,3 +36,15 @@ def test_ring_buffer_put_too_large() -> None:
     assert len(rb) == 10
     assert rb.pos == 2
     assert rb.getvalue() == bytes([3, 4, 5, 6, 7, 8, 9, 10, 11, 12])
+
+
+def test_ring_buffer_put_memoryview() -> None:
+    """Test putting views of data into the buffer."""
+    rb = RingBuffer(10)
+    data = memoryview(bytes([1, 2, 3, 4, 5, 6, 7, 8]))
+    rb.put(data[:4])
+    rb.put(data[4:])
+    rb.put(data[:4])
+    assert len(rb) == 10
+    assert rb.pos == 2
+    assert rb.getvalue() == bytes([3, 4, 5, 6, 7, 8, 1, 2, 3, 4])
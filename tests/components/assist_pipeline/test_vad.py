@@ -125,3 +125,22 @@ def test_chunk_samples_leftover() -> None:
 
     assert len(chunks) == 1
     assert leftover_chunk_buffer.bytes() == bytes([5, 6])
+
+
+def test_chunk_samples_views() -> None:
+    """Test that chunks within the samples are not copied."""
+    bytes_per_chunk = 2
+    samples = bytes([1, 2, 3, 4, 5])
+    leftover_chunk_buffer = AudioBuffer(bytes_per_chunk)
+    chunks = list(chunk_samples(samples, bytes_per_chunk, leftover_chunk_buffer))
+
+    assert chunks == [bytes([1, 2]), bytes([3, 4])]
+    assert all(chunk.obj is samples for chunk in chunks)
+    assert leftover_chunk_buffer.bytes() == bytes([5])
+
+    # The leftover chunk is copied as its buffer is reused
+    chunks = list(chunk_samples(samples, bytes_per_chunk, leftover_chunk_buffer))
+
+    assert chunks == [bytes([5, 1]), bytes([2, 3]), bytes([4, 5])]
+    assert isinstance(chunks[0], bytes)
+    assert leftover_chunk_buffer.bytes() == b""
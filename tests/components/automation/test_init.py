@@ -2538,3 +2538,47 @@ async def test_websocket_config(
     msg = await client.receive_json()
     assert not msg["success"]
     assert msg["error"]["code"] == "not_found"
+
+
+async def test_websocket_diagnostics(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test diagnostics command reports the state trigger index."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": ["test.a", "test.b"],
+                        "to": "on",
+                    },
+                    "action": {"service": "test.automation"},
+                },
+                {
+                    "trigger": {
+                        "platform": "numeric_state",
+                        "entity_id": "test.a",
+                        "above": 5,
+                    },
+                    "action": {"service": "test.automation"},
+                },
+            ]
+        },
+    )
+    hass.states.async_set("test.a", "on")
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "automation/diagnostics"})
+
+    msg = await client.receive_json()
+    assert msg["success"]
+    index = msg["result"]["state_trigger_index"]
+    assert index["entities"] == 2
+    assert index["listeners"] == 3
+    assert index["indexed_listeners"] == 2
+    assert index["state_changes"] == 1
+    assert index["dispatched"] == 2
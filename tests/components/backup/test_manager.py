@@ -1,16 +1,25 @@
 """Tests for the Backup integration."""
 from __future__ import annotations
 
+import asyncio
+from datetime import timedelta
 from pathlib import Path
+import tarfile
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
 from homeassistant.components.backup import BackupManager
-from homeassistant.components.backup.manager import BackupPlatformProtocol
+from homeassistant.components.backup.manager import (
+    CHUNKS_DIR,
+    MANIFEST_FILE,
+    BackupPlatformProtocol,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads_object
 
 from .common import TEST_BACKUP
 
@@ -267,3 +276,126 @@ async def test_exception_plaform_post(hass: HomeAssistant) -> None:
 
     with pytest.raises(HomeAssistantError):
         await _mock_backup_generation(manager)
+
+
+async def test_generate_incremental_backup(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test incremental backups only store changed chunks."""
+    config_dir = tmp_path / "config"
+    (config_dir / ".storage").mkdir(parents=True)
+    (config_dir / "configuration.yaml").write_text("default_config:\n")
+    (config_dir / ".storage" / "core.config").write_text("{}")
+    (config_dir / "home-assistant.log").write_text("not backed up")
+    (config_dir / "home-assistant_v2.db").write_bytes(b"live")
+    (config_dir / "home-assistant_v2.db-wal").write_bytes(b"wal")
+    hass.config.config_dir = str(config_dir)
+
+    async def _mock_snapshot(
+        hass: HomeAssistant, snapshot_dir: Path
+    ) -> dict[str, Path | None]:
+        snapshot_path = snapshot_dir / "home-assistant_v2.db"
+        snapshot_path.write_bytes(b"snapshot")
+        return {
+            "home-assistant_v2.db": snapshot_path,
+            "home-assistant_v2.db-wal": None,
+        }
+
+    pre_backup = AsyncMock()
+    await _setup_mock_domain(
+        hass,
+        Mock(
+            spec=["async_pre_backup", "async_post_backup", "async_backup_snapshot"],
+            async_pre_backup=pre_backup,
+            async_post_backup=AsyncMock(),
+            async_backup_snapshot=_mock_snapshot,
+        ),
+    )
+    manager = BackupManager(hass)
+    chunk_dir = manager.backup_dir / CHUNKS_DIR
+
+    def _read_manifest(path: Path) -> dict:
+        with tarfile.open(path, "r:") as backup_file:
+            return json_loads_object(backup_file.extractfile(MANIFEST_FILE).read())
+
+    first = await manager.generate_backup(incremental=True)
+    assert not pre_backup.called
+    files = _read_manifest(first.path)["files"]
+    assert set(files) == {
+        "configuration.yaml",
+        ".storage/core.config",
+        "home-assistant_v2.db",
+    }
+    assert len(list(chunk_dir.glob("*/*"))) == 3
+    assert not list(manager.backup_dir.glob(".snapshot-*"))
+
+    (config_dir / "configuration.yaml").write_text("homeassistant:\n")
+    with patch(
+        "homeassistant.components.backup.manager.dt_util.now",
+        return_value=dt_util.utcnow() + timedelta(seconds=1),
+    ):
+        second = await manager.generate_backup(incremental=True)
+    second_files = _read_manifest(second.path)["files"]
+    assert (
+        second_files["home-assistant_v2.db"]["chunks"]
+        == files["home-assistant_v2.db"]["chunks"]
+    )
+    assert second_files[".storage/core.config"] == files[".storage/core.config"]
+    assert second_files["configuration.yaml"] != files["configuration.yaml"]
+    assert len(list(chunk_dir.glob("*/*"))) == 4
+
+    await manager.load_backups()
+    assert set(manager.backups) == {first.slug, second.slug}
+    await manager.remove_backup(first.slug)
+    assert {chunk.name for chunk in chunk_dir.glob("*/*")} == {
+        chunk for entry in second_files.values() for chunk in entry["chunks"]
+    }
+
+
+async def test_incremental_backup_fails_without_snapshot(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test an incremental backup fails when a snapshot is missing."""
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    (config_dir / "home-assistant_v2.db").write_bytes(b"live")
+    hass.config.config_dir = str(config_dir)
+
+    async def _mock_snapshot(
+        hass: HomeAssistant, snapshot_dir: Path
+    ) -> dict[str, Path | None]:
+        return {"home-assistant_v2.db": snapshot_dir / "home-assistant_v2.db"}
+
+    await _setup_mock_domain(
+        hass,
+        Mock(
+            spec=["async_pre_backup", "async_post_backup", "async_backup_snapshot"],
+            async_backup_snapshot=_mock_snapshot,
+        ),
+    )
+    manager = BackupManager(hass)
+
+    with pytest.raises(HomeAssistantError, match="home-assistant_v2.db"):
+        await manager.generate_backup(incremental=True)
+    assert not list(manager.backup_dir.glob("*.tar"))
+    assert not manager.backing_up
+
+
+async def test_removing_chunks_waits_for_backup(hass: HomeAssistant) -> None:
+    """Test unreferenced chunks are not removed while chunks are written."""
+    manager = BackupManager(hass)
+    manager.backups = {TEST_BACKUP.slug: TEST_BACKUP}
+    manager.loaded_backups = True
+
+    with patch("pathlib.Path.exists", return_value=True), patch.object(
+        manager, "_remove_unreferenced_chunks"
+    ) as remove_chunks:
+        async with manager._chunks_lock:
+            remove_task = hass.async_create_task(
+                manager.remove_backup(TEST_BACKUP.slug)
+            )
+            while TEST_BACKUP.slug in manager.backups:
+                await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            assert not remove_chunks.called
+        await remove_task
+
+    assert remove_chunks.called
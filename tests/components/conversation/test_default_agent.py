@@ -229,6 +229,82 @@ async def test_unexposed_entities_skipped(
     assert result.response.matched_states[0].entity_id == exposed_light.entity_id
 
 
+async def test_slot_lists_updated_per_entity(
+    hass: HomeAssistant,
+    init_components,
+    area_registry: ar.AreaRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test only changed entities are updated in the slot lists."""
+    area_kitchen = area_registry.async_get_or_create("kitchen")
+    kitchen_light = entity_registry.async_get_or_create("light", "demo", "1234")
+    hass.states.async_set(
+        kitchen_light.entity_id, "off", {ATTR_FRIENDLY_NAME: "kitchen light"}
+    )
+    hass.states.async_set("light.bedroom", "off", {ATTR_FRIENDLY_NAME: "bedroom light"})
+    expose_entity(hass, kitchen_light.entity_id, True)
+    expose_entity(hass, "light.bedroom", True)
+    agent = await conversation._get_agent_manager(hass).async_get_agent(
+        conversation.HOME_ASSISTANT_AGENT
+    )
+    calls = async_mock_service(hass, "light", "turn_on")
+
+    result = await conversation.async_converse(
+        hass, "turn on bedroom light", None, Context(), None
+    )
+    assert result.response.response_type == intent.IntentResponseType.ACTION_DONE
+
+    with patch.object(
+        agent, "_update_entity_slot_values", wraps=agent._update_entity_slot_values
+    ) as mock_update:
+        entity_registry.async_update_entity(
+            kitchen_light.entity_id, aliases={"stove light"}, area_id=area_kitchen.id
+        )
+        result = await conversation.async_converse(
+            hass, "turn on stove light", None, Context(), None
+        )
+        assert result.response.response_type == intent.IntentResponseType.ACTION_DONE
+        result = await conversation.async_converse(
+            hass, "turn on lights in the kitchen", None, Context(), None
+        )
+        assert result.response.response_type == intent.IntentResponseType.ACTION_DONE
+        assert mock_update.call_count == 1
+
+        hass.states.async_remove("light.bedroom")
+        result = await conversation.async_converse(
+            hass, "turn on bedroom light", None, Context(), None
+        )
+        assert result.response.error_code == (
+            intent.IntentResponseErrorCode.NO_INTENT_MATCH
+        )
+        assert mock_update.call_count == 2
+
+    assert len(calls) == 3
+
+
+async def test_recognize_result_cached(hass: HomeAssistant, init_components) -> None:
+    """Test recognition results are reused until the slot lists change."""
+    hass.states.async_set("light.kitchen", "off", {ATTR_FRIENDLY_NAME: "kitchen light"})
+    expose_entity(hass, "light.kitchen", True)
+    agent = await conversation._get_agent_manager(hass).async_get_agent(
+        conversation.HOME_ASSISTANT_AGENT
+    )
+    async_mock_service(hass, "light", "turn_on")
+
+    with patch.object(agent, "_recognize", wraps=agent._recognize) as mock_recognize:
+        for _ in range(2):
+            await conversation.async_converse(
+                hass, "turn on kitchen light", None, Context(), None
+            )
+        assert mock_recognize.call_count == 1
+
+        hass.states.async_set("light.hall", "off")
+        await conversation.async_converse(
+            hass, "turn on kitchen light", None, Context(), None
+        )
+        assert mock_recognize.call_count == 2
+
+
 async def test_trigger_sentences(hass: HomeAssistant, init_components) -> None:
     """Test registering/unregistering/matching a few trigger sentences."""
     trigger_sentences = ["It's party time", "It is time to party"]
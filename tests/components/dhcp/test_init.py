@@ -994,3 +994,34 @@ async def test_aiodiscover_finds_new_hosts_after_interval(hass: HomeAssistant) -
         hostname="connect",
         macaddress="b8b7f16db533",
     )
+
+
+def test_matcher_index() -> None:
+    """Test the matcher index only returns matching matchers."""
+    matchers = [
+        {"domain": "oui", "macaddress": "B8B7F1*"},
+        {"domain": "oui_hostname", "hostname": "connect", "macaddress": "B8B7F1*"},
+        {"domain": "hostname", "hostname": "axis-*"},
+        {"domain": "wildcard", "hostname": "*zigate*"},
+        {"domain": "registered", "registered_devices": True},
+    ]
+    index = dhcp.DHCPMatcherIndex(matchers)
+
+    assert [
+        matcher["domain"] for matcher in index.match("B8B7F1123456", "connect", set())
+    ] == ["oui", "oui_hostname"]
+    assert [
+        matcher["domain"] for matcher in index.match("B8B7F1123456", "other", set())
+    ] == ["oui"]
+    assert [
+        matcher["domain"]
+        for matcher in index.match("ACCC8E123456", "axis-accc8e123456", set())
+    ] == ["hostname"]
+    assert [
+        matcher["domain"] for matcher in index.match("001122334455", "my-zigate", set())
+    ] == ["wildcard"]
+    assert [
+        matcher["domain"]
+        for matcher in index.match("001122334455", "host", {"registered"})
+    ] == ["registered"]
+    assert index.match("001122334455", "host", {"other"}) == []
@@ -1,12 +1,15 @@
 """Test the Energy websocket API."""
 from typing import Any
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from homeassistant.components.energy import data, is_configured
 from homeassistant.components.recorder import Recorder
-from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    statistics_during_period,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
@@ -1032,3 +1035,151 @@ async def test_fossil_energy_consumption_checks(
     assert msg["id"] == 2
     assert not msg["success"]
     assert msg["error"] == {"code": "invalid_end_time", "message": "Invalid end_time"}
+
+
+async def test_summary(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test the energy summary of all configured sources."""
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+
+    period1 = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 00:00:00"))
+    period2 = dt_util.as_utc(dt_util.parse_datetime("2021-09-30 23:00:00"))
+    period2_day_start = dt_util.as_utc(dt_util.parse_datetime("2021-09-30 00:00:00"))
+    period3 = dt_util.as_utc(dt_util.parse_datetime("2021-10-01 00:00:00"))
+    end = dt_util.as_utc(dt_util.parse_datetime("2021-11-01 00:00:00"))
+
+    def _statistics(sums: tuple[float, ...]) -> tuple[dict[str, Any], ...]:
+        return tuple(
+            {"start": start, "last_reset": None, "state": 0, "sum": sum_}
+            for start, sum_ in zip((period1, period2, period3), sums)
+        )
+
+    def _metadata(statistic_id: str, unit: str) -> dict[str, Any]:
+        return {
+            "has_mean": False,
+            "has_sum": True,
+            "name": None,
+            "source": "test",
+            "statistic_id": statistic_id,
+            "unit_of_measurement": unit,
+        }
+
+    async_add_external_statistics(
+        hass, _metadata("test:grid_import", "kWh"), _statistics((2, 3, 5))
+    )
+    async_add_external_statistics(
+        hass, _metadata("test:grid_cost", "EUR"), _statistics((1, 2, 4))
+    )
+    async_add_external_statistics(
+        hass, _metadata("test:solar", "Wh"), _statistics((1000, 3000, 6000))
+    )
+    async_add_external_statistics(
+        hass,
+        {**_metadata("test:fossil_percentage", "%"), "has_mean": True},
+        tuple(
+            {"start": start, "last_reset": None, "mean": mean}
+            for start, mean in ((period1, 10), (period2, 50), (period3, 20))
+        ),
+    )
+    await async_wait_recording_done(hass)
+
+    manager = await data.async_get_manager(hass)
+    await manager.async_update(
+        {
+            "energy_sources": [
+                {
+                    "type": "grid",
+                    "flow_from": [
+                        {
+                            "stat_energy_from": "test:grid_import",
+                            "stat_cost": "test:grid_cost",
+                            "entity_energy_price": None,
+                            "number_energy_price": None,
+                        }
+                    ],
+                    "flow_to": [],
+                    "cost_adjustment_day": 0,
+                },
+                {"type": "solar", "stat_energy_from": "test:solar"},
+            ]
+        }
+    )
+
+    client = await hass_ws_client()
+    query = {
+        "type": "energy/summary",
+        "start_time": period1.isoformat(),
+        "end_time": end.isoformat(),
+        "co2_statistic_id": "test:fossil_percentage",
+    }
+
+    def _summary(
+        grid: float, cost: float, solar: float, fossil: float
+    ) -> dict[str, Any]:
+        return {
+            "stats": {
+                "test:grid_import": grid,
+                "test:grid_cost": cost,
+                "test:solar": solar,
+            },
+            "totals": {"grid_consumption": grid, "cost": cost, "solar": solar},
+            "fossil_energy": pytest.approx(fossil),
+        }
+
+    expected_day = {
+        period1.isoformat(): _summary(2.0, 1.0, 1.0, 0.2),
+        period2_day_start.isoformat(): _summary(1.0, 1.0, 2.0, 0.5),
+        period3.isoformat(): _summary(2.0, 2.0, 3.0, 0.4),
+    }
+
+    with patch(
+        "homeassistant.components.recorder.statistics.statistics_during_period",
+        wraps=statistics_during_period,
+    ) as mock_statistics:
+        await client.send_json_auto_id({**query, "period": "day"})
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"] == expected_day
+        assert mock_statistics.call_count == 1
+
+        expected_month = {
+            period1.isoformat(): _summary(3.0, 2.0, 3.0, 0.7),
+            period3.isoformat(): _summary(2.0, 2.0, 3.0, 0.4),
+        }
+        await client.send_json_auto_id({**query, "period": "month"})
+        response = await client.receive_json()
+        assert response["result"] == expected_month
+        assert mock_statistics.call_count == 2
+
+        # Past periods are served from the cache
+        await client.send_json_auto_id({**query, "period": "month"})
+        response = await client.receive_json()
+        assert response["result"] == expected_month
+        assert mock_statistics.call_count == 2
+
+        # Periods without data are not cached
+        await client.send_json_auto_id({**query, "period": "day"})
+        response = await client.receive_json()
+        assert response["result"] == expected_day
+        assert mock_statistics.call_count == 3
+
+        # Statistics imported for a cached period are picked up
+        async_add_external_statistics(
+            hass,
+            _metadata("test:solar", "Wh"),
+            ({"start": period3, "last_reset": None, "state": 0, "sum": 7000},),
+        )
+        await async_wait_recording_done(hass)
+        await hass.async_block_till_done()
+
+        await client.send_json_auto_id({**query, "period": "month"})
+        response = await client.receive_json()
+        assert response["result"] == {
+            period1.isoformat(): _summary(3.0, 2.0, 3.0, 0.7),
+            period3.isoformat(): _summary(2.0, 2.0, 4.0, 0.4),
+        }
+        assert mock_statistics.call_count == 4
@@ -178,6 +178,37 @@ async def test_allgroup_turn_on_if_last_turns_on(hass: HomeAssistant) -> None:
     assert group_state.state == STATE_ON
 
 
+async def test_allgroup_counts_repeated_updates(hass: HomeAssistant) -> None:
+    """Test repeated member updates keep the on and assumed counts right."""
+    hass.states.async_set("light.Bowl", STATE_ON)
+    hass.states.async_set("light.Ceiling", STATE_OFF)
+
+    assert await async_setup_component(hass, "group", {})
+
+    test_group = await group.Group.async_create_group(
+        hass, "init_group", ["light.Bowl", "light.Ceiling"], False, mode=True
+    )
+
+    for state in (STATE_OFF, STATE_ON, STATE_ON):
+        hass.states.async_set("light.Ceiling", state, {"brightness": 1})
+        await hass.async_block_till_done()
+    hass.states.async_set("light.Bowl", STATE_ON, {ATTR_ASSUMED_STATE: True})
+    await hass.async_block_till_done()
+
+    assert hass.states.get(test_group.entity_id).state == STATE_ON
+    assert test_group._on_count == 2
+    assert test_group._assumed_count == 1
+    assert hass.states.get(test_group.entity_id).attributes[ATTR_ASSUMED_STATE]
+
+    hass.states.async_set("light.Bowl", STATE_OFF)
+    await hass.async_block_till_done()
+
+    assert hass.states.get(test_group.entity_id).state == STATE_OFF
+    assert test_group._on_count == 1
+    assert test_group._assumed_count == 0
+    assert ATTR_ASSUMED_STATE not in hass.states.get(test_group.entity_id).attributes
+
+
 async def test_expand_entity_ids(hass: HomeAssistant) -> None:
     """Test expand_entity_ids method."""
     hass.states.async_set("light.Bowl", STATE_ON)
@@ -235,6 +266,48 @@ async def test_expand_entity_ids_recursive(hass: HomeAssistant) -> None:
     )
 
 
+async def test_expand_entity_ids_nested_cycle(hass: HomeAssistant) -> None:
+    """Test expand_entity_ids with groups containing each other."""
+    hass.states.async_set(
+        "group.outer", STATE_ON, {"entity_id": ["light.a", "group.inner"]}
+    )
+    hass.states.async_set(
+        "group.inner", STATE_ON, {"entity_id": ["light.b", "group.outer", "light.a"]}
+    )
+
+    assert group.expand_entity_ids(hass, ["group.outer"]) == ["light.a", "light.b"]
+    assert group.expand_entity_ids(hass, ["group.inner"]) == ["light.b", "light.a"]
+
+
+async def test_expand_entity_ids_cache(hass: HomeAssistant) -> None:
+    """Test expanded groups are cached until members of a nested group change."""
+    hass.states.async_set("group.outer", STATE_ON, {"entity_id": ["group.inner"]})
+    hass.states.async_set("group.inner", STATE_ON, {"entity_id": ["light.a"]})
+
+    assert group.expand_entity_ids(hass, ["group.outer"]) == ["light.a"]
+    # The state of a group changing without its members does not
+    # invalidate the cache
+    members = hass.states.get("group.inner").attributes["entity_id"]
+    hass.states.async_set("group.inner", STATE_OFF, {"entity_id": members})
+
+    with patch(
+        "homeassistant.components.group._expand_entity_ids",
+        wraps=group._expand_entity_ids,
+    ) as mock_expand:
+        assert group.expand_entity_ids(hass, ["group.outer", "light.c"]) == [
+            "light.a",
+            "light.c",
+        ]
+        assert mock_expand.call_count == 1
+
+        hass.states.async_set("group.inner", STATE_ON, {"entity_id": ["light.b"]})
+        assert group.expand_entity_ids(hass, ["group.outer"]) == ["light.b"]
+        assert mock_expand.call_count == 4
+
+        hass.states.async_remove("group.inner")
+        assert group.expand_entity_ids(hass, ["group.outer"]) == []
+
+
 async def test_expand_entity_ids_ignores_non_strings(hass: HomeAssistant) -> None:
     """Test that non string elements in lists are ignored."""
     assert [] == group.expand_entity_ids(hass, [5, True])
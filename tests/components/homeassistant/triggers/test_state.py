@@ -1743,3 +1743,63 @@ async def test_variables_priority(
     await hass.async_block_till_done()
     assert len(calls) == 2
     assert calls[1].data["some"] == "test.entity_2 - 0:00:10"
+
+
+async def test_state_trigger_index(hass: HomeAssistant) -> None:
+    """Test the shared index only calls listeners that can match."""
+    index = state_trigger.async_get_state_trigger_index(hass)
+    calls = []
+
+    def listener(name):
+        def _listener(event, old_value, new_value):
+            calls.append((name, event.data["entity_id"], old_value, new_value))
+
+        return _listener
+
+    remove_on = index.async_add(["light.a", "light.b"], listener("on"), None, ["on"])
+    remove_any = index.async_add(["light.a"], listener("any"))
+    remove_attr = index.async_add(
+        ["light.a"], listener("brightness"), "brightness", [255]
+    )
+    assert index.async_diagnostics() | {
+        "average_match_time": 0,
+        "max_match_time": 0,
+    } == {
+        "entities": 2,
+        "listeners": 4,
+        "indexed_listeners": 3,
+        "state_changes": 0,
+        "dispatched": 0,
+        "average_match_time": 0,
+        "max_match_time": 0,
+    }
+
+    hass.states.async_set("light.a", "on", {"brightness": 100})
+    await hass.async_block_till_done()
+    assert calls == [("on", "light.a", None, "on"), ("any", "light.a", None, "on")]
+
+    calls.clear()
+    hass.states.async_set("light.a", "on", {"brightness": 255})
+    hass.states.async_set("light.b", "off")
+    hass.states.async_set("light.c", "on")
+    await hass.async_block_till_done()
+    assert calls == [
+        ("on", "light.a", "on", "on"),
+        ("any", "light.a", "on", "on"),
+        ("brightness", "light.a", 100, 255),
+    ]
+
+    diagnostics = index.async_diagnostics()
+    assert diagnostics["state_changes"] == 3
+    assert diagnostics["dispatched"] == 5
+    assert diagnostics["max_match_time"] >= diagnostics["average_match_time"] > 0
+
+    remove_on()
+    remove_any()
+    remove_attr()
+    assert index.async_diagnostics()["entities"] == 0
+
+    calls.clear()
+    hass.states.async_set("light.a", "off")
+    await hass.async_block_till_done()
+    assert calls == []
@@ -2,11 +2,14 @@
 
 This includes tests for all mock object types.
 """
+from datetime import timedelta
 from unittest.mock import Mock, patch
 
+from pyhap.accessory import get_topic
 import pytest
 
 from homeassistant.components.homekit.accessories import (
+    EVENT_COALESCE_WINDOW,
     HomeAccessory,
     HomeBridge,
     HomeDriver,
@@ -47,8 +50,9 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.event import TRACK_STATE_CHANGE_CALLBACKS
+import homeassistant.util.dt as dt_util
 
-from tests.common import async_mock_service
+from tests.common import async_fire_time_changed, async_mock_service
 
 
 async def test_accessory_cancels_track_state_change_on_stop(
@@ -768,3 +772,55 @@ def test_home_driver(iid_storage) -> None:
 
     mock_unpair.assert_called_with("client_uuid")
     mock_show_msg.assert_called_with("hass", "entry_id", "title (any)", pin, "X-HM://0")
+
+
+async def test_home_driver_coalesces_events(hass: HomeAssistant, hk_driver) -> None:
+    """Test characteristic changes are published in batches."""
+    hk_driver.topics[get_topic(1, 9)] = {("192.168.1.2", 51826)}
+    hk_driver.topics[get_topic(1, 10)] = {("192.168.1.2", 51826)}
+
+    def fire_window() -> None:
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=EVENT_COALESCE_WINDOW)
+        )
+
+    with patch.object(hk_driver, "async_send_event") as mock_send:
+        hk_driver.publish({"aid": 1, "iid": 9, "value": 1})
+        hk_driver.publish({"aid": 1, "iid": 9, "value": 2})
+        hk_driver.publish({"aid": 1, "iid": 10, "value": 3})
+        hk_driver.publish({"aid": 1, "iid": 11, "value": 4})
+        assert not mock_send.called
+
+        fire_window()
+        assert mock_send.call_count == 2
+        assert mock_send.call_args_list[0][0] == (
+            get_topic(1, 9),
+            {"aid": 1, "iid": 9, "value": 2},
+            None,
+            False,
+        )
+        assert mock_send.call_args_list[1][0][1] == {"aid": 1, "iid": 10, "value": 3}
+        assert hk_driver.event_counters[1].pushed == 2
+        assert hk_driver.event_counters[1].coalesced == 1
+
+        # Changes which end up at the published value are dropped
+        mock_send.reset_mock()
+        hk_driver.publish({"aid": 1, "iid": 9, "value": 5})
+        hk_driver.publish({"aid": 1, "iid": 9, "value": 2})
+        fire_window()
+        assert not mock_send.called
+        assert hk_driver.event_counters[1].coalesced == 3
+
+        # A single notification of an unchanged value is forced through
+        hk_driver.publish({"aid": 1, "iid": 10, "value": 3})
+        fire_window()
+        assert mock_send.call_count == 1
+
+        # Immediate events and changes made by clients are not delayed
+        mock_send.reset_mock()
+        hk_driver.publish({"aid": 1, "iid": 9, "value": 6}, immediate=True)
+        hk_driver.publish(
+            {"aid": 1, "iid": 10, "value": 7}, sender_client_addr=("192.168.1.3", 1)
+        )
+        assert mock_send.call_count == 2
+        assert hk_driver.event_counters[1].pushed == 5
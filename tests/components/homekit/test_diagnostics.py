@@ -138,6 +138,7 @@ async def test_config_entry_running(
             "version": 1,
         },
         "config_version": 2,
+        "events": {"coalesced": 0, "pushed": 0},
         "pairing_id": ANY,
         "status": 1,
     }
@@ -266,6 +267,7 @@ async def test_config_entry_accessory(
                 "last_updated": ANY,
                 "state": "on",
             },
+            "events": {"coalesced": 0, "pushed": 0},
             "name": "demo",
         },
         "client_properties": {},
@@ -284,6 +286,7 @@ async def test_config_entry_accessory(
             "version": 1,
         },
         "config_version": 2,
+        "events": {"coalesced": 0, "pushed": 0},
         "pairing_id": ANY,
         "iid_storage": {
             "1": {
@@ -617,6 +620,7 @@ async def test_config_entry_with_trigger_accessory(
             "version": 1,
         },
         "config_version": 2,
+        "events": {"coalesced": 0, "pushed": 0},
         "pairing_id": ANY,
         "status": 1,
     }
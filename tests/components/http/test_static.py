@@ -0,0 +1,261 @@
+"""The tests for http static files."""
+import asyncio
+import gzip
+from http import HTTPStatus
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.http import static
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from tests.typing import ClientSessionGenerator
+
+
+@pytest.fixture
+async def static_path(hass: HomeAssistant, tmp_path: Path) -> Path:
+    """Register a static path backed by a temporary directory."""
+    static.ASSET_CACHE.async_clear()
+    assert await async_setup_component(hass, "http", {})
+    hass.http.register_static_path("/assets", str(tmp_path))
+    yield tmp_path
+    static.ASSET_CACHE.async_clear()
+
+
+async def test_serving_cached_asset(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator, static_path: Path
+) -> None:
+    """Test assets are served from memory with a generated gzip variant."""
+    content = "console.log('hello');\n" * 100
+    (static_path / "app.js").write_text(content)
+    client = await hass_client()
+
+    with patch(
+        "homeassistant.components.http.static._load_asset",
+        wraps=static._load_asset,
+    ) as mock_load:
+        resp = await client.get("/assets/app.js", auto_decompress=False)
+        assert resp.status == HTTPStatus.OK
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert resp.headers["Vary"] == "Accept-Encoding"
+        assert resp.headers["Cache-Control"] == "public, max-age=2678400"
+        assert "javascript" in resp.headers["Content-Type"]
+        assert gzip.decompress(await resp.read()).decode() == content
+        gzip_etag = resp.headers["ETag"]
+
+        resp = await client.get(
+            "/assets/app.js", headers={"Accept-Encoding": "identity"}
+        )
+        assert resp.status == HTTPStatus.OK
+        assert "Content-Encoding" not in resp.headers
+        assert await resp.text() == content
+        assert resp.headers["ETag"] != gzip_etag
+
+        resp = await client.get("/assets/app.js", headers={"If-None-Match": gzip_etag})
+        assert resp.status == HTTPStatus.NOT_MODIFIED
+        assert resp.headers["ETag"] == gzip_etag
+
+    assert mock_load.call_count == 1
+
+
+async def test_precompressed_variants(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator, static_path: Path
+) -> None:
+    """Test pre-compressed files next to an asset are used as variants."""
+    (static_path / "app.js").write_text("raw")
+    (static_path / "app.js.br").write_bytes(b"brotli")
+    (static_path / "app.js.gz").write_bytes(gzip.compress(b"gzipped"))
+    client = await hass_client()
+
+    resp = await client.get(
+        "/assets/app.js", headers={"Accept-Encoding": "gzip, br"}, auto_decompress=False
+    )
+    assert resp.headers["Content-Encoding"] == "br"
+    assert await resp.read() == b"brotli"
+
+    resp = await client.get("/assets/app.js", headers={"Accept-Encoding": "gzip"})
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert await resp.read() == b"gzipped"
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "content_encoding", "body"),
+    [
+        ("br;q=0, gzip", "gzip", b"gzipped"),
+        ("BR ; q=0.5, gzip;q=1.0", "br", b"brotli"),
+        ("gzip;q=0, br;q=0", None, b"raw"),
+        ("*", "br", b"brotli"),
+        ("*, br;q=0", "gzip", b"gzipped"),
+        ("identity", None, b"raw"),
+    ],
+)
+async def test_accept_encoding_qvalues(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    static_path: Path,
+    accept_encoding: str,
+    content_encoding: str | None,
+    body: bytes,
+) -> None:
+    """Test encodings the client refuses with q=0 are not used."""
+    (static_path / "app.js").write_text("raw")
+    (static_path / "app.js.br").write_bytes(b"brotli")
+    (static_path / "app.js.gz").write_bytes(b"gzipped")
+    client = await hass_client()
+
+    resp = await client.get(
+        "/assets/app.js",
+        headers={"Accept-Encoding": accept_encoding},
+        auto_decompress=False,
+    )
+    assert resp.headers.get("Content-Encoding") == content_encoding
+    assert await resp.read() == body
+
+
+async def test_changed_asset_is_reloaded(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator, static_path: Path
+) -> None:
+    """Test an asset changed on disk is reloaded."""
+    path = static_path / "image.png"
+    path.write_bytes(b"old")
+    client = await hass_client()
+
+    resp = await client.get("/assets/image.png")
+    assert await resp.read() == b"old"
+    old_etag = resp.headers["ETag"]
+
+    path.write_bytes(b"newer")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    # The files are not checked again within the revalidate interval
+    resp = await client.get("/assets/image.png", headers={"If-None-Match": old_etag})
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+
+    with patch.object(static.ASSET_CACHE, "revalidate_interval", 0):
+        resp = await client.get(
+            "/assets/image.png", headers={"If-None-Match": old_etag}
+        )
+    assert resp.status == HTTPStatus.OK
+    assert await resp.read() == b"newer"
+    assert "Content-Encoding" not in resp.headers
+
+
+async def test_changed_precompressed_variant_is_reloaded(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test a pre-compressed file added or changed on disk is picked up."""
+    cache = static.StaticAssetCache(revalidate_interval=0)
+    path = tmp_path / "app.js"
+    path.write_text("raw")
+    (tmp_path / "app.js.br").write_bytes(b"brotli")
+
+    asset = await cache.async_get(hass, path)
+    assert asset.variants["br"][0] == b"brotli"
+    assert await cache.async_get(hass, path) is asset
+
+    compressed_path = tmp_path / "app.js.br"
+    compressed_path.write_bytes(b"new brotli")
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress(b"gzipped"))
+
+    asset = await cache.async_get(hass, path)
+    assert asset.variants["br"][0] == b"new brotli"
+    assert gzip.decompress(asset.variants["gzip"][0]) == b"gzipped"
+
+    compressed_path.unlink()
+    asset = await cache.async_get(hass, path)
+    assert "br" not in asset.variants
+
+
+async def test_uncached_requests(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator, static_path: Path
+) -> None:
+    """Test large files and range requests are streamed from disk."""
+    (static_path / "large.bin").write_bytes(b"x" * 64)
+    (static_path / "small.bin").write_bytes(b"0123456789")
+    client = await hass_client()
+
+    with patch.object(static.ASSET_CACHE, "max_file_size", 32):
+        resp = await client.get("/assets/large.bin")
+        assert resp.status == HTTPStatus.OK
+        assert await resp.read() == b"x" * 64
+
+    resp = await client.get("/assets/small.bin", headers={"Range": "bytes=2-4"})
+    assert resp.status == HTTPStatus.PARTIAL_CONTENT
+    assert await resp.read() == b"234"
+
+    assert static.ASSET_CACHE.size == 0
+
+
+async def test_asset_cache_size_bound(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test the cache evicts the least recently used assets."""
+    cache = static.StaticAssetCache(max_size=25)
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / name
+        path.write_bytes(name.encode() * 10)
+        paths.append(path)
+
+    await cache.async_get(hass, paths[0])
+    await cache.async_get(hass, paths[1])
+    assert cache.size == 20
+    await cache.async_get(hass, paths[0])
+    await cache.async_get(hass, paths[2])
+    assert cache.size == 20
+    assert list(cache._assets) == [paths[0], paths[2]]
+
+
+async def test_concurrent_loads_share_job(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test concurrent requests for the same asset only read it once."""
+    cache = static.StaticAssetCache()
+    path = tmp_path / "app.css"
+    path.write_text("body {}")
+
+    with patch(
+        "homeassistant.components.http.static._load_asset",
+        wraps=static._load_asset,
+    ) as mock_load:
+        results = await asyncio.gather(*(cache.async_get(hass, path) for _ in range(5)))
+
+    assert mock_load.call_count == 1
+    assert all(result is results[0] for result in results)
+
+
+async def test_uncached_asset_is_remembered(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test a file too large to cache is not read again on every request."""
+    cache = static.StaticAssetCache(max_file_size=4)
+    path = tmp_path / "large.bin"
+    path.write_bytes(b"x" * 64)
+
+    with patch(
+        "homeassistant.components.http.static._load_asset",
+        wraps=static._load_asset,
+    ) as mock_load, patch(
+        "homeassistant.components.http.static._asset_fingerprint",
+        wraps=static._asset_fingerprint,
+    ) as mock_fingerprint:
+        assert await cache.async_get(hass, path) is None
+        assert await cache.async_get(hass, path) is None
+        assert mock_load.call_count == 1
+        assert mock_fingerprint.call_count == 1
+
+        # Unchanged files are not loaded again after the revalidate interval
+        with patch.object(cache, "revalidate_interval", 0):
+            assert await cache.async_get(hass, path) is None
+        assert mock_load.call_count == 1
+        assert mock_fingerprint.call_count == 2
+
+        path.write_bytes(b"xy")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        with patch.object(cache, "revalidate_interval", 0):
+            asset = await cache.async_get(hass, path)
+        assert mock_load.call_count == 2
+
+    assert asset is not None
+    assert asset.variants[None][0] == b"xy"
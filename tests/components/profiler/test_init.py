@@ -20,16 +20,21 @@ from homeassistant.components.profiler import (
     SERVICE_START,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
+    SERVICE_START_LOOP_MONITOR,
     SERVICE_STOP_LOG_OBJECT_SOURCES,
     SERVICE_STOP_LOG_OBJECTS,
+    SERVICE_STOP_LOOP_MONITOR,
 )
-from homeassistant.components.profiler.const import DOMAIN
-from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.components.profiler.const import DOMAIN, LOOP_MONITOR
+from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE, STATE_UNKNOWN
+from homeassistant.core import HassJob, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_component import async_update_entity
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.typing import WebSocketGenerator
 
 
 async def test_basic_usage(hass: HomeAssistant, tmp_path: Path) -> None:
@@ -367,3 +372,72 @@ async def test_log_object_sources(
         await hass.services.async_call(
             DOMAIN, SERVICE_STOP_LOG_OBJECT_SOURCES, {}, blocking=True
         )
+
+
+async def test_loop_monitor(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the event loop monitor records jobs and lag."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    loop_monitor = hass.data[DOMAIN][LOOP_MONITOR]
+    client = await hass_ws_client(hass)
+
+    calls = []
+
+    @callback
+    def _job() -> None:
+        calls.append(1)
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_START_LOOP_MONITOR, {"threshold": 0}, blocking=True
+    )
+    hass.async_run_hass_job(HassJob(_job, "slow job"))
+    hass.async_add_hass_job(HassJob(_job))
+    await hass.async_add_executor_job(_job)
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+
+    loop_monitor._async_sample()
+
+    await client.send_json({"id": 1, "type": "profiler/loop_monitor"})
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["job_timing"] is True
+    assert result["slow_job_threshold"] == 0
+    assert result["lag"]["last"] is not None
+    timing = result["integrations"]["other"]
+    assert timing["loop_jobs"] == 2
+    assert timing["executor_jobs"] == 1
+    assert result["slow_jobs"][0]["name"] == "slow job"
+    assert result["slow_jobs"][1]["name"] == "test_loop_monitor.<locals>._job"
+    assert result["slow_job_count"] >= 2
+
+    await hass.services.async_call(DOMAIN, SERVICE_STOP_LOOP_MONITOR, {}, blocking=True)
+    assert "async_run_hass_job" not in hass.__dict__
+    hass.async_run_hass_job(HassJob(_job))
+    assert len(calls) == 4
+    assert loop_monitor.integrations["other"].loop_jobs == 2
+
+    entity_registry = er.async_get(hass)
+    slow_jobs = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}-slow_jobs"
+    )
+    lag = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}-event_loop_lag"
+    )
+    await async_update_entity(hass, slow_jobs)
+    await async_update_entity(hass, lag)
+    assert int(hass.states.get(slow_jobs).state) >= 2
+    assert hass.states.get(lag).state != STATE_UNKNOWN
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert loop_monitor._sample_handle is None
+
+    await client.send_json({"id": 2, "type": "profiler/loop_monitor"})
+    response = await client.receive_json()
+    assert not response["success"]
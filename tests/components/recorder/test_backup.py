@@ -1,10 +1,18 @@
 """Test backup platform for the Recorder integration."""
+from pathlib import Path
+import sqlite3
 from unittest.mock import patch
 
 import pytest
+from sqlalchemy.exc import SQLAlchemyError
 
-from homeassistant.components.recorder import Recorder
-from homeassistant.components.recorder.backup import async_post_backup, async_pre_backup
+from homeassistant.components.recorder import Recorder, core as recorder_core
+from homeassistant.components.recorder.backup import (
+    async_backup_snapshot,
+    async_post_backup,
+    async_pre_backup,
+)
+from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 
@@ -60,3 +68,85 @@ async def test_async_post_backup_failure(
     ) as unlock_mock, pytest.raises(HomeAssistantError):
         await async_post_backup(hass)
         assert unlock_mock.called
+
+
+async def test_async_snapshot_database(
+    recorder_mock: Recorder, hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test taking a snapshot of the database."""
+    if recorder_mock.dialect_name != SupportedDialect.SQLITE:
+        assert not await recorder_mock.async_snapshot_database("unused")
+        return
+
+    target = tmp_path / "snapshot.db"
+    assert await recorder_mock.async_snapshot_database(target.as_posix())
+
+    connection = sqlite3.connect(target)
+    try:
+        tables = {
+            row[0]
+            for row in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type='table'"
+            )
+        }
+    finally:
+        connection.close()
+    assert "states" in tables
+
+
+async def test_async_snapshot_database_timeout(
+    recorder_mock: Recorder, hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test the snapshot times out when the recorder does not get to it."""
+    if recorder_mock.dialect_name != SupportedDialect.SQLITE:
+        return
+
+    target = tmp_path / "snapshot.db"
+    with patch.object(recorder_mock, "queue_task") as queue_task, patch.object(
+        recorder_core, "DB_LOCK_TIMEOUT", 0
+    ), pytest.raises(TimeoutError):
+        await recorder_mock.async_snapshot_database(target.as_posix())
+
+    # The recorder skips the snapshot when it gets to it later
+    task = queue_task.call_args[0][0]
+    task.run(recorder_mock)
+    assert not task.started.is_set()
+    assert not target.exists()
+
+
+async def test_async_snapshot_database_error(
+    recorder_mock: Recorder, hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test any error taking the snapshot is raised."""
+    if recorder_mock.dialect_name != SupportedDialect.SQLITE:
+        return
+
+    with patch.object(
+        recorder_core,
+        "snapshot_db_sqlite",
+        side_effect=SQLAlchemyError("connection failed"),
+    ), pytest.raises(SQLAlchemyError):
+        await recorder_mock.async_snapshot_database((tmp_path / "db").as_posix())
+
+
+async def test_async_backup_snapshot(
+    recorder_mock: Recorder, hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test the database file is replaced by a snapshot."""
+    db_path = Path(hass.config.config_dir, "home-assistant_v2.db")
+    with patch.object(recorder_mock, "db_url", f"sqlite:///{db_path}"), patch.object(
+        recorder_mock, "_dialect_name", SupportedDialect.SQLITE
+    ), patch.object(
+        recorder_mock, "async_snapshot_database", return_value=True
+    ) as snapshot_mock:
+        snapshots = await async_backup_snapshot(hass, tmp_path)
+
+    snapshot_mock.assert_called_once_with((tmp_path / db_path.name).as_posix())
+    assert snapshots == {
+        "home-assistant_v2.db": tmp_path / db_path.name,
+        "home-assistant_v2.db-journal": None,
+        "home-assistant_v2.db-shm": None,
+        "home-assistant_v2.db-wal": None,
+    }
+    # The in memory test database is not part of backups
+    assert await async_backup_snapshot(hass, tmp_path) == {}
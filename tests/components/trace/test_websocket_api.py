@@ -7,9 +7,11 @@ from unittest.mock import patch
 
 import pytest
 from pytest_unordered import unordered
+import voluptuous as vol
 
 from homeassistant.bootstrap import async_setup_component
-from homeassistant.components.trace.const import DEFAULT_STORED_TRACES
+from homeassistant.components.trace import TRACE_CONFIG_SCHEMA
+from homeassistant.components.trace.const import DATA_TRACE_RUNS, DEFAULT_STORED_TRACES
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import Context, CoreState, HomeAssistant, callback
 from homeassistant.helpers.typing import UNDEFINED
@@ -42,7 +44,11 @@ async def _setup_automation_or_script(
 ):
     """Set up automations or scripts from automation config."""
     if domain == "script":
-        configs = {config["id"]: {"sequence": config["action"]} for config in configs}
+        configs = {
+            config["id"]: {"sequence": config["action"]}
+            | ({"trace": config["trace"]} if "trace" in config else {})
+            for config in configs
+        }
 
     if script_config:
         if domain == "automation":
@@ -773,6 +779,111 @@ async def test_trace_no_traces(
     assert len(_find_traces(response["result"], domain, "sun")) == 0
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+@pytest.mark.parametrize(
+    ("trace_config", "expected_runs"),
+    [
+        ({"mode": "full"}, [1, 2, 3, 4, 5]),
+        ({"mode": "sampled", "sample_interval": 2}, [1, 3, 5]),
+        ({"mode": "errors"}, [2, 4]),
+        ({"mode": "off"}, []),
+    ],
+)
+async def test_trace_modes(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    domain,
+    trace_config,
+    expected_runs,
+) -> None:
+    """Test the trace mode decides which runs are stored."""
+    id = 1
+
+    def next_id():
+        nonlocal id
+        id += 1
+        return id
+
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": [
+            {"event": "some_event", "event_data": {"run": "{{ run }}"}},
+            {
+                "if": {"condition": "template", "value_template": "{{ run % 2 == 1 }}"},
+                "then": {"stop": "Odd run"},
+            },
+            {"service": "test.automation"},
+        ],
+        "trace": trace_config,
+    }
+    if domain == "automation":
+        sun_config["variables"] = {"run": "{{ trigger.event.data.run }}"}
+    await _setup_automation_or_script(hass, domain, [sun_config])
+
+    client = await hass_ws_client()
+
+    for run in range(1, 6):
+        if domain == "automation":
+            hass.bus.async_fire("test_event", {"run": run})
+        else:
+            await hass.services.async_call("script", "sun", {"run": run})
+        await hass.async_block_till_done()
+
+    await client.send_json({"id": next_id(), "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    traces = _find_traces(response["result"], domain, "sun")
+    assert len(traces) == len(expected_runs)
+
+    for trace, run in zip(traces, expected_runs):
+        await client.send_json(
+            {
+                "id": next_id(),
+                "type": "trace/get",
+                "domain": domain,
+                "item_id": "sun",
+                "run_id": trace["run_id"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        prefix = "action" if domain == "automation" else "sequence"
+        step = response["result"]["trace"][f"{prefix}/0"][0]
+        assert step["changed_variables"]["context"]
+        assert step["result"]["event_data"] == {"run": run}
+
+
+@pytest.mark.parametrize("sample_interval", [0, -1])
+def test_trace_config_invalid_sample_interval(sample_interval) -> None:
+    """Test a sample interval below 1 is rejected."""
+    with pytest.raises(vol.Invalid):
+        vol.Schema(TRACE_CONFIG_SCHEMA)(
+            {"mode": "sampled", "sample_interval": sample_interval}
+        )
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_sampled_runs_removed_with_item(hass: HomeAssistant, domain) -> None:
+    """Test the sampled run count is dropped when the item is removed."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+        "trace": {"mode": "sampled", "sample_interval": 2},
+    }
+    await _setup_automation_or_script(hass, domain, [sun_config])
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+    assert hass.data[DATA_TRACE_RUNS] == {f"{domain}.sun": 1}
+
+    (entity_id,) = hass.states.async_entity_ids(domain)
+    await hass.data[domain].async_remove_entity(entity_id)
+    await hass.async_block_till_done()
+    assert hass.data[DATA_TRACE_RUNS] == {}
+
+
 @pytest.mark.parametrize(
     ("domain", "prefix", "trigger", "last_step", "script_execution"),
     [
@@ -1751,3 +1751,80 @@ async def test_ws_list_voices(
             {"voice_id": "fran_drescher", "name": "Fran Drescher"},
         ]
     }
+
+
+async def test_concurrent_requests_share_engine_call(hass: HomeAssistant) -> None:
+    """Test identical concurrent requests only call the engine once."""
+    tts_audio: asyncio.Future[bytes] = asyncio.Future()
+    calls = 0
+
+    class ProviderWithAsyncFetching(MockProvider):
+        """Provider which waits for the audio."""
+
+        async def async_get_tts_audio(
+            self, message: str, language: str, options: dict[str, Any]
+        ) -> tts.TtsAudioType:
+            nonlocal calls
+            calls += 1
+            return ("mp3", await tts_audio)
+
+    await mock_setup(hass, ProviderWithAsyncFetching(DEFAULT_LANG))
+    media_source_id = tts.generate_media_source_id(
+        hass, "test message", "test", "en_US", None, None
+    )
+
+    tasks = [
+        hass.async_create_task(tts.async_get_media_source_audio(hass, media_source_id))
+        for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    tts_audio.set_result(b"test")
+
+    assert await asyncio.gather(*tasks) == [("mp3", b"test")] * 5
+    assert calls == 1
+
+
+async def test_mem_cache_size_bound(
+    hass: HomeAssistant,
+    mock_tts_cache_dir,
+    hass_client: ClientSessionGenerator,
+) -> None:
+    """Test the memory cache drops the least recently used voices.
+
+    Voices which are only cached on disk are streamed from the file.
+    """
+
+    class ProviderWithMessageAudio(MockProvider):
+        """Provider which returns the message as audio."""
+
+        def get_tts_audio(
+            self, message: str, language: str, options: dict[str, Any]
+        ) -> tts.TtsAudioType:
+            return ("mp3", message.encode())
+
+    await mock_setup(hass, ProviderWithMessageAudio(DEFAULT_LANG))
+    manager: tts.SpeechManager = hass.data[tts.DATA_TTS_MANAGER]
+    manager.mem_cache_max_size = 10
+
+    paths = [
+        await manager.async_get_url_path("test", message)
+        for message in ("first", "second")
+    ]
+    await hass.async_block_till_done()
+    assert manager.mem_cache_size == 6
+    assert [cached["voice"] for cached in manager.mem_cache.values()] == [b"second"]
+
+    client = await hass_client()
+    with patch(
+        "homeassistant.components.tts.SpeechManager._async_file_to_mem"
+    ) as mock_file_to_mem:
+        req = await client.get(paths[0])
+        assert req.status == HTTPStatus.OK
+        assert await req.read() == b"first"
+        req = await client.get(paths[1])
+        assert await req.read() == b"second"
+    assert not mock_file_to_mem.called
+
+    (mock_tts_cache_dir / paths[0].rpartition("/")[2]).unlink()
+    req = await client.get(paths[0])
+    assert req.status == HTTPStatus.NOT_FOUND
@@ -1282,3 +1282,43 @@ async def test_zeroconf_removed(hass: HomeAssistant, mock_async_zeroconf: None)
     assert len(mock_service_browser.mock_calls) == 1
     assert len(mock_async_progress_by_init_data_type.mock_calls) == 1
     assert mock_async_abort.mock_calls[0][1][0] == "mock_flow_id"
+
+
+def test_matcher_index() -> None:
+    """Test the matcher index returns matching matchers in manifest order."""
+    index = zeroconf.ZeroconfMatcherIndex(
+        {
+            "_http._tcp.local.": [
+                {"domain": "shelly", "name": "shelly*"},
+                {"domain": "wildcard", "name": "*zigate*"},
+                {"domain": "any"},
+                {"domain": "vendor", "properties": {"vendor": "synology*"}},
+                {"domain": "model", "properties": {"model": "*", "am": "a*"}},
+            ]
+        }
+    )
+
+    def _domains(service_type: str, name: str, props: dict[str, Any]) -> list[str]:
+        return [
+            matcher["domain"]
+            for matcher in index.match(service_type, {"name": name}, props)
+        ]
+
+    assert _domains("_http._tcp.local.", "shelly1-abc._http._tcp.local.", {}) == [
+        "shelly",
+        "any",
+    ]
+    assert _domains("_http._tcp.local.", "zigate._http._tcp.local.", {}) == [
+        "wildcard",
+        "any",
+    ]
+    assert _domains(
+        "_http._tcp.local.", "nas._http._tcp.local.", {"vendor": "Synology"}
+    ) == ["any", "vendor"]
+    assert _domains(
+        "_http._tcp.local.", "tv._http._tcp.local.", {"model": "x", "am": "abc"}
+    ) == ["any", "model"]
+    assert _domains("_http._tcp.local.", "tv._http._tcp.local.", {"vendor": None}) == [
+        "any"
+    ]
+    assert _domains("_other._tcp.local.", "shelly1._other._tcp.local.", {}) == []
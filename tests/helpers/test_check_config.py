@@ -264,3 +264,29 @@ async def test_removed_yaml_support(hass: HomeAssistant) -> None:
         log_ha_config(res)
 
         assert res.keys() == {"homeassistant"}
+
+
+async def test_integrations_validated_in_order(hass: HomeAssistant) -> None:
+    """Test integrations are reported in a deterministic order with timings."""
+    files = {
+        YAML_CONFIG_FILE: BASE_CONFIG
+        + "wine:\nlight:\n  platform: demo\nbeer:\nautomation:\n"
+    }
+    with patch("os.path.isfile", return_value=True), patch_yaml_files(files):
+        res = await async_check_ha_config_file(hass)
+        log_ha_config(res)
+
+    assert list(res) == ["homeassistant", "automation", "light"]
+    assert [err.message for err in res.errors] == [
+        "Integration error: beer - Integration 'beer' not found.",
+        "Integration error: wine - Integration 'wine' not found.",
+    ]
+    assert res.validation_times == {}
+
+    with patch("os.path.isfile", return_value=True), patch_yaml_files(files):
+        timed_res = await async_check_ha_config_file(hass, timings=True)
+
+    assert list(timed_res) == list(res)
+    assert timed_res.errors == res.errors
+    assert list(timed_res.validation_times) == ["automation", "beer", "light", "wine"]
+    assert all(duration >= 0 for duration in timed_res.validation_times.values())
@@ -3526,3 +3526,57 @@ async def test_or_condition_with_disabled_condition(hass: HomeAssistant) -> None
             "conditions/1/entity_id/0": [{"result": {"result": True, "state": 100.0}}],
         }
     )
+
+
+async def test_untraced_condition(hass: HomeAssistant) -> None:
+    """Test conditions evaluated without a trace, cheapest first."""
+    config = {
+        "condition": "and",
+        "conditions": [
+            {"condition": "template", "value_template": "{{ states.sensor | count }}"},
+            {"condition": "state", "entity_id": "sensor.temperature", "state": "100"},
+        ],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+    trace.trace_cv.set(None)
+
+    hass.states.async_set("sensor.temperature", 120)
+    with patch.object(Template, "async_render") as mock_render:
+        assert not test(hass)
+    mock_render.assert_not_called()
+    assert trace.trace_get(clear=False) is None
+
+    hass.states.async_set("sensor.temperature", 100)
+    assert not test(hass)
+
+    config = {
+        "condition": "or",
+        "conditions": [
+            {"condition": "template", "value_template": "{{ undefined.state }}"},
+            {"condition": "state", "entity_id": "sensor.missing", "state": "100"},
+        ],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+    with pytest.raises(ConditionError) as err:
+        test(hass)
+    assert [error.index for error in err.value.errors] == [0, 1]
+
+
+@pytest.mark.parametrize(("value", "result"), [("true", True), ("False", False)])
+async def test_static_template_condition(
+    hass: HomeAssistant, value: str, result: bool
+) -> None:
+    """Test a template without template syntax is not rendered."""
+    config = {"condition": "template", "value_template": value}
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+    trace.trace_cv.set(None)
+
+    with patch.object(Template, "async_render") as mock_render:
+        assert test(hass) is result
+    mock_render.assert_not_called()
@@ -1284,6 +1284,61 @@ def test_comp_entity_ids() -> None:
             schema(invalid)
 
 
+@pytest.mark.parametrize(
+    ("validator", "fallback"),
+    [
+        (cv.comp_entity_ids, cv._comp_entity_ids),
+        (cv.comp_entity_ids_or_uuids, cv._comp_entity_ids_or_uuids),
+    ],
+)
+def test_comp_entity_ids_fast_path(validator, fallback) -> None:
+    """Test compiled component entity ID validators match the vol.Any chain."""
+    for value in (
+        "ALL",
+        "none",
+        None,
+        "light.kitchen",
+        "light.Kitchen, light.ceiling ",
+        ["light.kitchen"],
+        [],
+    ):
+        assert validator(value) == fallback(value)
+
+    for value in ("*", "", ["light.kitchen", "not-entity-id"], {"a": 1}):
+        with pytest.raises(vol.Invalid) as fast_err:
+            validator(value)
+        with pytest.raises(vol.Invalid) as err:
+            fallback(value)
+        assert str(fast_err.value) == str(err.value)
+
+    # Memoized results must not leak between callers
+    result = validator("light.kitchen")
+    result.append("light.other")
+    assert validator("light.kitchen") == ["light.kitchen"]
+
+
+def test_time_period_fast_path() -> None:
+    """Test time_period fast path matches the vol.Any chain."""
+    for value in (
+        "00:00:05",
+        "5",
+        "-1:30",
+        5,
+        2.5,
+        True,
+        {"minutes": 5},
+        timedelta(seconds=3),
+    ):
+        assert cv.time_period(value) == cv._time_period(value)
+
+    for value in (None, "", "hello:world", float("nan"), {"wrong_key": 1}, []):
+        with pytest.raises(vol.Invalid) as fast_err:
+            cv.time_period(value)
+        with pytest.raises(vol.Invalid) as err:
+            cv._time_period(value)
+        assert str(fast_err.value) == str(err.value)
+
+
 def test_uuid4_hex(caplog: pytest.LogCaptureFixture) -> None:
     """Test uuid validation."""
     schema = vol.Schema(cv.uuid4_hex)
@@ -478,3 +478,23 @@ def test_complex_include_exclude_filter() -> None:
     }
     filt: EntityFilter = INCLUDE_EXCLUDE_FILTER_SCHEMA(conf)
     assert filt("switch.espresso_keuken") is True
+
+
+def test_filter_verdicts_are_cached() -> None:
+    """Test filters remember their verdicts and are shared between equal configs."""
+    conf = {
+        "include": {"domains": ["light"], "entity_globs": ["sensor.*_power"]},
+        "exclude": {"entities": ["light.porch"]},
+    }
+    filt: EntityFilter = INCLUDE_EXCLUDE_FILTER_SCHEMA(conf)
+    assert INCLUDE_EXCLUDE_FILTER_SCHEMA(conf) is filt
+    assert FILTER_SCHEMA({"include_domains": ["light"]}) is not filt
+
+    entity_filter = filt.get_filter()
+    entity_filter.cache_clear()
+    assert filt("light.kitchen") is True
+    assert filt("light.porch") is False
+    assert filt("sensor.washer_power") is True
+    assert filt("light.kitchen") is True
+    assert entity_filter.cache_info().hits == 1
+    assert entity_filter.cache_info().misses == 3
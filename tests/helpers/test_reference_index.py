@@ -0,0 +1,38 @@
+"""Test the reference index helper."""
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import reference_index
+
+
+async def test_reference_index(hass: HomeAssistant) -> None:
+    """Test adding, replacing and removing references."""
+    index = reference_index.async_get(hass)
+    assert reference_index.async_get(hass) is index
+
+    index.async_add(
+        "automation.one",
+        {"referenced_entities": {"light.a", "light.b"}, "referenced_areas": set()},
+    )
+    index.async_add("automation.two", {"referenced_entities": {"light.a"}})
+    index.async_add("script.one", {"referenced_entities": {"light.a"}})
+
+    assert index.async_referencing("automation", "referenced_entities", "light.a") == [
+        "automation.one",
+        "automation.two",
+    ]
+    assert index.async_referencing("script", "referenced_entities", "light.a") == [
+        "script.one"
+    ]
+    assert index.async_referencing("automation", "referenced_areas", "kitchen") == []
+    assert index.async_referencing("light", "referenced_entities", "light.a") == []
+
+    # Adding the references again replaces the earlier ones
+    index.async_add("automation.one", {"referenced_entities": {"light.c"}})
+    assert index.async_referencing("automation", "referenced_entities", "light.b") == []
+    assert index.async_referencing("automation", "referenced_entities", "light.c") == [
+        "automation.one"
+    ]
+
+    index.async_remove("automation.two")
+    index.async_remove("automation.unknown")
+    assert index.async_referencing("automation", "referenced_entities", "light.a") == []
+    assert index._index["automation"]["referenced_entities"].keys() == {"light.c"}
@@ -13,10 +13,12 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.json import json_bytes, json_loads
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
     STORAGE_KEY,
+    LazyStoredState,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -87,6 +89,52 @@ async def test_caching_data(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
 
+async def test_lazy_loading(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Test stored states are only decoded when they are restored."""
+    now = dt_util.utcnow()
+    stored = [
+        {
+            "state": State(f"input_boolean.b{idx}", "on", {"idx": idx}).as_dict(),
+            "extra_data": {"native_value": idx} if idx else None,
+            "last_seen": now.isoformat(),
+        }
+        for idx in range(3)
+    ]
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": json_loads(json_bytes(stored)),
+    }
+    hass.data.pop(DATA_RESTORE_STATE)
+    await async_load(hass)
+    data = async_get(hass)
+
+    assert set(data.last_states) == {
+        "input_boolean.b0",
+        "input_boolean.b1",
+        "input_boolean.b2",
+    }
+    for stored_state in data.last_states.values():
+        assert isinstance(stored_state, LazyStoredState)
+        assert stored_state.last_seen == now
+        assert "state" not in stored_state.__dict__
+
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b1"
+    state = await entity.async_get_last_state()
+    assert state.state == "on"
+    assert state.attributes == {"idx": 1}
+    extra_data = await entity.async_get_last_extra_data()
+    assert extra_data.as_dict() == {"native_value": 1}
+    assert "state" not in data.last_states["input_boolean.b2"].__dict__
+
+    # States that were not restored are written back as they were loaded
+    await data.async_dump_states()
+    assert hass_storage[STORAGE_KEY]["data"] == json_loads(json_bytes(stored))
+    assert "state" not in data.last_states["input_boolean.b2"].__dict__
+
+
 async def test_async_get_instance_backwards_compatibility(hass: HomeAssistant) -> None:
     """Test async_get_instance backwards compatibility."""
     await async_load(hass)
@@ -307,7 +355,7 @@ async def test_dump_data(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
     args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    written_states = json_loads(json_bytes(args[0]))
 
     for state in states:
         hass.states.async_remove(state.entity_id)
@@ -338,7 +386,7 @@ async def test_dump_data(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
     args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    written_states = json_loads(json_bytes(args[0]))
     assert len(written_states) == 2
     assert written_states[0]["state"]["entity_id"] == "input_boolean.b3"
     assert written_states[0]["state"]["state"] == "off"
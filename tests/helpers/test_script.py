@@ -278,6 +278,37 @@ async def test_calling_service_basic(
     )
 
 
+@pytest.mark.parametrize(("use_callback", "long_actions"), [(True, 0), (False, 1)])
+async def test_calling_callback_service_inline(
+    hass: HomeAssistant, use_callback: bool, long_actions: int
+) -> None:
+    """Test callback services are called without creating a task."""
+    calls = []
+
+    def service_handler(call: ServiceCall) -> None:
+        calls.append(call)
+
+    if use_callback:
+        service_handler = callback(service_handler)
+    hass.services.async_register("test", "script", service_handler)
+
+    sequence = cv.SCRIPT_SCHEMA({"service": "test.script", "data": {"hello": "world"}})
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    with patch.object(
+        script._ScriptRun,
+        "_async_run_long_action",
+        side_effect=script._ScriptRun._async_run_long_action,
+        autospec=True,
+    ) as mock_long_action:
+        await script_obj.async_run(context=Context())
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert calls[0].data == {"hello": "world"}
+    assert mock_long_action.call_count == long_actions
+
+
 async def test_calling_service_template(hass: HomeAssistant) -> None:
     """Test the calling of a service."""
     context = Context()
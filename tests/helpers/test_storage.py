@@ -733,3 +733,177 @@ async def test_read_only_store(
     hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
     await hass.async_block_till_done()
     assert read_only_store.key not in hass_storage
+
+
+def _journal_data(count: int) -> dict[str, Any]:
+    """Return data with a keyed list that can be journaled per item."""
+    return {
+        "items": [{"id": f"item_{idx}", "name": f"Item {idx}"} for idx in range(count)],
+        "other": "value",
+    }
+
+
+async def test_journal_round_trip(tmpdir: py.path.local) -> None:
+    """Test changes are appended to the journal and replayed on load."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    data = _journal_data(100)
+    await store.async_save(data)
+    base_size = os.path.getsize(store.path)
+    assert not os.path.exists(store.journal_path)
+
+    data["items"][5]["name"] = "Renamed"
+    del data["items"][7]
+    data["items"].append({"id": "item_new", "name": "New"})
+    data["other"] = "changed"
+    await store.async_save(data)
+
+    # The base file is untouched and only the changes are journaled
+    assert os.path.getsize(store.path) == base_size
+    assert os.path.getsize(store.journal_path) < 300
+
+    # Saving unchanged data does not grow the journal
+    journal_size = os.path.getsize(store.journal_path)
+    await store.async_save(data)
+    assert os.path.getsize(store.journal_path) == journal_size
+
+    store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    assert await store2.async_load() == data
+
+    # The loaded store continues the journal
+    data["items"][0]["name"] = "First"
+    await store2.async_save(data)
+    assert os.path.getsize(store.path) == base_size
+    assert os.path.getsize(store.journal_path) > journal_size
+
+    store3 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    assert await store3.async_load() == data
+
+    await hass.async_stop(force=True)
+
+
+async def test_journal_reorder_replaces_list(tmpdir: py.path.local) -> None:
+    """Test a reordered list is journaled as a whole."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    data = _journal_data(20)
+    await store.async_save(data)
+
+    data["items"].reverse()
+    del data["other"]
+    await store.async_save(data)
+    assert os.path.exists(store.journal_path)
+
+    store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    assert await store2.async_load() == data
+
+    await hass.async_stop(force=True)
+
+
+async def test_journal_torn_record_and_stale_journal(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an incomplete record and records of an old base file are skipped."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    data = _journal_data(50)
+    await store.async_save(data)
+    data["items"][1]["name"] = "Changed"
+    await store.async_save(data)
+
+    with open(store.journal_path, "ab") as fdesc:
+        fdesc.write(b'{"id":"stale","ops":[{"k":"other"}]}\n')
+        fdesc.write(b'{"id":"partial","ops":[{"k":"ot')
+
+    store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    assert await store2.async_load() == data
+    assert "Discarding incomplete journal record" in caplog.text
+
+    # A store without journaling ignores the journal
+    store3 = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+    assert (await store3.async_load())["items"][1]["name"] == "Item 1"
+
+    await hass.async_stop(force=True)
+
+
+async def test_journal_compaction(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted when it grows and on the final write."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    data = _journal_data(10)
+    await store.async_save(data)
+
+    for idx in range(10):
+        data["items"][idx]["name"] = "x" * 100
+        await store.async_save(data)
+    # The journal outgrew the base file and was compacted
+    assert not os.path.exists(store.journal_path)
+
+    data["items"][0]["name"] = "Final"
+    store.async_delay_save(lambda: data, 10)
+    await hass.async_block_till_done()
+    assert not os.path.exists(store.journal_path)
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    assert not os.path.exists(store.journal_path)
+    with open(store.path, encoding="utf8") as fdesc:
+        assert json.load(fdesc)["data"] == data
+
+    await store.async_remove()
+    assert not os.path.exists(store.path)
+
+    await hass.async_stop(force=True)
+
+
+async def test_journal_torn_record_then_save(tmpdir: py.path.local) -> None:
+    """Test changes saved after a crash survive the next load."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    data = _journal_data(50)
+    await store.async_save(data)
+    data["items"][1]["name"] = "Changed"
+    await store.async_save(data)
+    journal_size = os.path.getsize(store.journal_path)
+
+    # Crash while appending a record
+    with open(store.journal_path, "ab") as fdesc:
+        fdesc.write(b'{"id":"partial","ops":[{"k":"ot')
+
+    store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    assert await store2.async_load() == data
+    assert os.path.getsize(store.journal_path) == journal_size
+
+    data["items"][2]["name"] = "Changed after crash"
+    await store2.async_save(data)
+    assert os.path.getsize(store.journal_path) > journal_size
+
+    store3 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    assert await store3.async_load() == data
+
+    await hass.async_stop(force=True)
@@ -716,3 +716,125 @@ async def test_always_callback_when_always_update_is_true(
     update_callback.reset_mock()
 
     remove_callbacks()
+
+
+async def test_group_coalesces_fetches(hass: HomeAssistant) -> None:
+    """Test coordinators in a group share overlapping fetches with the same key."""
+    group = update_coordinator.DataUpdateCoordinatorGroup(hass)
+    release = asyncio.Event()
+    calls = 0
+
+    async def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    crds = [
+        update_coordinator.DataUpdateCoordinator[int](
+            hass,
+            _LOGGER,
+            name=f"test {key}",
+            update_method=fetch,
+            group=group,
+            group_key=key,
+        )
+        for key in ("account", "account", "other")
+    ]
+
+    refreshes = asyncio.gather(*(crd.async_refresh() for crd in crds))
+    await asyncio.sleep(0)
+    release.set()
+    await refreshes
+
+    assert calls == 2
+    assert [crd.data for crd in crds] == [1, 1, 2]
+    stats = [group.async_get_stats(crd) for crd in crds]
+    assert [s.skipped_fetches for s in stats] == [0, 1, 0]
+    assert all(s.refreshes == 1 and s.success_rate == 1 for s in stats)
+
+    # Failures are shared as well
+    async def fail() -> int:
+        raise update_coordinator.UpdateFailed("boom")
+
+    crds[0].update_method = fail
+    await asyncio.gather(crds[0].async_refresh(), crds[1].async_refresh())
+    assert not crds[0].last_update_success
+    assert not crds[1].last_update_success
+    assert stats[1].success_rate == 0.5
+
+    diagnostics = group.async_diagnostics()
+    assert diagnostics[1] == {
+        "name": "test account",
+        "group_key": "account",
+        "update_interval": None,
+        "refreshes": 2,
+        "failures": 1,
+        "skipped_fetches": 2,
+        "success_rate": 0.5,
+        "mean_latency": stats[1].mean_latency,
+        "last_latency": stats[1].last_latency,
+        "interval_ratio": 1.0,
+    }
+
+    await crds[2].async_shutdown()
+    assert group.async_get_stats(crds[2]) is None
+    assert len(group.async_diagnostics()) == 2
+
+
+async def test_group_adaptive_interval(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the refresh interval backs off and speeds up with the data."""
+    group = update_coordinator.DataUpdateCoordinatorGroup(hass, max_interval_ratio=4)
+    value = 0
+    fail = False
+
+    async def fetch() -> int:
+        if fail:
+            raise update_coordinator.UpdateFailed("boom")
+        return value
+
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        name="test",
+        update_method=fetch,
+        update_interval=DEFAULT_UPDATE_INTERVAL,
+        group=group,
+    )
+    unsub = crd.async_add_listener(Mock())
+    stats = group.async_get_stats(crd)
+
+    async def tick(seconds: int) -> None:
+        freezer.tick(timedelta(seconds=seconds))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    # First refresh changes the data and speeds up
+    await tick(10)
+    assert stats.refreshes == 1
+    assert stats.interval_ratio == 0.5
+
+    # Unchanged data backs off up to the maximum
+    for ratio in (1, 2, 4, 4):
+        await tick(10 * stats.interval_ratio)
+        assert stats.interval_ratio == ratio
+    assert stats.refreshes == 5
+
+    # Not due yet
+    await tick(30)
+    assert stats.refreshes == 5
+
+    value = 1
+    await tick(10)
+    assert stats.refreshes == 6
+    assert stats.interval_ratio == 2
+
+    fail = True
+    await tick(20)
+    assert stats.refreshes == 7
+    assert stats.failures == 1
+    assert stats.interval_ratio == 4
+
+    unsub()
@@ -777,6 +777,25 @@ async def test_async_hass_config_yaml_merge(
     assert len(conf["light"]) == 1
 
 
+async def test_async_hass_config_yaml_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any], tmp_path
+) -> None:
+    """Test the parsed configuration files are cached in storage."""
+    hass.config.config_dir = str(tmp_path)
+    config_path = tmp_path / config_util.YAML_CONFIG_FILE
+    config_path.write_text("input_boolean:\n  ib1:\n")
+
+    conf = await config_util.async_hass_config_yaml(hass)
+    assert conf == {"input_boolean": {"ib1": None}}
+    cache_data = hass_storage[config_util.YAML_CACHE_STORAGE_KEY]["data"]
+    assert list(cache_data) == [str(config_path)]
+
+    # Nothing is saved if no file changed
+    hass_storage.pop(config_util.YAML_CACHE_STORAGE_KEY)
+    assert await config_util.async_hass_config_yaml(hass) == conf
+    assert config_util.YAML_CACHE_STORAGE_KEY not in hass_storage
+
+
 @pytest.fixture
 def merge_log_err(hass):
     """Patch _merge_log_error from packages."""
@@ -1133,6 +1133,24 @@ async def test_serviceregistry_has_service(hass: HomeAssistant) -> None:
     assert not hass.services.has_service("non_existing", "test_service")
 
 
+async def test_serviceregistry_is_callback(hass: HomeAssistant) -> None:
+    """Test is_callback method."""
+
+    async def async_service(call):
+        """Handle a service call."""
+
+    hass.services.async_register(
+        "test_domain", "callback", ha.callback(lambda call: None)
+    )
+    hass.services.async_register("test_domain", "coroutine", async_service)
+    hass.services.async_register("test_domain", "executor", lambda call: None)
+    assert hass.services.is_callback("tesT_domaiN", "callbacK")
+    assert not hass.services.is_callback("test_domain", "coroutine")
+    assert not hass.services.is_callback("test_domain", "executor")
+    assert not hass.services.is_callback("test_domain", "non_existing")
+    assert not hass.services.is_callback("non_existing", "callback")
+
+
 async def test_serviceregistry_call_with_blocking_done_in_time(
     hass: HomeAssistant,
 ) -> None:
@@ -1940,6 +1958,31 @@ async def test_async_entity_ids_count(hass: HomeAssistant) -> None:
     assert hass.states.async_entity_ids_count("light") == 3
 
 
+async def test_statemachine_domain_index(hass: HomeAssistant) -> None:
+    """Test domain filters are served from the domain index."""
+    hass.states.async_set("switch.link", "on")
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.frog", "on")
+    hass.states.async_set("vacuum.floor", "on")
+    hass.states.async_set("light.bowl", "off")
+
+    assert hass.states.async_entity_ids("LIGHT") == ["light.bowl", "light.frog"]
+    assert [state.state for state in hass.states.async_all("light")] == ["off", "on"]
+    assert hass.states.async_entity_ids(["vacuum", "switch", "vacuum"]) == [
+        "vacuum.floor",
+        "switch.link",
+    ]
+    assert hass.states.async_entity_ids_count(("light", "vacuum", "fan")) == 3
+    assert hass.states.async_all("fan") == []
+    assert hass.states.async_entity_ids_count("fan") == 0
+
+    hass.states.async_remove("light.bowl")
+    hass.states.async_remove("switch.link")
+    assert hass.states.async_entity_ids("light") == ["light.frog"]
+    assert hass.states.async_entity_ids("switch") == []
+    assert "switch" not in hass.states._domain_index
+
+
 async def test_hassjob_forbid_coroutine() -> None:
     """Test hassjob forbids coroutines."""
 
@@ -0,0 +1,33 @@
+"""Test Home Assistant glob set utility functions."""
+import pytest
+
+from homeassistant.util.globs import GlobSet
+
+
+@pytest.mark.parametrize(
+    ("name", "matching"),
+    [
+        ("shelly1-abc", {"shelly*", "*ly1*", "shelly1-?bc"}),
+        ("shellyplug", {"shelly*"}),
+        ("xyz", {"x*"}),
+        ("Shelly1-abc", {"*ly1*"}),
+        ("Shellyplug", set()),
+        ("", set()),
+    ],
+)
+def test_glob_set(name: str, matching: set[str]) -> None:
+    """Test matching strings against a set of globs."""
+    globs = GlobSet(["shelly*", "*ly1*", "x*", "shelly1-?bc", "x*"])
+
+    assert len(globs) == 4
+    assert bool(globs.match(name)) is bool(matching)
+    assert globs.matching(name) == matching
+
+
+def test_empty_glob_set() -> None:
+    """Test an empty set of globs matches nothing."""
+    globs = GlobSet([])
+
+    assert len(globs) == 0
+    assert not globs.match("")
+    assert globs.matching("anything") == set()
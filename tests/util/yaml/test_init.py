@@ -1,6 +1,7 @@
 """Test Home Assistant yaml loader."""
 import importlib
 import io
+import json
 import os
 import pathlib
 from typing import Any
@@ -547,3 +548,112 @@ async def test_loading_actual_file_with_syntax(
             "fixtures", "bad.yaml.txt"
         )
         await hass.async_add_executor_job(load_yaml_config_file, fixture_path)
+
+
+def _write_cached_config(config_dir: pathlib.Path) -> str:
+    """Write a configuration with includes, secrets and inputs."""
+    (config_dir / "packages").mkdir()
+    (config_dir / "packages" / "one.yaml").write_text(
+        "light_one:\n  name: !secret light_name\n"
+    )
+    (config_dir / "packages" / "two.yaml").write_text(
+        "light_two:\n  values: [1, 2.5, .inf, true, null]\n"
+    )
+    (config_dir / "automations.yaml").write_text(
+        "- alias: !input alias\n  trigger: !env_var CACHED_TRIGGER state\n"
+    )
+    (config_dir / "secrets.yaml").write_text("light_name: Kitchen\n")
+    config_path = config_dir / "configuration.yaml"
+    config_path.write_text(
+        "homeassistant:\n"
+        "  packages: !include_dir_merge_named packages\n"
+        "automation: !include automations.yaml\n"
+    )
+    return str(config_path)
+
+
+def test_cache_loads_same_data(tmp_path: pathlib.Path, try_both_loaders) -> None:
+    """Test loading through the cache returns the same data as parsing."""
+    config_path = _write_cached_config(tmp_path)
+    secrets = yaml.Secrets(tmp_path)
+    expected = yaml_loader.load_yaml(config_path, secrets)
+
+    cache = yaml_loader.YamlCache()
+    for _ in range(2):
+        loaded = yaml_loader.load_yaml(config_path, secrets, cache)
+        assert loaded == expected
+        assert loaded["homeassistant"]["packages"]["light_one"]["name"] == "Kitchen"
+        automation = loaded["automation"]
+        assert automation[0]["alias"] == yaml.Input("alias")
+        assert automation[0]["trigger"] == "state"
+        assert automation.__config_file__ == config_path
+        assert automation.__line__ == expected["automation"].__line__
+        light_two = loaded["homeassistant"]["packages"]["light_two"]
+        assert light_two.__config_file__ == str(tmp_path / "packages" / "two.yaml")
+        assert light_two.__line__ == 1
+
+    assert set(cache.as_dict()) == {
+        config_path,
+        str(tmp_path / "automations.yaml"),
+        str(tmp_path / "packages" / "one.yaml"),
+        str(tmp_path / "packages" / "two.yaml"),
+    }
+
+
+def test_cache_only_parses_changed_files(tmp_path: pathlib.Path) -> None:
+    """Test unchanged files are not parsed again."""
+    config_path = _write_cached_config(tmp_path)
+    secrets = yaml.Secrets(tmp_path)
+    cache = yaml_loader.YamlCache()
+    yaml_loader.load_yaml(config_path, secrets, cache)
+    assert cache.dirty
+
+    # Round trip the cache through JSON like it is stored
+    cache = yaml_loader.YamlCache(json.loads(json.dumps(cache.as_dict())))
+    with patch.object(
+        yaml_loader, "_parse_yaml_fastest", wraps=yaml_loader._parse_yaml_fastest
+    ) as mock_parse:
+        loaded = yaml_loader.load_yaml(config_path, yaml.Secrets(tmp_path), cache)
+    # Only the secrets are parsed
+    assert [call.args[0].name for call in mock_parse.call_args_list] == [
+        str(tmp_path / "secrets.yaml")
+    ]
+    assert not cache.dirty
+    assert loaded["homeassistant"]["packages"]["light_two"]["values"] == [
+        1,
+        2.5,
+        float("inf"),
+        True,
+        None,
+    ]
+
+    # Secrets are resolved on every load
+    (tmp_path / "secrets.yaml").write_text("light_name: Hallway\n")
+    package_one = tmp_path / "packages" / "one.yaml"
+    package_one.write_text("light_one:\n  name: !secret light_name\n  extra: 1\n")
+    with patch.object(
+        yaml_loader, "_parse_yaml_fastest", wraps=yaml_loader._parse_yaml_fastest
+    ) as mock_parse:
+        loaded = yaml_loader.load_yaml(config_path, yaml.Secrets(tmp_path), cache)
+    assert [call.args[0].name for call in mock_parse.call_args_list] == [
+        str(package_one),
+        str(tmp_path / "secrets.yaml"),
+    ]
+    assert cache.dirty
+    assert loaded["homeassistant"]["packages"]["light_one"] == {
+        "name": "Hallway",
+        "extra": 1,
+    }
+
+
+def test_cache_errors(tmp_path: pathlib.Path) -> None:
+    """Test errors of deferred tags are raised when loading from the cache."""
+    config_path = tmp_path / "configuration.yaml"
+    config_path.write_text("sensor: !include missing.yaml\n")
+    cache = yaml_loader.YamlCache()
+    with pytest.raises(HomeAssistantError, match="Unable to read file"):
+        yaml_loader.load_yaml(str(config_path), None, cache)
+
+    config_path.write_text("password: !secret password\n")
+    with pytest.raises(HomeAssistantError, match="Secrets not supported"):
+        yaml_loader.load_yaml(str(config_path), None, cache)